@@ -1 +1,7 @@
-from .core import UVToolClass
\ No newline at end of file
+# UVToolClass is resolved on first access so importing uv_tool stays cheap
+
+def __getattr__(name):
+	if name == "UVToolClass":
+		from .core import UVToolClass
+		return UVToolClass
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
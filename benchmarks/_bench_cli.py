@@ -0,0 +1,16 @@
+# benchmarks/_bench_cli.py
+
+''' Command-line handling shared by the benchmarks. '''
+
+import sys
+
+STUB_NOTICE = "NOTE: hou is the stand-in module from stubs/, timings say nothing about Houdini; run under hython for real numbers"
+
+
+def parse_args(parser, argv=None):
+	''' Parse the command line before any setup, then warn when hou is the stand-in module. '''
+	args = parser.parse_args(argv)
+	import hou
+	if getattr(hou, "IS_STUB", False):
+		print(STUB_NOTICE, file=sys.stderr)
+	return args
@@ -0,0 +1,110 @@
+# benchmarks/_synthetic_meshes.py
+
+''' Writers for synthetic OBJ meshes used by the benchmarks. '''
+
+import math
+
+
+def _write_grid(f, vertexOffset, columns, rows, position):
+	''' Write a columns x rows quad grid; position(u, v) maps [0, 1]^2 to a point. '''
+	for row in range(rows + 1):
+		for column in range(columns + 1):
+			x, y, z = position(column / columns, row / rows)
+			f.write(f"v {x:.6f} {y:.6f} {z:.6f}\n")
+
+	stride = columns + 1
+	for row in range(rows):
+		for column in range(columns):
+			a = vertexOffset + row * stride + column + 1  # OBJ indices are 1 based
+			f.write(f"f {a} {a + 1} {a + stride + 1} {a + stride}\n")
+	return (columns + 1) * (rows + 1), columns * rows
+
+
+def write_sphere(f, vertexOffset, segments, rings, radius=1.0, center=(0.0, 0.0, 0.0)):
+	''' Write a UV sphere as a quad grid (poles are degenerate, which clean removes). '''
+	cx, cy, cz = center
+
+	def position(u, v):
+		theta = u * 2.0 * math.pi
+		phi = v * math.pi
+		return (
+			cx + radius * math.sin(phi) * math.cos(theta),
+			cy + radius * math.cos(phi),
+			cz + radius * math.sin(phi) * math.sin(theta),
+		)
+
+	return _write_grid(f, vertexOffset, segments, rings, position)
+
+
+def write_panel(f, vertexOffset, columns, rows, width=1.0, height=1.0, center=(0.0, 0.0, 0.0)):
+	''' Write a flat panel in the XY plane. '''
+	cx, cy, cz = center
+
+	def position(u, v):
+		return (cx + (u - 0.5) * width, cy + (v - 0.5) * height, cz)
+
+	return _write_grid(f, vertexOffset, columns, rows, position)
+
+
+def grid_size(faces):
+	''' Columns and rows of a roughly square grid with about the given face count. '''
+	columns = max(2, int(math.sqrt(faces * 2)))
+	rows = max(2, faces // columns)
+	return columns, rows
+
+
+def write_sphere_obj(path, faces, radius=1.0):
+	''' Write a single sphere with about the given face count and return its stats. '''
+	segments, rows = grid_size(faces)
+	with open(path, "w") as f:
+		f.write("o sphere\n")
+		_, written = write_sphere(f, 0, segments, rows, radius)
+	return {"faces": written, "bboxSize": (2 * radius,) * 3, "surfaceArea": 4.0 * math.pi * radius * radius}
+
+
+def write_panel_obj(path, faces, width=4.0, height=4.0):
+	''' Write a single flat panel with about the given face count and return its stats. '''
+	columns, rows = grid_size(faces)
+	with open(path, "w") as f:
+		f.write("o panel\n")
+		_, written = write_panel(f, 0, columns, rows, width, height)
+	return {"faces": written, "bboxSize": (width, height, 0.0), "surfaceArea": width * height}
+
+
+def write_box(f, vertexOffset, center, size):
+	''' Write an axis aligned box of six quads. '''
+	cx, cy, cz = center
+	half = size / 2.0
+	for x in (-half, half):
+		for y in (-half, half):
+			for z in (-half, half):
+				f.write(f"v {cx + x:.6f} {cy + y:.6f} {cz + z:.6f}\n")
+	corners = ((0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1), (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3))
+	for face in corners:
+		f.write("f " + " ".join(str(vertexOffset + index + 1) for index in face) + "\n")
+	return 8, 6
+
+
+def write_asset_obj(path, faces, pieces=1, collision=False, radius=0.5):
+	''' Write an asset of pieces spheres totalling about faces render faces.
+
+	With collision each piece also gets a UCX_ box, the convex collision
+	naming the remesh network strips out. Returns the stats of the render
+	geometry only.
+	'''
+	segments, rows = grid_size(max(1, faces // pieces))
+	vertexOffset = 0
+	written = 0
+	with open(path, "w") as f:
+		for index in range(pieces):
+			center = (index * radius * 3.0, 0.0, 0.0)
+			f.write(f"o piece_{index}\n")
+			points, pieceFaces = write_sphere(f, vertexOffset, segments, rows, radius, center)
+			vertexOffset += points
+			written += pieceFaces
+			if collision:
+				f.write(f"o UCX_piece_{index}\n")
+				points, _ = write_box(f, vertexOffset, center, radius * 2.0)
+				vertexOffset += points
+	width = (pieces - 1) * radius * 3.0 + 2 * radius
+	return {"faces": written, "bboxSize": (width, 2 * radius, 2 * radius), "surfaceArea": pieces * 4.0 * math.pi * radius * radius}
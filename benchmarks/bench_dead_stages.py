@@ -0,0 +1,74 @@
+# benchmarks/bench_dead_stages.py
+
+''' Cook time of the UV network with and without dead-stage elimination.
+
+Each mesh is cooked twice from scratch, once with every node live and once
+with the nodes nothing reads from bypassed, and the UV stage times are
+compared with the estimate the controller reports. Timings only mean
+something under hython:
+	hython -m uv_tool.benchmarks.bench_dead_stages
+'''
+
+import os
+import json
+import logging
+import tempfile
+
+import hou
+
+from uv_tool.core import UVToolClass
+from uv_tool.benchmarks._synthetic_meshes import write_sphere_obj
+from uv_tool.benchmarks._bench_cli import parse_args
+from uv_tool.utils._logger import logger
+
+MESHES = (
+	("prop", 5000),
+	("hero", 50000),
+	("scan", 500000),
+)
+
+
+def time_uv_stage(path, exportPath, topNode, eliminateDeadStages):
+	''' Build and cook the pipeline for one mesh; return its UV stage time and the dead-stage report. '''
+	tool = UVToolClass(path, exportPath, topNode=topNode, useCache=False, measureUVs=False, eliminateDeadStages=eliminateDeadStages)
+	try:
+		return tool.stageTimes["uv"], tool.deadStageReport
+	finally:
+		tool.destroyNetwork()
+
+
+def main(argv=None):
+	import argparse
+
+	parse_args(argparse.ArgumentParser(description="Cook time of the UV network with and without dead-stage elimination"), argv)
+	logger.setLevel(logging.WARNING)
+	topNode = hou.node("/obj").createNode("subnet", "uv_dead_stage_bench")
+	results = []
+
+	try:
+		with tempfile.TemporaryDirectory() as folder:
+			exportPath = os.path.join(folder, "export")
+			for meshName, faces in MESHES:
+				path = os.path.join(folder, f"{meshName}.obj")
+				write_sphere_obj(path, faces)
+				everything, _ = time_uv_stage(path, exportPath, topNode, False)
+				eliminated, report = time_uv_stage(path, exportPath, topNode, True)
+				row = {
+					"mesh": meshName,
+					"faces": faces,
+					"bypassed": ",".join(report["bypassed"]),
+					"allStages": everything,
+					"eliminated": eliminated,
+					"saved": everything - eliminated,
+					"estimated": report["estimatedSavedSeconds"],
+				}
+				results.append(row)
+				print(" ".join(f"{key}={value:.4g}" if isinstance(value, float) else f"{key}={value}" for key, value in row.items()))
+	finally:
+		topNode.destroy()
+
+	return results
+
+
+if __name__ == "__main__":
+	print(json.dumps(main()))
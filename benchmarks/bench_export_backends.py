@@ -0,0 +1,74 @@
+# benchmarks/bench_export_backends.py
+
+''' Write time and file size of each export backend, and of all of them at once.
+
+The pipeline is cooked once per mesh; every backend then writes the same
+MESH_OUT geometry. Sizes only mean something under hython:
+	hython -m uv_tool.benchmarks.bench_export_backends
+'''
+
+import os
+import json
+import time
+import logging
+import tempfile
+
+import hou
+
+from uv_tool.core import UVToolClass
+from uv_tool.core.caching import EXPORT_BACKENDS, write_exports
+from uv_tool.benchmarks._synthetic_meshes import write_sphere_obj
+from uv_tool.benchmarks._bench_cli import parse_args
+from uv_tool.utils._logger import logger
+
+MESHES = (
+	("prop", 5000),
+	("hero", 50000),
+	("scan", 500000),
+)
+
+
+def main(argv=None):
+	import argparse
+
+	parse_args(argparse.ArgumentParser(description="Write time and file size of each export backend"), argv)
+	logger.setLevel(logging.WARNING)
+	topNode = hou.node("/obj").createNode("subnet", "uv_export_bench")
+	results = []
+
+	try:
+		with tempfile.TemporaryDirectory() as folder:
+			for meshName, faces in MESHES:
+				path = os.path.join(folder, f"{meshName}.obj")
+				write_sphere_obj(path, faces)
+				tool = UVToolClass(path, os.path.join(folder, "warm"), topNode=topNode, useCache=False)
+				triangleNode = tool.uvGeoNode.node("metricsPoints")  # As the controller passes it
+				try:
+					rows = []
+					for backend in sorted(EXPORT_BACKENDS):
+						exportPath = os.path.join(folder, backend)
+						written = write_exports(tool.exportNode, tool.uvNull, exportPath, meshName, (backend,), triangleNode)[backend]
+						rows.append({"mesh": meshName, "backend": backend, "seconds": written["seconds"], "bytes": written["bytes"]})
+
+					start_time = time.perf_counter()
+					write_exports(tool.exportNode, tool.uvNull, os.path.join(folder, "all"), meshName, sorted(EXPORT_BACKENDS), triangleNode)
+					rows.append({
+						"mesh": meshName,
+						"backend": "all (concurrent)",
+						"seconds": time.perf_counter() - start_time,
+						"serialSeconds": sum(row["seconds"] for row in rows),
+					})
+				finally:
+					tool.destroyNetwork()
+
+				for row in rows:
+					print(" ".join(f"{key}={value:.4g}" if isinstance(value, float) else f"{key}={value}" for key, value in row.items()))
+				results.extend(rows)
+	finally:
+		topNode.destroy()
+
+	return results
+
+
+if __name__ == "__main__":
+	print(json.dumps(main()))
@@ -0,0 +1,85 @@
+# benchmarks/bench_piece_unwrap.py
+
+''' Serial versus per-piece parallel UV unwrapping on multi-piece assets.
+
+Each asset is a row of separate spheres. The serial run cooks the UV
+network as built; the parallel run splits it by connectivity and unwraps
+the pieces on worker processes before the single uvLayout. Timings only
+mean something under hython; with the stand-in module the run checks the
+wiring:
+	hython -m uv_tool.benchmarks.bench_piece_unwrap [workers]
+'''
+
+import os
+import json
+import time
+import logging
+import tempfile
+
+import hou
+
+from uv_tool.core import UVToolClass
+from uv_tool.core.parallel import shutdown_piece_pool
+from uv_tool.benchmarks._synthetic_meshes import write_asset_obj
+from uv_tool.benchmarks._bench_cli import parse_args
+from uv_tool.utils._logger import logger
+
+ASSETS = (
+	("kit_8", 8, 2000),
+	("kit_32", 32, 2000),
+	("debris_128", 128, 500),
+)
+
+
+def time_uv_stage(path, exportPath, topNode, parallelUnwrap=None, pieceWorkers=None):
+	''' Build the pipeline for one asset and return its UV stage time. '''
+	tool = UVToolClass(path, exportPath, topNode=topNode, useCache=False, parallelUnwrap=parallelUnwrap, pieceWorkers=pieceWorkers)
+	try:
+		return tool.stageTimes["uv"], len(tool.pieceTimes)
+	finally:
+		tool.destroyNetwork()
+
+
+def main(argv=None):
+	import argparse
+
+	parser = argparse.ArgumentParser(description="Serial versus per-piece parallel UV unwrapping")
+	parser.add_argument("workers", nargs="?", type=int, default=None, help="Unwrap worker processes, default one per CPU")
+	args = parse_args(parser, argv)
+
+	logger.setLevel(logging.WARNING)
+	workers = args.workers or os.cpu_count()
+	topNode = hou.node("/obj").createNode("subnet", "uv_piece_bench")
+	results = []
+
+	try:
+		with tempfile.TemporaryDirectory() as folder:
+			exportPath = os.path.join(folder, "export")
+			for assetName, pieces, facesPerPiece in ASSETS:
+				path = os.path.join(folder, f"{assetName}.obj")
+				info = write_asset_obj(path, pieces * facesPerPiece, pieces)
+				serial, _ = time_uv_stage(path, exportPath, topNode)
+				time_uv_stage(path, exportPath, topNode, "connectivity", workers)  # Warm the worker pool
+				start_time = time.perf_counter()
+				parallel, pieceCount = time_uv_stage(path, exportPath, topNode, "connectivity", workers)
+				row = {
+					"asset": assetName,
+					"faces": info["faces"],
+					"pieces": pieceCount,
+					"workers": workers,
+					"serial": serial,
+					"parallel": parallel,
+					"speedup": serial / parallel if parallel else None,
+					"wall": time.perf_counter() - start_time,
+				}
+				results.append(row)
+				print(" ".join(f"{key}={value:.4g}" if isinstance(value, float) else f"{key}={value}" for key, value in row.items()))
+	finally:
+		shutdown_piece_pool()
+		topNode.destroy()
+
+	return results
+
+
+if __name__ == "__main__":
+	print(json.dumps(main()))
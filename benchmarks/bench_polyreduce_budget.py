@@ -0,0 +1,105 @@
+# benchmarks/bench_polyreduce_budget.py
+
+''' Cook time and quality of each polyreduce budget policy on synthetic meshes.
+
+Without Houdini (stubs/ on PYTHONPATH) only the chosen budgets are reported.
+Under hython each budget is also cooked through clean -> polyreduce ->
+uvflatten, recording the reduce and flatten times plus how much surface area
+and bounding box the reduced mesh keeps.
+	hython -m uv_tool.benchmarks.bench_polyreduce_budget
+'''
+
+import os
+import json
+import time
+import logging
+import tempfile
+
+import hou
+
+from uv_tool.core.nodes import BUDGET_POLICIES, InputStats, get_budget_policy
+from uv_tool.benchmarks._synthetic_meshes import write_sphere_obj, write_panel_obj
+from uv_tool.benchmarks._bench_cli import parse_args
+from uv_tool.utils._logger import logger
+
+MESHES = (
+	("crate", write_sphere_obj, 500),
+	("prop", write_sphere_obj, 5000),
+	("hero", write_sphere_obj, 50000),
+	("scan", write_sphere_obj, 500000),
+	("panel", write_panel_obj, 20000),
+)
+
+
+def _surface_area(geometry):
+	return sum(prim.intrinsicValue("measuredarea") for prim in geometry.prims())
+
+
+def cook_budget(path, count):
+	''' Cook one budget in Houdini and return timings and quality ratios. '''
+	geoNode = hou.node("/obj").createNode("geo", "uv_budget_bench")
+	try:
+		fileNode = geoNode.createNode("file")
+		fileNode.parm("file").set(path)
+		cleanNode = geoNode.createNode("clean")
+		cleanNode.setInput(0, fileNode)
+		polyReduce = geoNode.createNode("polyreduce")
+		polyReduce.setInput(0, cleanNode)
+		polyReduce.parm("target").set(2)
+		polyReduce.parm("finalcount").set(count)
+		uvFlatten = geoNode.createNode("uvflatten")
+		uvFlatten.setInput(0, polyReduce)
+
+		cleanNode.cook(force=True)
+		start_time = time.perf_counter()
+		polyReduce.cook(force=True)
+		reduceTime = time.perf_counter() - start_time
+		start_time = time.perf_counter()
+		uvFlatten.cook(force=True)
+		flattenTime = time.perf_counter() - start_time
+
+		before = cleanNode.geometry()
+		after = polyReduce.geometry()
+		sizeBefore = before.boundingBox().sizevec()
+		sizeAfter = after.boundingBox().sizevec()
+		return {
+			"reduceTime": reduceTime,
+			"flattenTime": flattenTime,
+			"outputPolygons": after.intrinsicValue("primitivecount"),
+			"areaKept": _surface_area(after) / (_surface_area(before) or 1.0),
+			"bboxKept": sum(sizeAfter) / (sum(sizeBefore) or 1.0),
+		}
+	finally:
+		geoNode.destroy()
+
+
+def main(argv=None):
+	import argparse
+
+	parser = argparse.ArgumentParser(description="Cook time and quality of each polyreduce budget policy")
+	parser.add_argument("policies", nargs="*", choices=sorted(BUDGET_POLICIES), help="Policies to compare, default all")
+	args = parse_args(parser, argv)
+
+	logger.setLevel(logging.WARNING)
+	policies = args.policies or sorted(BUDGET_POLICIES)
+	cook = not getattr(hou, "IS_STUB", False)
+	results = []
+
+	with tempfile.TemporaryDirectory() as folder:
+		for meshName, writer, faces in MESHES:
+			path = os.path.join(folder, f"{meshName}.obj")
+			info = writer(path, faces)
+			stats = InputStats(info["faces"], bboxSize=info["bboxSize"], surfaceArea=info["surfaceArea"])
+			for policyName in policies:
+				count = get_budget_policy(policyName).budget(stats)
+				row = {"mesh": meshName, "inputPolygons": stats.polygons, "policy": policyName, "budget": count}
+				if cook:
+					row.update(cook_budget(path, count))
+				results.append(row)
+				print(" ".join(f"{key}={value:.4g}" if isinstance(value, float) else f"{key}={value}" for key, value in row.items()))
+
+	return results
+
+
+if __name__ == "__main__":
+	print(json.dumps(main()))
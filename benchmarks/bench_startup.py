@@ -0,0 +1,65 @@
+# benchmarks/bench_startup.py
+
+''' Cold start cost of importing uv_tool.core and of calling main().
+
+Each sample runs in a fresh interpreter so nothing is already imported. Run
+with hython to include hou, or anywhere with the stand-in module on the path:
+	PYTHONPATH=uv_tool/stubs python -m uv_tool.benchmarks.bench_startup
+'''
+
+import os
+import sys
+import json
+import subprocess
+
+# Each snippet prints the seconds spent on the statement being measured
+SNIPPETS = {
+	"import uv_tool.core": "import uv_tool.core",
+	"import uv_tool.core.UVToolClass": "from uv_tool.core import UVToolClass",
+	"import uv_tool.main": "import uv_tool.main",
+	"main()": "import uv_tool.main as m; m.main()",
+}
+
+TIMER = """
+import time
+start_time = time.perf_counter()
+{statement}
+print(time.perf_counter() - start_time)
+"""
+
+
+def time_snippet(statement, repeat, executable):
+	''' Return the best of repeat fresh-process timings, or None if it fails. '''
+	env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+	env["UV_TOOL_LOG_FILE"] = "0"  # Measure imports, not log file creation
+	samples = []
+	for _ in range(repeat):
+		process = subprocess.run(
+			[executable, "-c", TIMER.format(statement=statement)],
+			capture_output=True, text=True, env=env
+		)
+		if process.returncode != 0:
+			return None
+		samples.append(float(process.stdout.strip().splitlines()[-1]))
+	return min(samples)
+
+
+def main(argv=None):
+	import argparse
+
+	parser = argparse.ArgumentParser(description="Cold start cost of importing uv_tool.core and of calling main()")
+	parser.add_argument("repeat", nargs="?", type=int, default=5, help="Fresh processes per snippet, the best is kept")
+	parser.add_argument("--executable", default=None, help="Interpreter to time, e.g. hython; default this one")
+	args = parser.parse_args(argv)  # The snippets run in other processes, hou is never imported here
+
+	executable = args.executable or sys.executable
+	results = {}
+	for name, statement in SNIPPETS.items():
+		seconds = time_snippet(statement, args.repeat, executable)
+		results[name] = seconds
+		print(f"{name:34} {'unavailable' if seconds is None else f'{seconds * 1000:8.2f} ms'}")
+	return results
+
+
+if __name__ == "__main__":
+	print(json.dumps(main()))
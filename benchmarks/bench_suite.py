@@ -0,0 +1,195 @@
+# benchmarks/bench_suite.py
+
+''' Regression benchmark of the pipeline build and cook on graded synthetic assets.
+
+Every case is an OBJ of 1k to 1M faces, one or several pieces, with or
+without UCX_ collision parts. For each case the suite times the pre-flight
+scan, create_remesh_layout, create_uv_layout, UVToolClass.setupNodes and
+cacheAndExport (best of --repeat). With the stand-in module it also records
+how many nodes, parm sets and cooks each phase issued.
+
+Results are written as JSON. Given a --baseline from an earlier run, any
+timing slower by more than --threshold (and by more than --min-seconds), or
+any call count that grew, is reported and the exit code is 1:
+	PYTHONPATH=uv_tool/stubs python -m uv_tool.benchmarks.bench_suite -o base.json
+	PYTHONPATH=uv_tool/stubs python -m uv_tool.benchmarks.bench_suite --baseline base.json
+'''
+
+import os
+import sys
+import json
+import time
+import logging
+import platform
+import tempfile
+
+import hou
+
+from uv_tool.core import UVToolClass
+from uv_tool.core.nodes import create_remesh_layout, create_uv_layout
+from uv_tool.core.preflight import scan_asset
+from uv_tool.benchmarks._synthetic_meshes import write_asset_obj
+from uv_tool.benchmarks._bench_cli import parse_args
+from uv_tool.utils._logger import logger
+
+SIZES = (1000, 10000, 100000, 1000000)
+LAYOUTS = (
+	("single", 1, False),
+	("single_ucx", 1, True),
+	("multi", 16, False),
+	("multi_ucx", 16, True),
+)
+DEFAULT_THRESHOLD = 0.25  # Allowed slowdown as a fraction of the baseline
+DEFAULT_MIN_SECONDS = 0.005  # Slowdowns smaller than this are noise
+
+
+def _counts():
+	return hou.callCounts() if hasattr(hou, "callCounts") else None
+
+
+def measure(function, repeat):
+	''' Return the best time of repeat calls and the call counts of the last one. '''
+	best = None
+	counts = None
+	for _ in range(repeat):
+		if hasattr(hou, "resetCallCounts"):
+			hou.resetCallCounts()
+		start_time = time.perf_counter()
+		function()
+		seconds = time.perf_counter() - start_time
+		counts = _counts()
+		best = seconds if best is None else min(best, seconds)
+	return best, counts
+
+
+def bench_case(path, assetName, exportPath, topNode, repeat):
+	''' Time every phase of the pipeline on one asset. '''
+	timings = {}
+	calls = {}
+
+	def record(phase, function):
+		timings[phase], counts = measure(function, repeat)
+		if counts is not None:
+			calls[phase] = counts
+
+	record("preflight", lambda: scan_asset(path))
+	scan = scan_asset(path)
+
+	def remeshLayout():
+		geoNode = topNode.createNode("geo")
+		try:
+			create_remesh_layout(geoNode, path, assetName, True, None, scan)
+		finally:
+			geoNode.destroy()
+	record("create_remesh_layout", remeshLayout)
+
+	tool = UVToolClass(path, exportPath, remeshCheck=True, topNode=topNode, useCache=False)
+	try:
+		def uvLayout():
+			geoNode = topNode.createNode("geo")
+			try:
+				create_uv_layout(geoNode, tool.geoNull.path(), assetName, exportPath)
+			finally:
+				geoNode.destroy()
+		record("create_uv_layout", uvLayout)
+
+		def setup():
+			tool.destroyNetwork()  # Rebuild both networks from scratch on the same tool
+			tool.remeshGeoNode = topNode.createNode("geo")
+			tool.uvGeoNode = topNode.createNode("geo")
+			tool.setupNodes()
+		record("setupNodes", setup)
+		record("cacheAndExport", tool.cacheAndExport)
+	finally:
+		tool.destroyNetwork()
+
+	return timings, calls
+
+
+def run_suite(folder, maxFaces=None, repeat=3):
+	''' Run every case up to maxFaces and return the results document. '''
+	topNode = hou.node("/obj").createNode("subnet", "uv_bench_suite")
+	cases = []
+	try:
+		for faces in SIZES:
+			if maxFaces and faces > maxFaces:
+				continue
+			for layoutName, pieces, collision in LAYOUTS:
+				name = f"{layoutName}_{faces}"
+				path = os.path.join(folder, f"{name}.obj")
+				info = write_asset_obj(path, faces, pieces, collision)
+				timings, calls = bench_case(path, name, os.path.join(folder, "export"), topNode, repeat)
+				os.remove(path)  # The 1M face cases are large
+				cases.append({"case": name, "faces": info["faces"], "pieces": pieces, "collision": collision, "timings": timings, "calls": calls})
+				print(name + " " + " ".join(f"{phase}={seconds:.4g}" for phase, seconds in timings.items()), file=sys.stderr)
+	finally:
+		topNode.destroy()
+
+	return {
+		"environment": {
+			"houdini": hou.applicationVersionString(),
+			"python": platform.python_version(),
+			"platform": platform.platform(),
+		},
+		"repeat": repeat,
+		"cases": cases,
+	}
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD, minSeconds=DEFAULT_MIN_SECONDS):
+	''' Return a message for every timing or call count that regressed against the baseline. '''
+	regressions = []
+	if baseline.get("environment", {}).get("houdini") != results["environment"]["houdini"]:
+		logger.warning("Baseline was recorded with Houdini %s, comparing anyway", baseline.get("environment", {}).get("houdini"))
+
+	previous = {case["case"]: case for case in baseline.get("cases", [])}
+	for case in results["cases"]:
+		before = previous.get(case["case"])
+		if before is None:
+			continue
+		for phase, seconds in case["timings"].items():
+			old = before["timings"].get(phase)
+			if old is not None and seconds > old * (1.0 + threshold) and seconds - old > minSeconds:
+				regressions.append(f"{case['case']} {phase}: {seconds:.4f}s vs {old:.4f}s (+{(seconds / old - 1.0) * 100:.0f}%)")
+		for phase, counts in case["calls"].items():
+			for operation, count in counts.items():
+				old = before.get("calls", {}).get(phase, {}).get(operation)
+				if old is not None and count > old:
+					regressions.append(f"{case['case']} {phase}: {count} {operation} calls vs {old}")
+	return regressions
+
+
+def main(argv=None):
+	import argparse
+
+	parser = argparse.ArgumentParser(description="Pipeline regression benchmark")
+	parser.add_argument("-o", "--output", default=None, help="Write the JSON results to this path instead of stdout")
+	parser.add_argument("--baseline", default=None, help="Earlier results to compare against")
+	parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed slowdown as a fraction, e.g. 0.25")
+	parser.add_argument("--min-seconds", type=float, default=DEFAULT_MIN_SECONDS, help="Ignore slowdowns smaller than this")
+	parser.add_argument("--max-faces", type=int, default=None, help="Skip cases larger than this")
+	parser.add_argument("--repeat", type=int, default=3, help="Runs per phase, the best is kept")
+	args = parse_args(parser, argv)  # Call counts are still compared under the stand-in module
+
+	logger.setLevel(logging.WARNING)
+	with tempfile.TemporaryDirectory() as folder:
+		results = run_suite(folder, args.max_faces, args.repeat)
+
+	regressions = []
+	if args.baseline:
+		with open(args.baseline, "r") as f:
+			regressions = compare(results, json.load(f), args.threshold, args.min_seconds)
+		results["regressions"] = regressions
+		for message in regressions:
+			print(f"REGRESSION {message}", file=sys.stderr)
+
+	if args.output:
+		with open(args.output, "w") as f:
+			json.dump(results, f, indent=2)
+	else:
+		print(json.dumps(results))
+	return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
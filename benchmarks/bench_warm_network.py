@@ -0,0 +1,77 @@
+# benchmarks/bench_warm_network.py
+
+''' Per-asset overhead of rebuilding the network versus reusing a warm one.
+
+Run inside hython, or anywhere with the stand-in module on the path:
+	PYTHONPATH=uv_tool/stubs python -m uv_tool.benchmarks.bench_warm_network
+'''
+
+import os
+import time
+import logging
+import tempfile
+
+import hou
+
+from uv_tool.core import UVToolClass
+from uv_tool.utils._logger import logger
+from uv_tool.benchmarks._bench_cli import parse_args
+
+TRIANGLE_OBJ = "v 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 3\n"
+
+
+def write_assets(folder, count):
+	''' Write count tiny OBJ files so the import cost stays negligible. '''
+	paths = []
+	for index in range(count):
+		path = os.path.join(folder, f"asset_{index:04d}.obj")
+		with open(path, "w") as f:
+			f.write(TRIANGLE_OBJ)
+		paths.append(path)
+	return paths
+
+
+def bench_rebuild(paths, exportPath, topNode):
+	''' Build and tear down a full network for every asset. '''
+	start_time = time.perf_counter()
+	for path in paths:
+		tool = UVToolClass(path, exportPath, topNode=topNode, useCache=False)
+		tool.clearNodes()
+	return (time.perf_counter() - start_time) / len(paths)
+
+
+def bench_warm(paths, exportPath, topNode):
+	''' Build one network and swap every following asset into it. '''
+	start_time = time.perf_counter()
+	tool = UVToolClass(paths[0], exportPath, topNode=topNode, useCache=False)
+	for path in paths[1:]:
+		tool.loadAsset(path)
+	tool.clearNodes()
+	return (time.perf_counter() - start_time) / len(paths)
+
+
+def main(argv=None):
+	import argparse
+
+	parser = argparse.ArgumentParser(description="Per-asset overhead of rebuilding the network versus reusing a warm one")
+	parser.add_argument("count", nargs="?", type=int, default=200, help="Number of assets")
+	count = parse_args(parser, argv).count
+
+	logger.setLevel(logging.WARNING)  # Keep logging out of the measurement
+	topNode = hou.node("/obj").createNode("subnet", "uv_bench")
+
+	with tempfile.TemporaryDirectory() as folder:
+		paths = write_assets(folder, count)
+		rebuild = bench_rebuild(paths, folder, topNode)
+		warm = bench_warm(paths, folder, topNode)
+
+	topNode.destroy()
+	print(f"assets:            {count}")
+	print(f"rebuild per asset: {rebuild * 1000:.3f} ms")
+	print(f"warm per asset:    {warm * 1000:.3f} ms")
+	print(f"speedup:           {rebuild / warm:.1f}x" if warm else "speedup: n/a")
+	return rebuild, warm
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,47 @@
+# cli.py
+
+''' Command-line entry point that never imports Qt, for scripts and the farm:
+	hython uv_tool/cli.py manifest.json -r results.json [-o exportDir]
+'''
+
+import os
+import sys
+import json
+
+TOOL_DIR = os.path.dirname(os.path.abspath(__file__))
+if os.path.dirname(TOOL_DIR) not in sys.path:
+	sys.path.append(os.path.dirname(TOOL_DIR))  # So uv_tool is importable when run as a script
+
+
+def main(argv=None):
+	import argparse
+	from uv_tool.core.batch import load_manifest, run_manifest
+
+	parser = argparse.ArgumentParser(description="Remesh, UV and export the assets of a JSON or YAML manifest")
+	parser.add_argument("manifest", help="Manifest of assets and per-asset options")
+	parser.add_argument("-r", "--results", default=None, help="Write the JSON results to this path instead of stdout")
+	parser.add_argument("-o", "--output", default=None, help="Export folder for assets that name none")
+	parser.add_argument("--fresh-network", action="store_true", help="Build a new network for every asset instead of reusing one")
+	parser.add_argument("--metrics-file", default=None, help="Write OpenMetrics text of the run to this path")
+	args = parser.parse_args(argv)
+
+	try:
+		assets = load_manifest(args.manifest, args.output)
+	except (OSError, ValueError) as e:
+		parser.error(str(e))
+
+	report = run_manifest(assets, not args.fresh_network)
+	if args.metrics_file:
+		from uv_tool.utils import metrics
+		metrics.write_textfile(args.metrics_file)
+	report["manifest"] = os.path.abspath(args.manifest)
+	if args.results:
+		with open(args.results, "w") as f:
+			json.dump(report, f, indent=2, default=str)
+	else:
+		print(json.dumps(report, indent=2, default=str))
+	return 0 if not report["failed"] else 1
+
+
+if __name__ == "__main__":
+	sys.exit(main())
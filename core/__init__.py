@@ -1 +1,16 @@
-from ._controller import UVToolClass
\ No newline at end of file
+import importlib
+
+# The controller pulls in hou and every node module, so load it on first access
+_LAZY_ATTRIBUTES = {
+	"UVToolClass": "._controller",
+	"PipelineCancelled": "._controller",
+	"PIPELINE_STAGES": "._controller",
+	"PipelineOptions": "._options",
+	"PreviewNetwork": "._preview",
+}
+
+def __getattr__(name):
+	if name in _LAZY_ATTRIBUTES:
+		module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+		return getattr(module, name)
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
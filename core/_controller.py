@@ -3,87 +3,622 @@
 import os
 import hou
 import time
+import functools
 
-from uv_tool.utils._logger import logger
-from uv_tool.core.nodes import create_remesh_layout, create_uv_layout
-from uv_tool.utils import open_export_folder, sanitize_name
+from uv_tool.utils._logger import logger, log_context
+from uv_tool.utils._metrics import STAGE_SECONDS, TOTAL_STAGE
+from uv_tool.core.nodes import create_remesh_layout, create_uv_layout, configure_remesh_layout, get_budget_policy
+from uv_tool.core.nodes import find_dead_stages, apply_dead_stages, EXPORT_ATTRIBUTES, METRICS_ATTRIBUTES, SHELL_ATTRIBUTES, FINGERPRINT_ATTRIBUTES
+from uv_tool.core.nodes._dead_stages import ANY
+from uv_tool.core.preflight import scan_asset
+from uv_tool.core.caching import ResultCache, compute_cache_key, hash_file, exportFilePath, write_exports
+from uv_tool.core.profiling import profile_nodes, write_profile_report
+from uv_tool.core.parallel import parallel_unwrap
+from uv_tool.core._stage_graph import StageGraph
+from uv_tool.core._options import PipelineOptions
+from uv_tool.utils import open_export_folder, sanitize_name, process_rss, flush_sop_cache, format_bytes
+
+PIPELINE_STAGES = ("setup", "remesh", "uv", "export")  # Progress is reported in this order
+
+class PipelineCancelled(Exception):
+	"""
+	Raised between stages when the caller asked for the run to stop.
+	"""
+
+def _assetStep(method):
+	"""
+	Tag every record a pipeline step logs with the asset, as each may run on its own.
+	"""
+	@functools.wraps(method)
+	def step(self, *args, **kwargs):
+		with log_context(asset=self.assetName):
+			return method(self, *args, **kwargs)
+	return step
 
 class UVToolClass:
-	def __init__(self, importPath, exportPath, remeshCheck=False, openFileCheck=False):
+	def __init__(self, importPath, exportPath, remeshCheck=False, openFileCheck=False, options=None, topNode=None, cache=None, stageCallback=None, cancelCheck=None, assetName=None, cook=True, **overrides):
 		"""
 		Initialize the UVToolClass with paths, flags, and setup nodes.
+		options is a PipelineOptions; single options may also be given as
+		keywords (e.g. useCache=False), which override those in options.
+		An optional topNode scopes the created nodes to a network other than /obj,
+		and cache is the ResultCache to use instead of the default one.
+		stageCallback(assetName, stage, index, total) is called as each stage
+		starts; when cancelCheck() returns True the run stops before the next
+		stage, the network is destroyed and PipelineCancelled is raised.
+		assetName names the outputs instead of the import file name.
+		With cook=False nothing is built or cooked, and no hou call is made,
+		until the functions of buildSteps() are called.
 		"""
 		self.importPath = importPath  # Path to the input file
 		self.exportPath = exportPath  # Path to the output file
 		self.remeshCheck = remeshCheck  # Flag to enable/disable remeshing
 		self.openFileCheck = openFileCheck  # Flag to open the export folder after processing
-		self.assetName = os.path.basename(self.importPath).split(".")[0]  # Extract asset name from the import path
+		self.assetName = assetName or os.path.basename(self.importPath).split(".")[0]  # Default to the import file name
+		self.cache = cache  # Content-addressed geometry cache, set up by setOptions
+		self.geoCacheHit = False  # Whether the remesh cache was loaded from disk
+		self.uvCacheHit = False  # Whether the UV cache was loaded from disk
+		self.profileReport = None  # Latest profile report, if profiling
+		self.profilePath = None  # Where the latest profile report was written
+		self.stageCallback = stageCallback  # Progress hook called as each stage starts
+		self.cancelCheck = cancelCheck  # Returns True when the run should stop
+		self.scan = None  # Pre-flight scan of the current input, if any
+		self.pieceTimes = []  # Seconds per piece of the last parallel unwrap
+		self.exportResults = {}  # Path, seconds and bytes per written format
+		self.apiCalls = {}  # Houdini API calls made to build each network
+		self.uvMetrics = None  # Latest UV quality metrics, if measured
+		self.memory = {}  # Process RSS in bytes around the latest run
+		self.dedupHit = False  # Whether the UVs were copied from an identical mesh
+		self.dedupInfo = None  # Fingerprint, hit and seconds of the latest lookup
+		self.showUVShells = False  # Whether the viewport shows the UV shell visualizer
+		self.shellCookTime = None  # Seconds the shell display took to cook, once it has
+		self.deadStages = {}  # Network name -> DeadStageAnalysis
+		self.deadStageReport = None  # Bypassed nodes and the estimated seconds saved
+		self.upToDate = set()  # Pipeline stages the next cook skips, as nothing they read changed
+		self.setOptions((options or PipelineOptions()).replace(**overrides))
 
-		# Create top-level Houdini nodes
-		self.topNode = hou.node("/obj")  # Root object node in Houdini
-		self.remeshGeoNode = self.topNode.createNode("geo")  # Node for remeshing
-		self.uvGeoNode = self.topNode.createNode("geo")  # Node for UV layout
+		self.topNode = topNode  # Root object node in Houdini, /obj unless given
+		self.remeshGeoNode = None  # Node for remeshing, created by the setup step
+		self.uvGeoNode = None  # Node for UV layout, created by the setup step
+		if cook:
+			for _, step in self.buildSteps():
+				step()
 
+	def buildSteps(self):
+		"""
+		Return the first run as (stage, function) pairs to call in order: build the
+		networks, cook the remesh and UV caches, then write the export. Each call is
+		one stage of Houdini work, so a UI can make each its own main-thread call and
+		handle events in between. A cancelled step destroys the network and raises
+		PipelineCancelled.
+		"""
+		def guarded(function):
+			def step():
+				try:
+					return function()
+				except PipelineCancelled:
+					self.destroyNetwork()  # Leave nothing half built behind
+					raise
+			return step
+		return [(stage, guarded(function)) for stage, function in [("setup", self.buildNetwork)] + self.cookSteps()]
+
+	@_assetStep
+	def buildNetwork(self):
+		"""
+		Create the remesh and UV geo nodes and set up their networks.
+		"""
+		self.startStage("setup")
+		self.topNode = self.topNode or hou.node("/obj")
+		self.remeshGeoNode = self.topNode.createNode("geo")
+		self.uvGeoNode = self.topNode.createNode("geo")
 		self.setupNodes()  # Set up the necessary nodes
-		self.cacheAndExport()  # Cache and export the processed data
+		self.upToDate = set()
+
+	def setOptions(self, options):
+		"""
+		Apply PipelineOptions, for the next asset when the network is reused.
+		"""
+		if not options.useCache:
+			self.cache = None
+		elif self.cache is None:
+			self.cache = ResultCache()
+		self.profile = options.profile  # Flag to record per-node cook statistics
+		self.profileDir = options.profileDir  # Folder for the per-asset profile reports
+		self.budgetPolicy = get_budget_policy(options.budgetPolicy) if options.budgetPolicy else None  # Adaptive polyreduce target
+		self.preflight = options.preflight  # Flag to scan OBJ inputs and bypass idle stages
+		self.parallelUnwrap = options.parallelUnwrap  # How to split pieces for parallel unwrapping, None for serial
+		self.pieceWorkers = options.pieceWorkers  # Worker processes for parallel unwrapping
+		self.exportFormats = options.exportFormats  # Export backends to write
+		self.pipelineSpecs = options.pipelineSpecs or {
+			"remesh": os.environ.get("UV_TOOL_REMESH_SPEC"),
+			"uv": os.environ.get("UV_TOOL_UV_SPEC"),
+		}  # Network specs, None for the built-in ones
+		self.measureUVs = options.measureUVs  # Flag to compute UV quality metrics
+		self.dedup = options.dedup  # Flag to reuse the UVs of identical geometry
+		self.eliminateDeadStages = options.eliminateDeadStages  # Flag to bypass nodes nothing reads from
+		self.precookShells = options.precookShells  # Flag to cook the shell display after every run
+
+	def scanInput(self):
+		"""
+		Pre-flight scan of the input, measuring bounds and area only when the budget policy needs them.
+		"""
+		if not self.preflight:
+			return None
+		return scan_asset(self.importPath, measureBounds=bool(self.budgetPolicy and self.budgetPolicy.needsArea))
 
 	def setupNodes(self):
 		"""
 		Set up the remesh and UV layout nodes.
 		"""
-		logger.info(f"Setting up nodes for: {self.assetName}")
+		logger.info("Setting up nodes for: %s", self.assetName)
+		self.scan = self.scanInput()
 
 		# Create remesh layout nodes
-		self.geoNull, self.geoFileCache = create_remesh_layout(
+		self.geoNull, self.geoFileCache, remeshBuild = create_remesh_layout(
 			self.remeshGeoNode,
 			self.importPath,
 			self.assetName,
-			self.remeshCheck
+			self.remeshCheck,
+			self.budgetPolicy,
+			self.scan,
+			self.pipelineSpecs.get("remesh")
 		)
-		logger.info(f"geoNull: {self.geoNull.path()}")  # Log the path of the remesh null node
+		logger.info("geoNull: %s", self.geoNull.path())  # Log the path of the remesh null node
 
 		# Create UV layout nodes
-		self.uvNull, self.uvFileCache, self.exportNode, self.uvVisualizer = create_uv_layout(
+		self.uvNull, self.uvFileCache, self.exportNode, self.uvVisualizer, uvBuild = create_uv_layout(
 			self.uvGeoNode,
 			self.geoNull.path(),
 			self.assetName,
-			self.exportPath
+			self.exportPath,
+			self.pipelineSpecs.get("uv")
 		)
+		self.shellIslands = uvBuild.nodes.get("shellIslands")  # Side branch showing the shells, None in older specs
+		self.apiCalls = {"remesh": remeshBuild.totalCalls, "uv": uvBuild.totalCalls}
+		self.builds = {"remesh": remeshBuild, "uv": uvBuild}
+		self.deadStages = {}  # Fresh nodes, nothing bypassed yet
+		self.bypassDeadStages()
+		self.stageGraph = StageGraph.from_tool(self)  # Tracks which stages a change dirties
+
+		if self.cache:
+			self.bindCaches()
+
+	def loadAsset(self, importPath, exportPath=None, remeshCheck=None, assetName=None):
+		"""
+		Process another asset on the existing network instead of rebuilding it.
+		Only the import file, the remesh switch and the output paths are swapped.
+		"""
+		self.importPath = importPath
+		self.exportPath = exportPath or self.exportPath
+		if remeshCheck is not None:
+			self.remeshCheck = remeshCheck
+		self.assetName = assetName or os.path.basename(self.importPath).split(".")[0]
+		self.geoCacheHit = False
+		self.uvCacheHit = False
+		with log_context(asset=self.assetName):
+			logger.info("Loading asset into existing network: %s", self.assetName)
+			self.startStage("setup")
+
+			self.remeshGeoNode.node("importFile").parm("file").set(self.importPath)  # Swap the input file
+			self.scan = self.scanInput()
+			configure_remesh_layout(self.remeshGeoNode, self.remeshCheck, self.budgetPolicy, self.scan)  # Switch, budget and bypasses
+			self.exportNode.parm("sopoutput").set(exportFilePath(self.exportPath, self.assetName))  # Swap the output file
+
+			if self.cache:
+				self.bindCaches()
+			self.cacheAndExport()
+
+	def update(self, remeshCheck=None, parms=None, exportFormats=None):
+		"""
+		Change settings on the live network and recook only what they affect.
+		parms maps a node name in either network to a {parm: value} dict,
+		e.g. {"group": {"minedgeangle": 70}}. The first stage the StageGraph
+		finds dirty decides where the recook starts: the pipeline stages before
+		its network are skipped, and as only file caches are force cooked,
+		Houdini recooks just the nodes downstream of the change. New
+		exportFormats only rerun the export. Returns False when nothing changed.
+		"""
+		for _, step in self.updateSteps(remeshCheck, parms, exportFormats):
+			if step() is False:
+				return False
+		return True
+
+	def updateSteps(self, remeshCheck=None, parms=None, exportFormats=None):
+		"""
+		Return update() as (stage, function) pairs to call in order, like buildSteps().
+		The setup step returns False when nothing changed, and the rest need not run.
+		"""
+		return [("setup", lambda: self.applyChanges(remeshCheck, parms, exportFormats))] + self.cookSteps()
+
+	@_assetStep
+	def applyChanges(self, remeshCheck=None, parms=None, exportFormats=None):
+		"""
+		Set the new settings on the live network and find the pipeline stages still up to date.
+		"""
+		self.startStage("setup")
+		formatsChanged = exportFormats is not None and tuple(exportFormats) != self.exportFormats
+		if formatsChanged:
+			self.exportFormats = tuple(exportFormats)
+		if remeshCheck is not None and remeshCheck != self.remeshCheck:
+			self.remeshCheck = remeshCheck
+			configure_remesh_layout(self.remeshGeoNode, self.remeshCheck, self.budgetPolicy, self.scan)
+		for nodeName, values in (parms or {}).items():
+			node = self.remeshGeoNode.node(nodeName) or self.uvGeoNode.node(nodeName)
+			if node is None:
+				raise ValueError(f"No pipeline node named {nodeName}")
+			node.setParms(values)
+
+		clean = self.stageGraph.cleanNetworks()
+		if clean == {"remesh", "uv"} and not formatsChanged:
+			logger.info("Nothing changed, skipping recook")
+			return False
+
+		if self.cache:
+			self.bindCaches()  # Keys of clean stages are unchanged, so they hit
+		self.upToDate = clean  # Upstream of the first dirty stage keeps its geometry
+		return True
+
+	def bypassDeadStages(self):
+		"""
+		Bypass the nodes whose output nothing reads, and re-enable those needed again.
+		The export always reads MESH_OUT, and the triangle branch too for glTF; the UV
+		metrics, the geometry fingerprint and the shell display only count while they are on.
+		"""
+		if not self.eliminateDeadStages:
+			for network, analysis in self.deadStages.items():  # A reused network may come from a run with it on
+				for name in analysis.dead:
+					self.builds[network][name].bypass(False)
+			self.deadStages = {}
+			self.deadStageReport = None
+			return {}
+		sinks = {
+			"remesh": {"MESH_OUT": (ANY,)},  # The UV network reads everything
+			"uv": {"MESH_OUT": EXPORT_ATTRIBUTES},
+		}
+		if self.dedup and self.cache:
+			sinks["remesh"]["fingerprintAttribs"] = FINGERPRINT_ATTRIBUTES
+		if self.measureUVs or "gltf" in self.exportFormats:
+			sinks["uv"]["metricsPoints"] = METRICS_ATTRIBUTES
+		if self.shellIslands is None:
+			if self.showUVShells:
+				sinks["uv"]["uvVisualizer"] = SHELL_ATTRIBUTES
+		elif self.showUVShells or self.precookShells:
+			sinks["uv"]["shellIslands"] = SHELL_ATTRIBUTES
+
+		for network, build in self.builds.items():
+			self.deadStages[network] = find_dead_stages(build.spec, sinks[network])
+			apply_dead_stages(build, self.deadStages[network])
+		return self.deadStages
+
+	def deadStageSavings(self):
+		"""
+		Report the bypassed dead nodes and an estimate of the cook time they would have cost
+		on this asset. The estimate comes from the STAGE_COSTS rates, nothing is timed.
+		"""
+		dead = [f"{network}/{name}" for network, analysis in self.deadStages.items() for name in analysis.dead]
+		try:
+			primitives = self.geoNull.geometry().intrinsicValue("primitivecount")  # Already cooked by the remesh stage
+		except hou.OperationFailed:
+			primitives = 0
+		seconds = sum(analysis.estimatedSeconds(primitives) for analysis in self.deadStages.values())
+		self.deadStageReport = {"bypassed": dead, "primitives": primitives, "estimatedSavedSeconds": seconds}
+		if dead:
+			logger.info("Dead stages bypassed: %s (estimated %.3f seconds, not measured)", ", ".join(dead), seconds)
+		return self.deadStageReport
+
+	def bypassedStages(self):
+		"""
+		Return the names of the remesh nodes bypassed for the current input.
+		"""
+		return [node.name() for node in self.remeshGeoNode.children() if node.isBypassed()]
+
+	def bindCaches(self):
+		"""
+		Key both file caches on the input contents and upstream parms, and load hits from disk.
+		"""
+		sourceHash = hash_file(self.importPath)  # Content hash, so renamed copies share entries
+		self.geoCacheKey = compute_cache_key(sourceHash, self.geoFileCache)
+		self.uvCacheKey = compute_cache_key(self.geoCacheKey, self.uvFileCache)  # Chained on the remesh key
+
+		self.geoCacheHit = self.cache.bind(self.geoFileCache, self.geoCacheKey)
+		self.uvCacheHit = self.cache.bind(self.uvFileCache, self.uvCacheKey)
+		logger.info("Cache for %s: remesh %s, uv %s", self.assetName, 'hit' if self.geoCacheHit else 'miss', 'hit' if self.uvCacheHit else 'miss')
+
+	def cacheAndExport(self, skip=()):
+		"""
+		Cook the remesh cache, then the UV cache, then write the export, timing each stage.
+		Pipeline stages named in skip are known to be up to date and are not cooked.
+		"""
+		self.upToDate = set(skip)
+		for _, step in self.cookSteps():
+			step()
+
+	def cookSteps(self):
+		"""
+		Return cacheAndExport as (stage, function) pairs to call in order.
+		Pipeline stages in upToDate are not cooked.
+		"""
+		return [
+			("remesh", self.cookRemeshStage),
+			("uv", self.cookUVStage),
+			("export", self.exportStage),
+		]
+
+	@_assetStep
+	def cookRemeshStage(self):
+		"""
+		Start timing the run and cook the remesh cache, unless the caches already hold the result.
+		"""
+		logger.info("Caching and exporting: %s", self.assetName)
+		self.stageTimes = {}  # Seconds per stage, None for a skipped stage
+		self.memory = {"rssBefore": process_rss()}
 
-	def cacheAndExport(self):
+		# Profile before timing so the stages below measure warm cooks only
+		if self.profile:
+			self.profileNodes()
+
+		self.cookStartTime = time.time()  # Start timing the export process
+
+		# A UV cache hit already holds everything the export needs
+		self.runStage("remesh", self.cookRemeshCache, skip=self.uvCacheHit or self.geoCacheHit or "remesh" in self.upToDate)
+
+	@_assetStep
+	def cookUVStage(self):
 		"""
-		Cache the remesh and UV layout data, then export the results.
+		Look for identical geometry whose UVs can be reused, then cook the UV cache.
 		"""
-		logger.info(f"Caching and exporting: {self.assetName}")
-		start_time = time.time()  # Start timing the export process
+		skip = self.uvCacheHit or "uv" in self.upToDate
+		self.dedupHit = False
+		self.dedupInfo = None
+		if self.dedup and self.cache and not skip:
+			self.bindDedup()
+		self.runStage("uv", self.cookUVCache, skip=skip)
 
-		# Execute the remesh file cache node if it exists
-		if self.geoFileCache:
-			logger.info("Running remesh file cache")
-			# Add logic to execute the remesh file cache if needed
+	@_assetStep
+	def exportStage(self):
+		"""
+		Write the export, then cook the shells and measure the UVs as the options ask.
+		"""
+		self.runStage("export", self.renderExport)
+		self.stageGraph.snapshot()  # The live network is now what was cooked
 
 		# Calculate elapsed time for the export process
-		self.elapsed_time = time.time() - start_time
-		logger.info(f"Export completed in {self.elapsed_time:.2f} seconds")
-		logger.info(f"Exported to: {self.exportPath}")
+		self.elapsed_time = time.time() - self.cookStartTime
+		STAGE_SECONDS.observe(self.elapsed_time, stage=TOTAL_STAGE)
+		logger.info("Export completed in %.2f seconds (%s)", self.elapsed_time, self.stageSummary(), extra={"duration": self.elapsed_time})
+		logger.info("Exported to: %s", self.exportPath)
+
+		if self.precookShells and self.shellIslands is not None:
+			self.cookShells()
+		if self.measureUVs:
+			self.measureUVQuality()
+		if self.eliminateDeadStages:
+			self.deadStageSavings()
+		self.memory["rssAfter"] = process_rss()
 
 		# Open the export folder if the flag is set
 		if self.openFileCheck:
 			open_export_folder(self.exportPath)
 
+	def bindDedup(self):
+		"""
+		Fingerprint the cleaned remesh output and, if the cache holds UVs for the
+		same geometry and UV parms, wire them in ahead of uvVisualizer.
+		"""
+		fingerprintNode = self.remeshGeoNode.node("fingerprintAttribs")
+		if fingerprintNode is None:
+			return False  # A variant spec without the fingerprint branch
+		try:
+			from uv_tool.core.dedup import geometry_fingerprint  # numpy is optional outside Houdini
+		except ImportError:
+			logger.warning("numpy is not available, geometry deduplication is disabled")
+			self.dedup = False
+			return False
+
+		start_time = time.time()
+		try:
+			fingerprint = geometry_fingerprint(fingerprintNode.geometry())
+		except hou.OperationFailed as e:
+			logger.warning("Could not fingerprint %s: %s", self.assetName, e)
+			return False
+
+		# Keyed with every UV parm up to the visualizer, so changed settings never reuse stale UVs
+		self.dedupKey = compute_cache_key(fingerprint, self.uvVisualizer)
+		entry = self.cache.lookup(self.dedupKey)
+		if entry is not None:
+			source = self.uvGeoNode.node("dedupSource")
+			source.parm("file").set(entry.replace(os.sep, "/"))
+			source.bypass(False)
+			self.uvVisualizer.setInput(0, self.uvGeoNode.node("dedupUVs"))
+			self.dedupHit = True
+			logger.info("Reusing UVs of identical geometry %s for: %s", fingerprint[:12], self.assetName)
+
+		self.dedupInfo = {"fingerprint": fingerprint, "hit": self.dedupHit, "seconds": time.time() - start_time}
+		return self.dedupHit
+
+	def measureUVQuality(self):
+		"""
+		Compute UV quality metrics from the triangulated metrics branch of the UV network.
+		"""
+		metricsNode = self.uvGeoNode.node("metricsPoints")
+		if metricsNode is None:
+			return None  # A variant spec without the metrics branch
+		try:
+			from uv_tool.core.metrics import measure_geometry  # numpy is optional outside Houdini
+		except ImportError:
+			logger.warning("numpy is not available, UV metrics are disabled")
+			self.measureUVs = False
+			return None
+
+		try:
+			self.uvMetrics = measure_geometry(metricsNode.geometry())
+		except hou.OperationFailed as e:
+			logger.warning("Could not measure UVs for %s: %s", self.assetName, e)
+			self.uvMetrics = None
+		return self.uvMetrics
+
+	def profileNodes(self):
+		"""
+		Cook each remesh and UV node on its own and write the per-node report.
+		"""
+		self.profileReport = profile_nodes({"remesh": self.remeshGeoNode, "uv": self.uvGeoNode}, self.assetName)
+		folder = self.profileDir or os.path.join(self.exportPath, "profiles")
+		self.profilePath = write_profile_report(self.profileReport, folder)
+
+	def startStage(self, name):
+		"""
+		Stop here if cancelled, otherwise report that the named stage is starting.
+		"""
+		if self.cancelCheck and self.cancelCheck():
+			logger.info("Cancelled before stage %s: %s", name, self.assetName)
+			raise PipelineCancelled(self.assetName)
+		if self.stageCallback:
+			self.stageCallback(self.assetName, name, PIPELINE_STAGES.index(name), len(PIPELINE_STAGES))
+
+	def runStage(self, name, stage, skip=False, retries=0):
+		"""
+		Run one stage, retrying failed cooks, and record its wall time in stageTimes.
+		"""
+		with log_context(stage=name):
+			self.startStage(name)
+			if skip:
+				logger.info("Skipping stage: %s", name)
+				self.stageTimes[name] = None
+				return
+
+			logger.info("Running stage: %s", name)
+			start_time = time.time()
+			for attempt in range(retries + 1):
+				try:
+					stage()
+					break
+				except hou.OperationFailed as e:
+					if attempt == retries:
+						raise
+					logger.warning("Stage %s failed, retrying (%s/%s): %s", name, attempt + 1, retries, e)
+
+			self.stageTimes[name] = time.time() - start_time
+			STAGE_SECONDS.observe(self.stageTimes[name], stage=name)
+			logger.info("Stage %s finished in %.2f seconds", name, self.stageTimes[name], extra={"duration": self.stageTimes[name]})
+
+	def cookRemeshCache(self):
+		"""
+		Cook the remesh chain through its file cache.
+		"""
+		if self.cache:
+			self.cache.commit(self.geoFileCache, self.geoCacheKey)
+		else:
+			self.geoFileCache.cook(force=True)
+
+	def cookUVCache(self):
+		"""
+		Cook the UV chain through its file cache.
+		"""
+		if self.parallelUnwrap and not self.dedupHit:
+			self.unwrapPieces()
+		try:
+			if self.cache:
+				self.cache.commit(self.uvFileCache, self.uvCacheKey)
+				if self.dedupInfo and not self.dedupHit:
+					self.cache.store(self.dedupKey, self.uvFileCache.geometry())  # For identical meshes in later files
+			else:
+				self.uvFileCache.cook(force=True)
+		finally:
+			if self.parallelUnwrap and self.cache:
+				# The cache now holds the result; rewire so cache keys see the unwrap chain again
+				self.uvGeoNode.node("uvLayout").setInput(0, self.uvGeoNode.node("uvUnwrap"))
+			if self.dedupHit:
+				self.uvVisualizer.setInput(0, self.uvGeoNode.node("uvLayout"))
+				self.uvGeoNode.node("dedupSource").bypass(True)
+
+	def unwrapPieces(self):
+		"""
+		Unwrap the pieces of the measured geometry in worker processes and feed the merged result to uvLayout.
+		"""
+		_, self.pieceTimes = parallel_unwrap(
+			self.uvGeoNode.node("measure"),
+			self.uvGeoNode.node("uvLayout"),
+			self.pieceWorkers,
+			self.parallelUnwrap
+		)
+
+	def renderExport(self):
+		"""
+		Write the export files in every requested format.
+		"""
+		self.exportResults = write_exports(
+			self.exportNode, self.uvNull, self.exportPath, self.assetName, self.exportFormats,
+			triangleNode=self.uvGeoNode.node("metricsPoints")  # Triangles read in bulk by the glTF backend
+		)
+
+	def stageSummary(self):
+		"""
+		Return the per-stage timings as a short human readable string.
+		"""
+		parts = []
+		for name, seconds in self.stageTimes.items():
+			parts.append(f"{name} skipped" if seconds is None else f"{name} {seconds:.2f}s")
+		return ", ".join(parts)
+
+	def destroyNetwork(self):
+		"""
+		Destroy only the remesh and UV networks this instance created.
+		"""
+		logger.info("Destroying network for: %s", self.assetName)
+		for node in (self.remeshGeoNode, self.uvGeoNode):
+			if node is None:
+				continue  # Cancelled before the setup step built it
+			try:
+				node.destroy()
+			except hou.ObjectWasDeleted:
+				pass  # Already removed by the user or an earlier clear
+
+	def releaseMemory(self):
+		"""
+		Flush Houdini's SOP cache and record the process RSS before and after.
+		The networks stay valid; their nodes recook on the next access.
+		"""
+		self.memory["rssBeforeFlush"] = process_rss()
+		self.memory["sopCacheFlushed"] = flush_sop_cache()
+		self.memory["rssAfterFlush"] = process_rss()
+		logger.info("Memory for %s: %s before, %s after the run, %s after the SOP cache flush", self.assetName,
+			format_bytes(self.memory.get("rssBefore")), format_bytes(self.memory.get("rssAfter")), format_bytes(self.memory["rssAfterFlush"]))
+		return self.memory
+
 	def clearNodes(self):
 		"""
-		Clear all child nodes under the top-level Houdini node.
+		Destroy the nodes this tool created and flush the SOP cache, leaving the rest of the scene alone.
+		"""
+		logger.info("Clearing nodes")
+		self.destroyNetwork()
+		self.releaseMemory()
+
+	def cookShells(self):
+		"""
+		Cook the UV shell display from the cached result, so showing it later costs nothing.
 		"""
-		logger.info(f"Clearing nodes")
-		for node in self.topNode.children():
-			node.destroy()  # Destroy each child node
+		start_time = time.time()
+		self.shellIslands.cook(force=True)
+		self.shellCookTime = time.time() - start_time
+		logger.info("UV shell display cooked in %.3f seconds", self.shellCookTime)
 
 	def toggleUVShell(self, toggle):
 		"""
 		Toggle the visibility of the UV shell visualizer.
+		With the shellIslands side branch only display flags change, so
+		nothing upstream is dirtied; the branch cooks on its first showing
+		unless precookShells cooked it already, and stays cooked after that.
 		"""
-		logger.info(f"Toggling UV shell: {toggle}")
+		logger.info("Toggling UV shell: %s", toggle)
+		start_time = time.time()
+		self.showUVShells = bool(toggle)
+		if self.shellIslands is not None:
+			if toggle and self.shellIslands.isBypassed():
+				self.bypassDeadStages()  # Hidden until now, so enable it once
+			(self.shellIslands if toggle else self.uvNull).setDisplayFlag(True)
+			logger.info("UV shells %s in %.3f seconds", "shown" if toggle else "hidden", time.time() - start_time)
+			return
+		self.bypassDeadStages()  # The visualizer only cooks while the shells are shown
 		if toggle:
 			# Enable UV shell visualization
 			self.uvVisualizer.parm("visualize_islands").set(1)  # Show UV shells
@@ -0,0 +1,74 @@
+# core/_options.py
+
+import dataclasses
+
+from uv_tool.core.caching import DEFAULT_EXPORT_FORMATS
+
+
+@dataclasses.dataclass
+class PipelineOptions:
+	"""
+	How a UVToolClass runs its assets, passed as one object by the batch
+	runner, manifests, the watch daemon, LODs and the UI.
+	The defaults only build, cook and export the networks; batch() also
+	turns on the cache, pre-flight scan, UV metrics and deduplication.
+
+	With useCache, file caches are keyed on the input contents and parms so
+	unchanged assets load from the shared ResultCache instead of cooking.
+	With profile, every node is cooked individually first and a JSON report
+	is written to profileDir (default: <exportPath>/profiles).
+	budgetPolicy (a BudgetPolicy or a name from BUDGET_POLICIES) sizes the
+	polyreduce target from the cleaned input instead of a fixed 1000.
+	With preflight, OBJ inputs are scanned first so stages with nothing to
+	do (no UCX, no UVs, already under budget) are bypassed.
+	parallelUnwrap ("connectivity" or "name") splits the cleaned geometry
+	into pieces that are flattened and unwrapped on pieceWorkers processes
+	(default: one per CPU), then packed together by a single uvLayout.
+	exportFormats names the EXPORT_BACKENDS to write (fbx, bgeo, obj, gltf);
+	several formats are written concurrently.
+	pipelineSpecs maps "remesh" and "uv" to a PipelineSpec, a spec dict or a
+	JSON/YAML file replacing the default network, defaulting to the files in
+	UV_TOOL_REMESH_SPEC and UV_TOOL_UV_SPEC when set; they only take effect
+	when the network is built.
+	With measureUVs, island count, utilization, overlap, distortion and
+	texel density are computed from MESH_OUT after the export (needs numpy).
+	With dedup, the cleaned remesh output is fingerprinted and an asset whose
+	geometry was unwrapped before (under any file name) copies those UVs
+	from the cache instead of flattening, unwrapping and laying out again.
+	With eliminateDeadStages, nodes whose attributes and groups nothing
+	downstream reads (by default measure and the visualizer, and the shell
+	display while UV shells are hidden) are bypassed. It is off by default
+	as the export then only carries uv and N, not the shell colours.
+	With precookShells, the UV shell display is cooked once after each run,
+	so toggleUVShell only switches the display flag (for the UI).
+	"""
+	useCache: bool = False
+	profile: bool = False
+	profileDir: str = None
+	budgetPolicy: object = None
+	preflight: bool = False
+	parallelUnwrap: str = None
+	pieceWorkers: int = None
+	exportFormats: tuple = DEFAULT_EXPORT_FORMATS
+	pipelineSpecs: dict = None
+	measureUVs: bool = False
+	dedup: bool = False
+	eliminateDeadStages: bool = False
+	precookShells: bool = False
+
+	def __post_init__(self):
+		self.exportFormats = tuple(self.exportFormats)
+
+	@classmethod
+	def batch(cls, **changes):
+		"""
+		Options for unattended runs (batch, manifests and the watch daemon),
+		with useCache, preflight, measureUVs and dedup on.
+		"""
+		return cls(useCache=True, preflight=True, measureUVs=True, dedup=True).replace(**changes)
+
+	def replace(self, **changes):
+		"""
+		Return a copy with the named options changed.
+		"""
+		return dataclasses.replace(self, **changes)
@@ -0,0 +1,46 @@
+# core/_preview.py
+
+import os
+import hou
+import time
+
+from uv_tool.utils._logger import logger, log_context
+from uv_tool.core.nodes import PREVIEW_PIPELINE, PREVIEW_POLYGONS, compile_pipeline, get_pipeline_spec
+
+class PreviewNetwork:
+	"""
+	A throwaway low-resolution polyreduce and UV pass, shown while the full pipeline cooks.
+	"""
+	def __init__(self, importPath, topNode=None, polygons=PREVIEW_POLYGONS, showUVShells=False, spec=None):
+		"""
+		Build the preview network next to where the full one will be; nothing cooks until cook().
+		"""
+		self.importPath = importPath
+		self.assetName = os.path.basename(importPath).split(".")[0]
+		self.seconds = None  # Time the preview took to cook
+		self.geoNode = (topNode or hou.node("/obj")).createNode("geo", f"{self.assetName}_preview")
+		self.build = compile_pipeline(self.geoNode, get_pipeline_spec(spec, PREVIEW_PIPELINE), {"importFile": importPath})
+		self.build["polyReduce"].parm("finalcount").set(polygons)
+		self.build["uvVisualizer"].parm("visualize_islands").set(1 if showUVShells else 0)
+
+	def cook(self):
+		"""
+		Cook the preview and show it; return the seconds it took.
+		"""
+		with log_context(asset=self.assetName):
+			start_time = time.time()
+			output = self.build["PREVIEW_OUT"]
+			output.cook(force=True)
+			output.setDisplayFlag(True)
+			self.seconds = time.time() - start_time
+			logger.info("Preview ready in %.2f seconds", self.seconds)
+		return self.seconds
+
+	def destroy(self):
+		"""
+		Remove the preview once the full result replaces it.
+		"""
+		try:
+			self.geoNode.destroy()
+		except hou.ObjectWasDeleted:
+			pass  # Already gone with its parent network
@@ -0,0 +1,116 @@
+# core/_stage_graph.py
+
+import os
+import json
+import hashlib
+
+from uv_tool.utils._logger import logger
+
+
+class Stage:
+	"""
+	One node of the pipeline with the stages it reads from.
+	"""
+	def __init__(self, name, network, node, inputs=()):
+		self.name = name  # Stage name used in reports
+		self.network = network  # Pipeline stage it belongs to: "remesh" or "uv"
+		self.node = node  # Houdini node that does the work
+		self.inputs = tuple(inputs)  # Names of upstream stages
+
+	def localState(self):
+		"""
+		Return everything about this node that changes its output, ignoring inputs.
+		"""
+		state = {
+			"type": self.node.type().name(),
+			"bypassed": self.node.isBypassed(),
+			"parms": {parm.name(): parm.evalAsString() for parm in self.node.parms()},
+		}
+		if state["type"] == "file":
+			# Content changes without a parm change still dirty the import
+			path = self.node.parm("file").evalAsString()
+			if os.path.exists(path):
+				stat = os.stat(path)
+				state["source"] = [path, stat.st_size, stat.st_mtime]
+		return state
+
+
+class StageGraph:
+	"""
+	Dependency model of the remesh and UV networks.
+
+	Each stage's fingerprint hashes its own parms together with the
+	fingerprints of its inputs, so a change anywhere marks exactly that stage
+	and everything downstream of it as dirty. snapshot() records the state
+	that was last cooked; dirtyStages() compares the live network against it.
+	"""
+	def __init__(self, stages):
+		self.stages = list(stages)  # In cook order, every stage after its inputs
+		self.byName = {stage.name: stage for stage in self.stages}
+		self.cooked = {}  # Fingerprints at the last snapshot
+
+	@classmethod
+	def from_tool(cls, tool):
+		"""
+		Describe the networks built by create_remesh_layout and create_uv_layout.
+		"""
+		remesh = tool.remeshGeoNode
+		uv = tool.uvGeoNode
+		return cls([
+			Stage("import", "remesh", remesh.node("importFile")),
+			Stage("attribDelete", "remesh", remesh.node("attribDelete"), ["import"]),
+			Stage("deleteUCX", "remesh", remesh.node("deleteUCX"), ["attribDelete"]),
+			Stage("clean", "remesh", remesh.node("clean"), ["deleteUCX"]),
+			Stage("polyReduce", "remesh", remesh.node("polyReduce"), ["clean"]),
+			Stage("switch", "remesh", remesh.node("switch"), ["deleteUCX", "polyReduce"]),
+			Stage("remeshCache", "remesh", tool.geoFileCache, ["switch"]),
+			Stage("merge", "uv", uv.node("importRemesh"), ["remeshCache"]),
+			Stage("measure", "uv", uv.node("measure"), ["merge"]),
+			Stage("group", "uv", uv.node("group"), ["measure"]),
+			Stage("flatten", "uv", uv.node("uvFlatten"), ["group"]),
+			Stage("unwrap", "uv", uv.node("uvUnwrap"), ["flatten"]),
+			Stage("layout", "uv", uv.node("uvLayout"), ["unwrap"]),
+			Stage("visualize", "uv", tool.uvVisualizer, ["layout"]),
+			Stage("uvCache", "uv", tool.uvFileCache, ["visualize"]),
+		])
+
+	def fingerprints(self):
+		"""
+		Return the current fingerprint of every stage.
+		"""
+		prints = {}
+		for stage in self.stages:
+			payload = {
+				"local": stage.localState(),
+				"inputs": [prints[name] for name in stage.inputs],
+			}
+			if stage.name.endswith("Cache"):
+				payload["local"]["parms"] = {}  # Cache paths follow from the inputs, they do not change them
+			prints[stage.name] = hashlib.sha1(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+		return prints
+
+	def snapshot(self):
+		"""
+		Record the live network as cooked.
+		"""
+		self.cooked = self.fingerprints()
+
+	def dirtyStages(self):
+		"""
+		Return the stages, in cook order, that changed since the last snapshot.
+		"""
+		current = self.fingerprints()
+		return [stage.name for stage in self.stages if self.cooked.get(stage.name) != current[stage.name]]
+
+	def cleanNetworks(self):
+		"""
+		Return the pipeline stages ("remesh", "uv") upstream of the first dirty stage.
+		Their file caches still hold what a recook would produce, so they need not cook;
+		the network of the first dirty stage and every one after it must.
+		"""
+		dirty = self.dirtyStages()
+		networks = list(dict.fromkeys(stage.network for stage in self.stages))
+		if not dirty:
+			return set(networks)
+		logger.info("First dirty stage: %s (%s dirty)", dirty[0], len(dirty))
+		return set(networks[:networks.index(self.byName[dirty[0]].network)])
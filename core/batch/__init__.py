@@ -0,0 +1,4 @@
+from ._batch_runner import collect_assets, process_asset, run_batch, BatchSummary
+from ._manifest import ManifestAsset, load_manifest, run_manifest
+from ._worker_pool import RecyclingPool, WorkerLost, worker_slot
+from ._scheduler import CostHistory, Job, fit_cost_model, predict_job, schedule_jobs, simulate_makespan, SCHEDULES
\ No newline at end of file
@@ -0,0 +1,365 @@
+# core/batch/_batch_runner.py
+
+import os
+import sys
+import json
+import time
+import signal
+import traceback
+import multiprocessing
+from concurrent.futures import as_completed
+
+from uv_tool.utils._logger import logger
+from uv_tool.utils._metrics import metrics, observe_result, QUEUE_DEPTH
+from uv_tool.core.profiling import aggregate_profiles, write_profile_report
+from uv_tool.core.nodes._polyreduce_budget import BUDGET_POLICIES
+from uv_tool.core.preflight import estimate_cost
+from uv_tool.core.caching import EXPORT_BACKENDS, DEFAULT_EXPORT_FORMATS
+from uv_tool.core._options import PipelineOptions
+from uv_tool.core.batch._worker_pool import RecyclingPool, worker_slot
+from uv_tool.core.batch._scheduler import SCHEDULES, CostHistory, plan_batch, schedule_report
+
+ASSET_EXTENSIONS = (".fbx", ".obj")  # Input formats the pipeline can import
+
+_workerRoot = None  # Per-process network that holds every node a worker creates
+_workerPipeline = None  # Warm UVToolClass network reused across a worker's assets
+
+
+def collect_assets(inputs, recursive=False):
+	''' Collect FBX/OBJ files from a folder, a file, or a list of either. '''
+	if isinstance(inputs, str):
+		inputs = [inputs]
+
+	assets = []
+	for path in inputs:
+		if os.path.isdir(path):
+			if recursive:
+				for root, _, files in os.walk(path):
+					assets.extend(os.path.join(root, name) for name in sorted(files))
+			else:
+				assets.extend(os.path.join(path, name) for name in sorted(os.listdir(path)))
+		else:
+			assets.append(path)
+
+	# Keep supported files only and drop duplicates while preserving order
+	seen = set()
+	result = []
+	for path in assets:
+		path = os.path.abspath(path)
+		if path.lower().endswith(ASSET_EXTENSIONS) and path not in seen:
+			seen.add(path)
+			result.append(path)
+
+	logger.info("Collected %s assets for batch", len(result))
+	return result
+
+
+def _init_worker():
+	''' Give this process its own network under /obj. '''
+	global _workerRoot
+	import hou
+
+	_workerRoot = hou.node("/obj").createNode("subnet", f"uv_batch_{os.getpid()}")
+
+
+def _init_pool_worker():
+	''' Initializer of pool worker processes. '''
+	# Ctrl-C reaches the whole process group; the parent decides how to stop, so a worker never dies mid-asset
+	signal.signal(signal.SIGINT, signal.SIG_IGN)
+	_init_worker()
+
+
+def process_asset(importPath, exportPath, remeshCheck=False, reuseNetwork=True, options=None, lods=None, lodWorkers=None):
+	''' Run the remesh and UV pipeline on one asset and return a result dict.
+
+	With reuseNetwork the worker keeps one network alive and only swaps the
+	asset into it, instead of building and destroying the nodes every time.
+	options is the PipelineOptions of the run, e.g. its budget policy,
+	export formats and profile folder. With lods, a list of polygon fractions, <asset>_LOD<n> is exported for
+	each instead, all from one import and clean (see generate_lods), the
+	LOD branches cooking on lodWorkers processes of their own.
+	'''
+	global _workerPipeline
+	if lods:
+		return process_asset_lods(importPath, exportPath, lods, reuseNetwork, options, lodWorkers)
+	from uv_tool.core._controller import UVToolClass
+
+	options = options or PipelineOptions.batch()
+
+	result = {
+		"asset": os.path.basename(importPath).split(".")[0],
+		"importPath": importPath,
+		"exportPath": exportPath,
+		"status": "ok",
+		"worker": os.getpid(),
+		"slot": worker_slot(),
+		"elapsed": 0.0,
+		"stages": {},
+		"error": None,
+	}
+
+	start_time = time.time()
+	assetFixer = None
+	try:
+		if reuseNetwork and _workerPipeline is not None:
+			assetFixer = _workerPipeline
+			assetFixer.setOptions(options)
+			assetFixer.loadAsset(importPath, exportPath, remeshCheck)
+		else:
+			assetFixer = UVToolClass(importPath, exportPath, remeshCheck, False, options, topNode=_workerRoot)
+	except Exception as e:
+		result["status"] = "failed"
+		result["error"] = f"{type(e).__name__}: {e}"
+		result["traceback"] = traceback.format_exc()
+		_workerPipeline = None  # Never reuse a network left in a failed state
+		if assetFixer is not None:
+			assetFixer.clearNodes()
+		if _workerRoot is not None:
+			for node in _workerRoot.children():
+				node.destroy()  # Including whatever a UVToolClass that failed to construct had built
+	else:
+		result["stages"] = dict(assetFixer.stageTimes)
+		result["bypassed"] = assetFixer.bypassedStages()
+		result["estimatedCost"] = estimate_cost(importPath, assetFixer.scan)
+		result["exports"] = assetFixer.exportResults
+		result["apiCalls"] = assetFixer.apiCalls
+		result["uvMetrics"] = assetFixer.uvMetrics
+		result["dedup"] = assetFixer.dedupInfo
+		result["deadStages"] = assetFixer.deadStageReport
+		if assetFixer.cache:
+			result["cache"] = {"remesh": assetFixer.geoCacheHit, "uv": assetFixer.uvCacheHit}
+			if assetFixer.dedupInfo:
+				result["cache"]["dedup"] = assetFixer.dedupInfo["hit"]
+		if options.profile:
+			result["profile"] = assetFixer.profilePath
+		if reuseNetwork:
+			_workerPipeline = assetFixer
+			assetFixer.releaseMemory()  # Cooked geometry of this asset is not needed by the next one
+		else:
+			assetFixer.clearNodes()  # Keep the worker network empty between assets
+		result["memory"] = dict(assetFixer.memory)
+
+	result["elapsed"] = time.time() - start_time
+	return result
+
+
+def process_asset_lods(importPath, exportPath, lods, reuseNetwork=True, options=None, workers=None):
+	''' Export every LOD of one asset and return a result dict that fails if any LOD failed. '''
+	from uv_tool.core.lod import generate_lods
+
+	result = {
+		"asset": os.path.basename(importPath).split(".")[0],
+		"importPath": importPath,
+		"exportPath": exportPath,
+		"status": "ok",
+		"worker": os.getpid(),
+		"slot": worker_slot(),
+		"elapsed": 0.0,
+		"stages": {},
+		"error": None,
+	}
+
+	start_time = time.time()
+	try:
+		report = generate_lods(importPath, exportPath, lods, workers, options=options, topNode=_workerRoot, reuseNetwork=reuseNetwork)
+	except Exception as e:
+		result["status"] = "failed"
+		result["error"] = f"{type(e).__name__}: {e}"
+		result["traceback"] = traceback.format_exc()
+	else:
+		result["stages"] = {"shared": report["sharedSeconds"], "lods": report["branchSeconds"]}
+		result["polygons"] = report["polygons"]
+		result["lods"] = report["lods"]
+		result["exports"] = {f"{lod['asset']}.{fmt}": export for lod in report["lods"] for fmt, export in (lod.get("exports") or {}).items()}
+		failed = [lod for lod in report["lods"] if lod["status"] != "ok"]
+		if failed:
+			result["status"] = "failed"
+			result["error"] = "; ".join(f"{lod['asset']}: {lod['error']}" for lod in failed)
+
+	result["elapsed"] = time.time() - start_time
+	return result
+
+
+class BatchSummary:
+	''' Aggregated results of a batch run. '''
+	def __init__(self, results, wallTime, workers):
+		self.results = sorted(results, key=lambda r: r["importPath"])
+		self.wallTime = wallTime
+		self.workers = workers
+		self.profilePath = None  # Aggregated node profile, when profiling
+		self.recycledWorkers = 0  # Workers replaced for their asset count or memory
+		self.schedule = None  # Predicted, simulated and real makespan
+
+	@property
+	def succeeded(self):
+		return [r for r in self.results if r["status"] == "ok"]
+
+	@property
+	def failed(self):
+		return [r for r in self.results if r["status"] != "ok"]
+
+	def to_dict(self):
+		cookTime = sum(r["elapsed"] for r in self.results)
+		rss = [r["memory"].get("rssAfter") for r in self.results if r.get("memory")]
+		fingerprinted = [r["dedup"] for r in self.results if r.get("dedup")]
+		dedupHits = sum(1 for dedup in fingerprinted if dedup["hit"])
+		return {
+			"total": len(self.results),
+			"succeeded": len(self.succeeded),
+			"failed": len(self.failed),
+			"workers": self.workers,
+			"wallTime": self.wallTime,
+			"cookTime": cookTime,
+			"assetsPerSecond": len(self.results) / self.wallTime if self.wallTime else 0.0,
+			"peakRss": max((value for value in rss if value), default=None),
+			"recycledWorkers": self.recycledWorkers,
+			"dedupHits": dedupHits,
+			"dedupHitRate": dedupHits / len(fingerprinted) if fingerprinted else 0.0,
+			"estimatedDeadStageSeconds": sum((r.get("deadStages") or {}).get("estimatedSavedSeconds", 0.0) for r in self.results),
+			"schedule": self.schedule,
+			"results": self.results,
+		}
+
+	def write(self, path):
+		''' Write the summary as JSON. '''
+		with open(path, "w") as f:
+			json.dump(self.to_dict(), f, indent=2)
+		logger.info("Batch summary written to: %s", path)
+		return path
+
+
+def write_batch_profile(results, profileDir):
+	''' Aggregate the per-asset profile reports of a batch into one file. '''
+	reports = []
+	for result in results:
+		if result.get("profile"):
+			with open(result["profile"]) as f:
+				reports.append(json.load(f))
+	return write_profile_report(aggregate_profiles(reports), profileDir, "batch_profile.json")
+
+
+def run_batch(inputs, exportPath, remeshCheck=False, workers=None, executable=None, reuseNetwork=True, options=None, maxAssetsPerWorker=None, maxWorkerRss=None, lods=None, lodWorkers=None, schedule="longest", historyPath=None, metricsPath=None):
+	''' Process every asset found in inputs across a pool of worker processes.
+
+	executable selects the interpreter the workers are spawned with, which
+	should be hython when run outside of a Houdini session. options is the
+	PipelineOptions every asset runs with; with its profileDir, per-asset
+	node profiles and a batch_profile.json aggregate are written.
+	A worker is replaced by a fresh process after maxAssetsPerWorker assets
+	or once its RSS passes maxWorkerRss bytes. With lods every asset is
+	exported at each of those polygon fractions instead, and with lodWorkers
+	each worker cooks an asset's LODs on that many processes of its own
+	(so up to workers * lodWorkers processes cook at once).
+	With the "longest" schedule assets are dispatched longest predicted
+	first, from a cost model fitted on the run times in historyPath
+	(default: <exportPath>/.uv_tool_costs.sqlite); every run adds to it.
+	With metricsPath the OpenMetrics text is rewritten as each asset finishes.
+	'''
+	assets = collect_assets(inputs)
+	exportPath = os.path.abspath(exportPath)
+	options = options or PipelineOptions.batch()
+	if options.profileDir:
+		options = options.replace(profile=True, profileDir=os.path.abspath(options.profileDir))
+	workers = max(1, min(workers or os.cpu_count() or 1, len(assets) or 1))
+	os.makedirs(exportPath, exist_ok=True)
+	history = CostHistory(historyPath or os.path.join(exportPath, ".uv_tool_costs.sqlite"))
+	jobs, order, model = plan_batch(assets, schedule, history)
+	jobsByPath = {job.path: job for job in jobs}
+
+	logger.info("Starting batch of %s assets on %s workers", len(assets), workers)
+	start_time = time.time()
+
+	context = multiprocessing.get_context("spawn")  # Never fork a live Houdini session
+	if executable:
+		context.set_executable(executable)
+
+	results = []
+	QUEUE_DEPTH.set(len(assets))
+	with RecyclingPool(workers, context, _init_pool_worker, maxAssetsPerWorker, maxWorkerRss) as pool:
+		futures = {
+			pool.submit(process_asset, job.path, exportPath, remeshCheck, reuseNetwork, options, lods, lodWorkers): job.path
+			for job in order  # Submission order is dispatch order
+		}
+		for future in as_completed(futures):
+			path = futures[future]
+			try:
+				result = future.result()
+			except Exception as e:
+				# The worker itself died, so there is no per-asset result
+				result = {
+					"asset": os.path.basename(path).split(".")[0],
+					"importPath": path,
+					"exportPath": exportPath,
+					"status": "failed",
+					"worker": None,
+					"elapsed": 0.0,
+					"stages": {},
+					"error": f"{type(e).__name__}: {e}",
+				}
+			if result["status"] == "ok":
+				logger.info("Processed %s in %.2f seconds", result['asset'], result['elapsed'])
+			else:
+				logger.error("Failed %s: %s", result['asset'], result['error'])
+			result["predictedCost"] = jobsByPath[path].predicted
+			history.record(jobsByPath[path], result)
+			results.append(result)
+			observe_result(result)  # Cooked in a worker, so this process has not seen its stages
+			QUEUE_DEPTH.set(len(assets) - len(results))
+			if metricsPath:
+				metrics.write_textfile(metricsPath)
+		recycled = pool.recycled
+
+	summary = BatchSummary(results, time.time() - start_time, workers)
+	summary.recycledWorkers = recycled
+	summary.schedule = schedule_report(jobs, order, results, workers, summary.wallTime, schedule, model)
+	history.close()
+	if options.profileDir:
+		summary.profilePath = write_batch_profile(results, options.profileDir)
+	logger.info("Batch completed: %s ok, %s failed in %.2f seconds", len(summary.succeeded), len(summary.failed), summary.wallTime)
+	report = summary.to_dict()
+	logger.info("Makespan %.2f seconds, %.2f predicted, %.2f simulated (%.2f in input order)", summary.wallTime,
+		summary.schedule["predictedMakespan"], summary.schedule["simulatedMakespan"], summary.schedule["simulatedFifoMakespan"])
+	if report["dedupHits"]:
+		logger.info("Reused UVs of identical geometry for %s assets (%.0f%% of those fingerprinted)", report["dedupHits"], report["dedupHitRate"] * 100.0)
+	return summary
+
+
+def main(argv=None):
+	''' Command-line entry: <input>... -o <exportDir> [-j N] [--remesh]. '''
+	import argparse
+
+	parser = argparse.ArgumentParser(description="Batch remesh and UV FBX/OBJ assets")
+	parser.add_argument("inputs", nargs="+", help="Asset files or folders")
+	parser.add_argument("-o", "--output", required=True, help="Export folder")
+	parser.add_argument("-j", "--workers", type=int, default=None, help="Number of worker processes")
+	parser.add_argument("--remesh", action="store_true", help="Enable polyreduce remeshing")
+	parser.add_argument("--summary", default=None, help="Write the JSON summary to this path")
+	parser.add_argument("--profile", default=None, help="Write per-node profile reports to this folder")
+	parser.add_argument("--formats", nargs="+", default=list(DEFAULT_EXPORT_FORMATS), choices=sorted(EXPORT_BACKENDS), help="Export formats to write")
+	parser.add_argument("--skip-dead-stages", action="store_true", help="Bypass nodes whose output nothing exported reads, dropping the shell colours")
+	parser.add_argument("--budget", default=None, choices=sorted(BUDGET_POLICIES), help="Polyreduce budget policy when remeshing")
+	parser.add_argument("--recycle-after", type=int, default=None, help="Replace a worker after this many assets")
+	parser.add_argument("--max-rss", type=float, default=None, help="Replace a worker once its memory passes this many MB")
+	parser.add_argument("--schedule", default="longest", choices=SCHEDULES, help="Dispatch the longest predicted assets first, or in input order")
+	parser.add_argument("--cost-history", default=None, help="SQLite file of past run times the cost model is fitted from")
+	parser.add_argument("--metrics-file", default=None, help="Write OpenMetrics text here, e.g. for the node_exporter textfile collector")
+	parser.add_argument("--metrics-port", type=int, default=None, help="Also serve the metrics on this local HTTP port while running")
+	parser.add_argument("--lods", nargs="+", type=float, default=None, help="Export a LOD at each of these fractions of the polygons, e.g. 1 0.5 0.1 0.02")
+	parser.add_argument("--lod-workers", type=int, default=None, help="Processes each worker cooks an asset's LODs on, default one")
+	args = parser.parse_args(argv)
+
+	maxRss = int(args.max_rss * 1024 * 1024) if args.max_rss else None
+	server = metrics.serve(args.metrics_port) if args.metrics_port else None
+	options = PipelineOptions.batch(profile=bool(args.profile), profileDir=args.profile, budgetPolicy=args.budget, exportFormats=args.formats,
+		eliminateDeadStages=args.skip_dead_stages)
+	summary = run_batch(args.inputs, args.output, args.remesh, args.workers, options=options, maxAssetsPerWorker=args.recycle_after, maxWorkerRss=maxRss, lods=args.lods, lodWorkers=args.lod_workers,
+		schedule=args.schedule, historyPath=args.cost_history, metricsPath=args.metrics_file)
+	if server:
+		server.shutdown()
+	if args.summary:
+		summary.write(args.summary)
+	return 0 if not summary.failed else 1
+
+
+if __name__ == "__main__":
+	sys.exit(main())
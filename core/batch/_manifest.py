@@ -0,0 +1,171 @@
+# core/batch/_manifest.py
+
+import os
+import sys
+import json
+import time
+
+from uv_tool.utils._logger import logger
+from uv_tool.utils._metrics import observe_result, QUEUE_DEPTH
+from uv_tool.core.caching import EXPORT_BACKENDS, DEFAULT_EXPORT_FORMATS
+from uv_tool.core.nodes._polyreduce_budget import BUDGET_POLICIES, get_budget_policy
+from uv_tool.core._options import PipelineOptions
+from uv_tool.core.batch import _batch_runner
+
+# Per-asset options a manifest may set, and their defaults
+ASSET_OPTIONS = {
+	"input": None,  # Asset file, relative to the manifest
+	"output": None,  # Export folder, relative to the manifest
+	"remesh": False,
+	"polyreduceTarget": None,  # Fixed polygon count when remeshing
+	"budget": None,  # Budget policy name, instead of a fixed target
+	"formats": list(DEFAULT_EXPORT_FORMATS),
+	"lods": None,  # Polygon fractions to export a LOD at, instead of one output
+	"lodWorkers": None,  # Processes the LOD branches cook on, default one
+}
+
+
+class ManifestAsset:
+	''' One entry of a manifest with every option resolved. '''
+	def __init__(self, input, output, remesh=False, polyreduceTarget=None, budget=None, formats=DEFAULT_EXPORT_FORMATS, lods=None, lodWorkers=None):
+		self.input = input
+		self.output = output
+		self.remesh = bool(remesh)
+		self.polyreduceTarget = polyreduceTarget
+		self.budget = budget
+		self.formats = tuple(formats)
+		self.lods = [float(target) for target in lods] if lods else None
+		self.lodWorkers = int(lodWorkers) if lodWorkers else None
+
+	def budgetPolicy(self):
+		''' Return the polyreduce budget these options ask for, or None for the default. '''
+		if self.polyreduceTarget is not None:
+			# An explicit target is used as given, not clamped to the policy's default caps
+			return get_budget_policy("fixed", count=int(self.polyreduceTarget), minPolygons=1, maxPolygons=sys.maxsize)
+		return self.budget
+
+	def pipelineOptions(self):
+		''' Return the PipelineOptions this asset runs with. '''
+		return PipelineOptions.batch(budgetPolicy=self.budgetPolicy(), exportFormats=self.formats)
+
+	def to_dict(self):
+		return {
+			"input": self.input,
+			"output": self.output,
+			"remesh": self.remesh,
+			"polyreduceTarget": self.polyreduceTarget,
+			"budget": self.budget,
+			"formats": list(self.formats),
+			"lods": self.lods,
+			"lodWorkers": self.lodWorkers,
+		}
+
+
+def _resolve(path, folder):
+	return os.path.normpath(os.path.join(folder, os.path.expanduser(path)))
+
+
+def _asset_from_entry(entry, defaults, folder, index):
+	if isinstance(entry, str):
+		entry = {"input": entry}
+	unknown = set(entry) - set(ASSET_OPTIONS)
+	if unknown:
+		raise ValueError(f"Manifest asset {index}: unknown options {', '.join(sorted(unknown))}")
+	options = dict(ASSET_OPTIONS, **defaults)
+	options.update(entry)
+
+	if not options["input"]:
+		raise ValueError(f"Manifest asset {index}: no input")
+	if not options["output"]:
+		raise ValueError(f"Manifest asset {index}: no output folder and no default output")
+	if isinstance(options["formats"], str):
+		options["formats"] = [options["formats"]]
+	unknownFormats = [name for name in options["formats"] if name not in EXPORT_BACKENDS]
+	if unknownFormats or not options["formats"]:
+		raise ValueError(f"Manifest asset {index}: unknown export formats {unknownFormats or options['formats']}")
+	if options["budget"] is not None and options["budget"] not in BUDGET_POLICIES:
+		raise ValueError(f"Manifest asset {index}: unknown budget policy {options['budget']}")
+	if options["polyreduceTarget"] is not None and int(options["polyreduceTarget"]) <= 0:
+		raise ValueError(f"Manifest asset {index}: polyreduceTarget must be positive")
+	if options["lods"] and any(not 0.0 < float(target) <= 1.0 for target in options["lods"]):
+		raise ValueError(f"Manifest asset {index}: lods must be fractions in (0, 1]")
+	if options["lodWorkers"] is not None and int(options["lodWorkers"]) <= 0:
+		raise ValueError(f"Manifest asset {index}: lodWorkers must be positive")
+
+	options["input"] = _resolve(options["input"], folder)
+	options["output"] = _resolve(options["output"], folder)
+	return ManifestAsset(**options)
+
+
+def load_manifest(path, output=None):
+	''' Read a JSON or YAML manifest and return its ManifestAssets.
+
+	The manifest is either a list of assets or a dict with "assets" and
+	optional "defaults"; an asset is an input path or a dict of
+	ASSET_OPTIONS. Relative paths are resolved against the manifest folder,
+	output is the export folder for assets that name none.
+	'''
+	with open(path, "r") as f:
+		if path.endswith((".yaml", ".yml")):
+			import yaml  # Only needed for YAML manifests
+			data = yaml.safe_load(f)
+		else:
+			data = json.load(f)
+
+	if isinstance(data, list):
+		data = {"assets": data}
+	defaults = dict(data.get("defaults") or {})
+	unknown = set(defaults) - set(ASSET_OPTIONS)
+	if unknown:
+		raise ValueError(f"Manifest defaults: unknown options {', '.join(sorted(unknown))}")
+	if output and not defaults.get("output"):
+		defaults["output"] = os.path.abspath(output)
+
+	folder = os.path.dirname(os.path.abspath(path))
+	return [_asset_from_entry(entry, defaults, folder, index) for index, entry in enumerate(data.get("assets") or [])]
+
+
+def run_manifest(assets, reuseNetwork=True):
+	''' Process every ManifestAsset in this process and return the results document. '''
+	if _batch_runner._workerRoot is None:
+		_batch_runner._init_worker()
+
+	logger.info("Running manifest of %s assets", len(assets))
+	start_time = time.time()
+	results = []
+	for index, asset in enumerate(assets):
+		QUEUE_DEPTH.set(len(assets) - index)
+		os.makedirs(asset.output, exist_ok=True)
+		if not os.path.isfile(asset.input):
+			result = {
+				"asset": os.path.basename(asset.input).split(".")[0],
+				"importPath": asset.input,
+				"exportPath": asset.output,
+				"status": "failed",
+				"elapsed": 0.0,
+				"stages": {},
+				"error": f"FileNotFoundError: {asset.input}",
+			}
+		else:
+			result = _batch_runner.process_asset(
+				asset.input, asset.output, asset.remesh, reuseNetwork, asset.pipelineOptions(), asset.lods, asset.lodWorkers
+			)
+		result["options"] = asset.to_dict()
+		result["outputs"] = {name: export["path"] for name, export in (result.get("exports") or {}).items()}
+		if result["status"] == "ok":
+			logger.info("Processed %s in %.2f seconds", result["asset"], result["elapsed"])
+		else:
+			logger.error("Failed %s: %s", result["asset"], result["error"])
+		observe_result(result, stages=False)  # Cooked here, the controller observed the stage times
+		results.append(result)
+	QUEUE_DEPTH.set(0)
+
+	wallTime = time.time() - start_time
+	failed = sum(1 for result in results if result["status"] != "ok")
+	return {
+		"total": len(results),
+		"succeeded": len(results) - failed,
+		"failed": failed,
+		"wallTime": wallTime,
+		"results": results,
+	}
@@ -0,0 +1,214 @@
+# core/batch/_scheduler.py
+
+import os
+import json
+import time
+import heapq
+import sqlite3
+
+from uv_tool.utils._logger import logger
+from uv_tool.core.preflight import scan_asset
+from uv_tool.core.preflight._obj_scanner import DEFAULT_COST_MODEL
+
+SCHEDULES = ("longest", "fifo")  # Longest predicted job first, or input order
+MIN_SAMPLES = 3  # Keep the default model until this many runs are recorded
+MAX_SAMPLES = 2000  # Fit on the most recent runs only, so the model follows the farm
+OTHER_STAGE = "other"  # Elapsed time outside the recorded stages: network build, waits, teardown
+SAMPLE_CHUNKS = 16  # Evenly spaced reads the triangle count of a large OBJ is estimated from
+SAMPLE_CHUNK_BYTES = 64 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS timings (
+	id INTEGER PRIMARY KEY AUTOINCREMENT,
+	importPath TEXT NOT NULL,
+	sizeBytes INTEGER NOT NULL,
+	faces REAL NOT NULL,
+	scanned INTEGER NOT NULL,
+	predicted REAL,
+	actual REAL NOT NULL,
+	stages TEXT NOT NULL,
+	recordedAt REAL NOT NULL
+);
+"""
+
+
+def _fit_line(samples):
+	''' Least-squares seconds = base + perFace * faces, with neither term negative. '''
+	count = len(samples)
+	meanFaces = sum(faces for faces, _ in samples) / count
+	meanSeconds = sum(seconds for _, seconds in samples) / count
+	spread = sum((faces - meanFaces) ** 2 for faces, _ in samples)
+	if not spread:
+		return {"base": meanSeconds, "perFace": 0.0}
+	perFace = sum((faces - meanFaces) * (seconds - meanSeconds) for faces, seconds in samples) / spread
+	perFace = max(0.0, perFace)
+	return {"base": max(0.0, meanSeconds - perFace * meanFaces), "perFace": perFace}
+
+
+def fit_cost_model(samples, default=None):
+	''' Fit a cost model from recorded runs, or return default with too few of them.
+
+	Each sample is a dict with faces, actual (seconds) and stages (the
+	controller's stageTimes). Every stage gets its own line, and whatever
+	the stages do not account for goes into "other"; the model's base and
+	perFace are their sums, so estimate_cost can use it as is. bytesPerFace
+	comes from the OBJ files that were scanned, for guessing the face count
+	of files that cannot be.
+	'''
+	default = default or DEFAULT_COST_MODEL
+	if len(samples) < MIN_SAMPLES:
+		return dict(default)
+
+	points = {}
+	for sample in samples:
+		stages = {name: seconds for name, seconds in sample["stages"].items() if seconds is not None}
+		stages[OTHER_STAGE] = max(0.0, sample["actual"] - sum(stages.values()))
+		for name, seconds in stages.items():
+			points.setdefault(name, []).append((sample["faces"], seconds))
+
+	stages = {name: _fit_line(values) for name, values in points.items()}
+	ratios = sorted(sample["sizeBytes"] / sample["faces"] for sample in samples if sample["scanned"] and sample["faces"])
+	return {
+		"base": sum(stage["base"] for stage in stages.values()),
+		"perFace": sum(stage["perFace"] for stage in stages.values()),
+		"bytesPerFace": ratios[len(ratios) // 2] if ratios else default["bytesPerFace"],
+		"stages": stages,
+		"samples": len(samples),
+	}
+
+
+class CostHistory:
+	''' Actual and predicted run times of past assets in a local SQLite file, to fit the cost model from. '''
+	def __init__(self, path):
+		self.path = path
+		folder = os.path.dirname(os.path.abspath(path))
+		os.makedirs(folder, exist_ok=True)
+		self.connection = sqlite3.connect(path, timeout=30.0, isolation_level=None)
+		self.connection.row_factory = sqlite3.Row
+		self.connection.execute("PRAGMA journal_mode=WAL")  # Several batches may share one history
+		self.connection.executescript(SCHEMA)
+
+	def close(self):
+		self.connection.close()
+
+	def record(self, job, result):
+		''' Store the actual time of a successful job next to what was predicted for it. '''
+		if result["status"] != "ok":
+			return  # A failed run says nothing about how long the asset takes
+		self.connection.execute(
+			"INSERT INTO timings (importPath, sizeBytes, faces, scanned, predicted, actual, stages, recordedAt) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+			(job.path, job.sizeBytes, job.faces, int(job.scanned), job.predicted, result["elapsed"], json.dumps(result["stages"]), time.time())
+		)
+
+	def samples(self, limit=MAX_SAMPLES):
+		rows = self.connection.execute("SELECT * FROM timings ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+		return [dict(row, stages=json.loads(row["stages"])) for row in rows]
+
+	def fit(self, default=None):
+		return fit_cost_model(self.samples(), default)
+
+	def accuracy(self, limit=MAX_SAMPLES):
+		''' Mean absolute and relative error of the recorded predictions. '''
+		rows = [row for row in self.samples(limit) if row["predicted"] is not None]
+		if not rows:
+			return {"samples": 0, "meanAbsoluteError": None, "meanRelativeError": None}
+		errors = [abs(row["predicted"] - row["actual"]) for row in rows]
+		return {
+			"samples": len(rows),
+			"meanAbsoluteError": sum(errors) / len(rows),
+			"meanRelativeError": sum(error / row["actual"] for error, row in zip(errors, rows) if row["actual"]) / len(rows),
+		}
+
+
+class Job:
+	''' One asset of a batch and how long it is expected to take. '''
+	def __init__(self, path, sizeBytes, faces, scanned, predicted):
+		self.path = path
+		self.sizeBytes = sizeBytes
+		self.faces = faces
+		self.scanned = scanned  # False when faces was guessed from the file size
+		self.predicted = predicted
+
+	def to_dict(self):
+		return {"path": self.path, "sizeBytes": self.sizeBytes, "faces": self.faces, "scanned": self.scanned, "predicted": self.predicted}
+
+
+def estimate_faces(path, sizeBytes):
+	''' Return the triangle count of an OBJ file, or None for other formats.
+
+	Small files are scanned. Larger ones are estimated from SAMPLE_CHUNKS
+	evenly spaced chunks, since faces and vertices may sit anywhere in the
+	file, so planning reads a bounded amount however big the asset is.
+	'''
+	if not path.lower().endswith(".obj"):
+		return None
+	if sizeBytes <= SAMPLE_CHUNKS * SAMPLE_CHUNK_BYTES:
+		scan = scan_asset(path)
+		return scan.triangles or scan.faces
+	sampledBytes = triangles = 0
+	step = (sizeBytes - SAMPLE_CHUNK_BYTES) / (SAMPLE_CHUNKS - 1)
+	with open(path, "rb") as f:
+		for index in range(SAMPLE_CHUNKS):
+			f.seek(int(index * step))
+			for line in f.read(SAMPLE_CHUNK_BYTES).split(b"\n")[1:-1]:  # Drop the lines cut by the chunk edges
+				sampledBytes += len(line) + 1
+				if line[:2] == b"f ":
+					triangles += max(1, len(line.split()) - 3)
+	return triangles * sizeBytes / sampledBytes if sampledBytes else None
+
+
+def predict_job(path, model, scan=True):
+	''' Predict an asset's seconds from its triangle count: read from OBJ files, guessed from the size otherwise or without scan. '''
+	sizeBytes = os.path.getsize(path)
+	faces = estimate_faces(path, sizeBytes) if scan else None
+	scanned = faces is not None
+	if not scanned:
+		faces = sizeBytes / model["bytesPerFace"]
+	return Job(path, sizeBytes, faces, scanned, model["base"] + model["perFace"] * faces)
+
+
+def schedule_jobs(jobs, schedule="longest"):
+	''' Return jobs in dispatch order. Longest-first keeps a big asset from starting last and leaving the other workers idle. '''
+	if schedule not in SCHEDULES:
+		raise ValueError(f"Unknown schedule: {schedule}")
+	if schedule == "fifo":
+		return list(jobs)
+	return sorted(jobs, key=lambda job: job.predicted, reverse=True)
+
+
+def simulate_makespan(durations, workers):
+	''' Finish time of durations dispatched in order, each to the first worker that is free. '''
+	finishTimes = [0.0] * max(1, workers)
+	for duration in durations:
+		heapq.heappush(finishTimes, heapq.heappop(finishTimes) + duration)
+	return max(finishTimes)
+
+
+def schedule_report(jobs, order, results, workers, wallTime, schedule, model):
+	''' Compare the predicted and simulated makespans with the real one.
+
+	jobs is the input order and order the dispatch order; the simulations
+	replay the actual durations, so simulatedFifo shows what input order
+	would have cost on this batch.
+	'''
+	elapsed = {result["importPath"]: result["elapsed"] for result in results}
+	errors = [abs(job.predicted - elapsed[job.path]) for job in jobs if job.path in elapsed]
+	return {
+		"schedule": schedule,
+		"modelSamples": model.get("samples", 0),
+		"predictedMakespan": simulate_makespan([job.predicted for job in order], workers),
+		"simulatedMakespan": simulate_makespan([elapsed.get(job.path, 0.0) for job in order], workers),
+		"simulatedFifoMakespan": simulate_makespan([elapsed.get(job.path, 0.0) for job in jobs], workers),
+		"actualMakespan": wallTime,
+		"meanAbsoluteError": sum(errors) / len(errors) if errors else None,
+	}
+
+
+def plan_batch(assets, schedule="longest", history=None):
+	''' Predict every asset with the model fitted from history and return (jobs, dispatch order, model). '''
+	model = history.fit() if history is not None else dict(DEFAULT_COST_MODEL)
+	jobs = [predict_job(path, model, scan=schedule != "fifo") for path in assets]  # Input order needs no face counts
+	order = schedule_jobs(jobs, schedule)
+	logger.info("Scheduled %s assets %s, %s seconds predicted in total (model from %s runs)",
+		len(jobs), "longest first" if schedule == "longest" else "in input order", round(sum(job.predicted for job in jobs), 1), model.get("samples", 0))
+	return jobs, order, model
@@ -0,0 +1,247 @@
+# core/batch/_worker_pool.py
+
+import os
+import collections
+import pickle
+import weakref
+import itertools
+import threading
+from concurrent.futures import Future
+from multiprocessing.connection import wait
+
+from uv_tool.utils._logger import logger
+from uv_tool.utils._memory import process_rss, format_bytes
+
+_POLL_SECONDS = 0.5  # How often the collector checks for shutdown
+
+_workerSlot = None  # Pool slot of this worker process; a replacement takes over its slot
+
+
+class WorkerLost(RuntimeError):
+	''' The worker process running a task exited without returning a result. '''
+
+
+def worker_slot():
+	''' Return the RecyclingPool slot of this process, or None outside a pool worker. '''
+	return _workerSlot
+
+
+def _retire(taskPipe):
+	''' Tell a worker to exit and close its task pipe. '''
+	try:
+		taskPipe.send(None)  # With fork, other workers may hold this pipe open too, so closing alone is not enough
+	except OSError:
+		pass  # Already gone
+	taskPipe.close()
+
+
+def _retire_all(taskPipes):
+	for taskPipe in list(taskPipes.values()):
+		_retire(taskPipe)
+
+
+def _run_task(function, args):
+	''' Return (result, error) of one task, both safe to send back to the pool. '''
+	try:
+		result = function(*args)
+		pickle.dumps(result)
+		return result, None
+	except BaseException as e:
+		try:
+			pickle.dumps(e)
+		except Exception:
+			e = RuntimeError(f"{type(e).__name__}: {e}")  # Only picklable errors can be sent back
+		return None, e
+
+
+def _recycling_worker(tasks, results, initializer, maxAssets, maxRss, slot):
+	''' Run the tasks the pool sends until it sends None or this process has done enough work.
+	Both pipes belong to this worker alone, so the pool knows which task it holds at every moment. '''
+	global _workerSlot
+	_workerSlot = slot
+	if initializer:
+		initializer()
+	pid = os.getpid()
+	done = 0
+	while True:
+		try:
+			task = tasks.recv()
+		except EOFError:
+			break  # The pool is gone
+		if task is None:
+			break  # The pool has no more work for this worker
+		taskId, function, args = task
+		result, error = _run_task(function, args)
+		done += 1
+
+		rss = process_rss()
+		recycle = None
+		if maxAssets and done >= maxAssets:
+			recycle = f"{done} assets"
+		elif maxRss and rss and rss > maxRss:
+			recycle = f"RSS {format_bytes(rss)}"
+		results.send(("done", taskId, pid, result, error, recycle))
+		if recycle:
+			break
+
+
+class RecyclingPool:
+	''' A process pool that replaces a worker after maxAssets tasks or once its RSS passes maxRss.
+
+	Houdini never gives all the memory of cooked networks back, so a
+	long-lived worker grows until it is killed. Here a worker checks itself
+	after every task and exits cleanly when it is due, and the pool starts a
+	fresh one. The pool hands each task to an idle worker over that
+	worker's own pipe and records the assignment before sending, so a
+	worker that dies at any point fails only its own task's future, with
+	WorkerLost. Results come back over a second pipe per worker, whose end
+	of file marks the exit after every message it sent. submit() returns
+	concurrent.futures.Futures, so callers can use wait() and as_completed()
+	as with a ProcessPoolExecutor.
+	'''
+	def __init__(self, workers, context, initializer=None, maxAssets=None, maxRss=None):
+		self.workers = workers
+		self.context = context
+		self.initializer = initializer
+		self.maxAssets = maxAssets
+		self.maxRss = maxRss
+		self.recycled = 0  # Workers replaced because they were due
+
+		self._ids = itertools.count()
+		self._pending = collections.deque()  # (task id, function, args) not yet handed to a worker
+		self._futures = {}  # Task id -> Future
+		self._running = {}  # Worker pid -> task id
+		self._idle = collections.deque()  # Worker pids waiting for a task
+		self._processes = {}  # Worker pid -> Process
+		self._slots = {}  # Worker pid -> slot, 0 to workers - 1
+		self._connections = {}  # Worker pid -> reading end of its result pipe
+		self._taskPipes = {}  # Worker pid -> writing end of its task pipe
+		self._lock = threading.RLock()
+		self._closing = False
+		# Workers are not daemonic, so they may start processes of their own (LOD branches);
+		# at interpreter exit they are told to stop, or multiprocessing would wait on them forever
+		weakref.finalize(self, _retire_all, self._taskPipes)
+
+		for slot in range(workers):
+			self._spawn(slot)
+		self._collector = threading.Thread(target=self._collect, name="RecyclingPoolCollector", daemon=True)
+		self._collector.start()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args):
+		self.shutdown(wait=True)
+
+	def _spawn(self, slot):
+		taskReader, taskWriter = self.context.Pipe(duplex=False)
+		resultReader, resultWriter = self.context.Pipe(duplex=False)
+		process = self.context.Process(
+			target=_recycling_worker,
+			args=(taskReader, resultWriter, self.initializer, self.maxAssets, self.maxRss, slot),
+			daemon=False
+		)
+		process.start()
+		taskReader.close()
+		resultWriter.close()  # Only the worker may hold it, so its exit closes the pipe
+		with self._lock:
+			self._processes[process.pid] = process
+			self._slots[process.pid] = slot
+			self._connections[process.pid] = resultReader
+			self._taskPipes[process.pid] = taskWriter
+			self._idle.append(process.pid)
+
+	def submit(self, function, *args):
+		if self._closing:
+			raise RuntimeError("Cannot submit to a pool that is shutting down")
+		future = Future()
+		future.set_running_or_notify_cancel()
+		with self._lock:
+			taskId = next(self._ids)
+			self._futures[taskId] = future
+			self._pending.append((taskId, function, args))
+		self._dispatch()
+		return future
+
+	def _resolve(self, taskId, result=None, error=None):
+		with self._lock:
+			future = self._futures.pop(taskId, None)
+		if future is None:
+			return
+		if error is not None:
+			future.set_exception(error)
+		else:
+			future.set_result(result)
+
+	def _dispatch(self):
+		''' Hand queued tasks to idle workers, and once shutting down with nothing queued, let the idle workers exit. '''
+		with self._lock:
+			while self._idle and self._pending:
+				pid = self._idle.popleft()
+				task = self._pending.popleft()
+				self._running[pid] = task[0]  # Recorded first, so a death from here on fails this task
+				try:
+					self._taskPipes[pid].send(task)
+				except OSError:
+					self._running.pop(pid)
+					self._pending.appendleft(task)  # The worker is already gone and never saw it
+				except Exception as e:
+					self._running.pop(pid)
+					self._idle.appendleft(pid)
+					self._resolve(task[0], error=e)  # The task itself cannot be pickled
+			if self._closing and not self._pending:
+				while self._idle:
+					_retire(self._taskPipes.pop(self._idle.popleft()))
+
+	def _handle(self, message):
+		kind, taskId, pid, result, error, recycle = message
+		with self._lock:
+			self._running.pop(pid, None)
+			if not recycle:
+				self._idle.append(pid)
+		self._resolve(taskId, result, error)
+		if recycle:
+			self.recycled += 1
+			logger.info("Recycling worker %s after %s", pid, recycle)
+
+	def _reap(self, pid):
+		process = self._processes.pop(pid)
+		slot = self._slots.pop(pid)
+		self._connections.pop(pid).close()
+		process.join()
+		with self._lock:
+			taskPipe = self._taskPipes.pop(pid, None)
+			if pid in self._idle:
+				self._idle.remove(pid)
+			taskId = self._running.pop(pid, None)
+		if taskPipe is not None:
+			taskPipe.close()
+		if taskId is not None:
+			logger.error("Worker %s exited with code %s while running a task", pid, process.exitcode)
+			self._resolve(taskId, error=WorkerLost(f"Worker {pid} exited with code {process.exitcode}"))
+		# Keep the pool at full size, and while shutting down until the queued tasks are handed out
+		if not self._closing or self._pending:
+			self._spawn(slot)
+
+	def _collect(self):
+		while not self._closing or self._processes:
+			connections = {connection: pid for pid, connection in self._connections.items()}
+			for connection in wait(list(connections), timeout=_POLL_SECONDS):
+				try:
+					self._handle(connection.recv())
+				except (EOFError, OSError):
+					self._reap(connections[connection])  # Every message is read, the worker is gone
+			self._dispatch()
+
+	def shutdown(self, wait=True, cancel_futures=False):
+		''' Stop the workers once the queued tasks are done, or drop the queued tasks with cancel_futures. '''
+		if cancel_futures:
+			with self._lock:
+				cancelled = list(self._pending)
+				self._pending.clear()
+			for task in cancelled:
+				self._resolve(task[0], error=WorkerLost("Pool shut down before the task started"))
+		self._closing = True
+		self._dispatch()
+		if wait:
+			self._collector.join()
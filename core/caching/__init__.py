@@ -1 +1,3 @@
-from ._export_ops import createFileCache, createOutputNode, createExportNode
\ No newline at end of file
+from ._export_ops import exportFilePath
+from ._export_backends import write_exports, EXPORT_BACKENDS, DEFAULT_EXPORT_FORMATS
+from ._result_cache import ResultCache, compute_cache_key, hash_file
\ No newline at end of file
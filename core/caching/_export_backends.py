@@ -0,0 +1,191 @@
+# core/caching/_export_backends.py
+
+import os
+import sys
+import json
+import time
+import uuid
+import struct
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+from uv_tool.utils._logger import logger
+from uv_tool.core.caching._export_ops import exportFilePath
+
+DEFAULT_EXPORT_FORMATS = ("fbx",)  # The original single FBX output
+TRIANGLE_POSITION_ATTRIB = "metricP"  # Point positions promoted to vertices on the UV network's triangle branch
+
+
+def _write_fbx(exportNode, geometry, path):
+	""" Render the rop_fbx node to path."""
+	finalPath = exportNode.parm("sopoutput").eval()
+	exportNode.parm("sopoutput").set(path)
+	try:
+		exportNode.parm("execute").pressButton() # Same as clicking Save to Disk
+	finally:
+		exportNode.parm("sopoutput").set(finalPath)
+
+
+def _write_native(exportNode, geometry, path):
+	""" Save the geometry with Houdini's own writer, chosen by the file extension."""
+	geometry.saveToFile(path)
+
+
+def _triangle_arrays(geometry):
+	""" Read triangles with positions and UVs on every vertex in two bulk calls, the layout _mesh_arrays builds."""
+	positions, sourceUVs = array("f"), array("f")
+	positions.frombytes(geometry.vertexFloatAttribValuesAsString(TRIANGLE_POSITION_ATTRIB))
+	sourceUVs.frombytes(geometry.vertexFloatAttribValuesAsString("uv"))
+	count = len(positions) // 3
+	stride = len(sourceUVs) // count if count else 2 # uv is usually a float3
+
+	uvs = array("f", bytes(8 * count))
+	uvs[0::2] = sourceUVs[0::stride]
+	uvs[1::2] = array("f", map((1.0).__sub__, sourceUVs[1::stride])) # glTF texture space starts at the top
+	indices = array("I", range(count))
+	indices[1::3], indices[2::3] = indices[2::3], indices[1::3] # Houdini winds clockwise, glTF counter-clockwise
+	return positions, uvs, indices
+
+
+def _mesh_arrays(geometry):
+	""" Flatten polygons into per-vertex positions and UVs plus a triangle index list, one vertex at a time."""
+	positions, uvs, indices = array("f"), array("f"), array("I")
+	uvAttrib = geometry.findVertexAttrib("uv")
+	pointUVAttrib = geometry.findPointAttrib("uv") if uvAttrib is None else None
+
+	for prim in geometry.prims():
+		vertices = prim.vertices()
+		base = len(positions) // 3
+		for vertex in vertices:
+			point = vertex.point()
+			positions.extend(point.position())
+			if uvAttrib is not None:
+				uv = vertex.attribValue(uvAttrib)
+			elif pointUVAttrib is not None:
+				uv = point.attribValue(pointUVAttrib)
+			else:
+				uv = (0.0, 0.0)
+			uvs.extend((uv[0], 1.0 - uv[1])) # glTF texture space starts at the top
+		for i in range(1, len(vertices) - 1):
+			indices.extend((base, base + i + 1, base + i)) # Houdini winds clockwise, glTF counter-clockwise
+
+	return positions, uvs, indices
+
+
+def _write_gltf(exportNode, geometry, path):
+	""" Write the geometry as a single-mesh binary glTF (.glb) with positions and UVs.
+	Triangles from the UV network's triangle branch are read in bulk, any other polygons vertex by vertex."""
+	if geometry.findVertexAttrib(TRIANGLE_POSITION_ATTRIB) is not None:
+		positions, uvs, indices = _triangle_arrays(geometry)
+	else:
+		positions, uvs, indices = _mesh_arrays(geometry)
+	if sys.byteorder != "little":
+		for data in (positions, uvs, indices):
+			data.byteswap() # glTF buffers are little endian
+
+	blobs = [positions.tobytes(), uvs.tobytes(), indices.tobytes()]
+	views, offset = [], 0
+	for blob, target in zip(blobs, (34962, 34962, 34963)): # ARRAY_BUFFER, ARRAY_BUFFER, ELEMENT_ARRAY_BUFFER
+		views.append({"buffer": 0, "byteOffset": offset, "byteLength": len(blob), "target": target})
+		offset += len(blob)
+
+	count = len(positions) // 3
+	bounds = [positions[axis::3] for axis in range(3)]
+	document = {
+		"asset": {"version": "2.0", "generator": "uv_tool"},
+		"scene": 0,
+		"scenes": [{"nodes": [0]}],
+		"nodes": [{"mesh": 0}],
+		"meshes": [{"primitives": [{"attributes": {"POSITION": 0, "TEXCOORD_0": 1}, "indices": 2}]}],
+		"buffers": [{"byteLength": offset}],
+		"bufferViews": views,
+		"accessors": [
+			{
+				"bufferView": 0, "componentType": 5126, "count": count, "type": "VEC3",
+				"min": [min(values) if count else 0.0 for values in bounds],
+				"max": [max(values) if count else 0.0 for values in bounds],
+			},
+			{"bufferView": 1, "componentType": 5126, "count": count, "type": "VEC2"},
+			{"bufferView": 2, "componentType": 5125, "count": len(indices), "type": "SCALAR"},
+		],
+	}
+
+	jsonChunk = json.dumps(document, separators=(",", ":")).encode("utf-8")
+	jsonChunk += b" " * (-len(jsonChunk) % 4) # Chunks are 4 byte aligned
+	binChunk = b"".join(blobs) # Every blob is a multiple of 4 bytes already
+	with open(path, "wb") as f:
+		f.write(struct.pack("<III", 0x46546C67, 2, 12 + 8 + len(jsonChunk) + 8 + len(binChunk)))
+		f.write(struct.pack("<II", len(jsonChunk), 0x4E4F534A) + jsonChunk)
+		f.write(struct.pack("<II", len(binChunk), 0x004E4942) + binChunk)
+
+
+EXPORT_BACKENDS = {
+	"fbx": (".fbx", _write_fbx),
+	"bgeo": (".bgeo.sc", _write_native),
+	"obj": (".obj", _write_native),
+	"gltf": (".glb", _write_gltf),
+}
+
+
+def _create_temp(path):
+	""" Create an empty hidden file beside path, with the mode any new file gets under the umask."""
+	folder, name = os.path.split(path)
+	extension = name[name.index("."):] # Houdini picks the writer from the extension, so keep it
+	while True:
+		tempPath = os.path.join(folder, f".{name}_{uuid.uuid4().hex[:8]}{extension}")
+		try:
+			os.close(os.open(tempPath, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)) # Not private like mkstemp files
+			return tempPath
+		except FileExistsError:
+			continue
+
+
+def _write_atomic(writer, exportNode, geometry, path):
+	""" Write to a hidden temp file beside path, then rename it into place."""
+	tempPath = _create_temp(path)
+	start_time = time.time()
+	try:
+		writer(exportNode, geometry, tempPath)
+		os.replace(tempPath, path) # Readers never see a partial file
+	except Exception:
+		if os.path.exists(tempPath):
+			os.remove(tempPath)
+		raise
+	return {"path": path, "seconds": time.time() - start_time, "bytes": os.path.getsize(path)}
+
+
+def write_exports(exportNode, outputNode, exportPath, assetName, formats=DEFAULT_EXPORT_FORMATS, triangleNode=None):
+	""" Write the output geometry in every requested format and return {format: path, seconds, bytes}.
+
+	The geometry is cooked and frozen once. The non-FBX backends write it on
+	worker threads, while the FBX ROP renders on the calling thread, because
+	nodes must only be touched from there. triangleNode, the triangulated
+	copy of the output with positions on its vertices, lets the glTF
+	backend read its arrays in bulk.
+	"""
+	unknown = [name for name in formats if name not in EXPORT_BACKENDS]
+	if unknown:
+		raise ValueError(f"Unknown export format: {', '.join(unknown)}")
+
+	os.makedirs(exportPath, exist_ok=True)
+	paths = {name: exportFilePath(exportPath, assetName, EXPORT_BACKENDS[name][0]) for name in formats}
+	geometry = outputNode.geometry().freeze() # Detached copy, safe to read off the main thread
+	sources = {name: geometry for name in formats}
+	if triangleNode is not None and "gltf" in formats:
+		sources["gltf"] = triangleNode.geometry().freeze()
+	threaded = [name for name in formats if name != "fbx"]
+
+	results = {}
+	with ThreadPoolExecutor(max_workers=max(1, len(threaded))) as pool:
+		futures = {
+			name: pool.submit(_write_atomic, EXPORT_BACKENDS[name][1], exportNode, sources[name], paths[name])
+			for name in threaded
+		}
+		if "fbx" in paths:
+			results["fbx"] = _write_atomic(_write_fbx, exportNode, geometry, paths["fbx"])
+		for name, future in futures.items():
+			results[name] = future.result()
+
+	for name, result in results.items():
+		logger.info("Exported %s in %.2f seconds (%s bytes): %s", name, result["seconds"], result["bytes"], result["path"])
+	return results
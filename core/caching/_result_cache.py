@@ -0,0 +1,184 @@
+# core/caching/_result_cache.py
+
+import os
+import json
+import hashlib
+import tempfile
+from contextlib import contextmanager
+
+from uv_tool.utils._logger import logger
+
+CACHE_EXTENSION = ".bgeo.sc"  # Native compressed geometry for cache entries
+DEFAULT_MAX_BYTES = 10 * 1024 ** 3  # 10 GB unless UV_TOOL_CACHE_BYTES overrides it
+SOURCE_NODE_TYPES = ("file", "object_merge")  # Nodes whose inputs are hashed separately
+
+
+@contextmanager
+def _cacheLock(cacheDir):
+	''' Hold an exclusive lock on the cache directory across processes. '''
+	lockFile = open(os.path.join(cacheDir, ".lock"), "a+")
+	try:
+		if os.name == "nt":
+			import msvcrt
+			lockFile.seek(0)
+			msvcrt.locking(lockFile.fileno(), msvcrt.LK_LOCK, 1)  # Retries for ~10s before raising
+		else:
+			import fcntl
+			fcntl.flock(lockFile.fileno(), fcntl.LOCK_EX)
+		yield
+	finally:
+		try:
+			if os.name == "nt":
+				import msvcrt
+				lockFile.seek(0)
+				msvcrt.locking(lockFile.fileno(), msvcrt.LK_UNLCK, 1)
+			else:
+				import fcntl
+				fcntl.flock(lockFile.fileno(), fcntl.LOCK_UN)
+		finally:
+			lockFile.close()
+
+
+def hash_file(path, chunkSize=1024 * 1024):
+	''' Return the SHA-256 of a file's contents, read in chunks. '''
+	digest = hashlib.sha256()
+	with open(path, "rb") as f:
+		for chunk in iter(lambda: f.read(chunkSize), b""):
+			digest.update(chunk)
+	return digest.hexdigest()
+
+
+def upstream_parms(node):
+	''' Collect the effective parms of every node feeding into the given node.
+
+	The walk stops at file and object_merge nodes, whose sources are part of
+	the key through the input hash instead of their (machine specific) paths.
+	'''
+	parms = {}
+	stack = [n for n in node.inputs() if n is not None]
+	while stack:
+		current = stack.pop()
+		if current.path() in parms:
+			continue
+		nodeType = current.type().name()
+		values = {}
+		if nodeType not in SOURCE_NODE_TYPES:
+			values = {parm.name(): parm.evalAsString() for parm in current.parms()}
+			values["__bypassed"] = current.isBypassed()  # A bypassed node passes its input through
+			stack.extend(n for n in current.inputs() if n is not None)
+		# Key by name rather than path so the key is the same in every network
+		parms[current.path()] = (current.name(), nodeType, values)
+
+	return {name: [nodeType, values] for name, nodeType, values in parms.values()}
+
+
+def compute_cache_key(sourceHash, node):
+	''' Combine a source hash and the node's upstream parms into a cache key. '''
+	payload = json.dumps({"source": sourceHash, "parms": upstream_parms(node)}, sort_keys=True)
+	return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+	''' Content-addressed geometry cache shared by every run and worker.
+
+	Entries are <key>.bgeo.sc files in one directory. A hit refreshes the
+	entry's mtime, which is what LRU eviction orders by once the directory
+	grows past maxBytes. Writes go to a temp file and are renamed into place
+	under the directory lock, so concurrent workers never see partial files.
+	'''
+	def __init__(self, cacheDir=None, maxBytes=None):
+		self.cacheDir = cacheDir or os.path.join(tempfile.gettempdir(), "uv_tool_cache")
+		self.maxBytes = maxBytes or int(os.environ.get("UV_TOOL_CACHE_BYTES", DEFAULT_MAX_BYTES))
+		self.hits = 0
+		self.misses = 0
+		os.makedirs(self.cacheDir, exist_ok=True)
+
+	def entryPath(self, key):
+		return os.path.join(self.cacheDir, key + CACHE_EXTENSION)
+
+	def lookup(self, key):
+		''' Return the entry path for key and mark it recently used, or None. '''
+		path = self.entryPath(key)
+		with _cacheLock(self.cacheDir):
+			if not os.path.exists(path):
+				self.misses += 1
+				return None
+			os.utime(path, None)  # Refresh the LRU position
+
+		self.hits += 1
+		logger.info("Cache hit: %s", key[:12])
+		return path
+
+	def store(self, key, geometry):
+		''' Save cooked geometry as the entry for key and evict to the budget. '''
+		path = self.entryPath(key)
+		fd, tempPath = tempfile.mkstemp(prefix=f".{key[:12]}_", suffix=CACHE_EXTENSION, dir=self.cacheDir)
+		os.close(fd)
+		try:
+			geometry.saveToFile(tempPath)
+			with _cacheLock(self.cacheDir):
+				os.replace(tempPath, path)  # Atomic on the same filesystem
+				self._evict(keep=path)
+		except Exception:
+			if os.path.exists(tempPath):
+				os.remove(tempPath)
+			raise
+
+		logger.info("Cache stored: %s", key[:12])
+		return path
+
+	def bind(self, fileCacheNode, key):
+		''' Point a filecache node at the entry for key.
+
+		Returns True on a hit, in which case the node loads the entry from
+		disk and nothing upstream of it cooks.
+		'''
+		hit = self.lookup(key) is not None
+		fileCacheNode.parm("filemethod").set(1)  # Explicit file path
+		fileCacheNode.parm("file").set(self.entryPath(key).replace(os.sep, "/"))
+		fileCacheNode.parm("loadfromdisk").set(1 if hit else 0)
+		return hit
+
+	def commit(self, fileCacheNode, key):
+		''' Cook a missed filecache node, store its output, then load from disk. '''
+		fileCacheNode.cook(force=True)
+		self.store(key, fileCacheNode.geometry())
+		fileCacheNode.parm("loadfromdisk").set(1)
+
+	def size(self):
+		return sum(os.path.getsize(path) for path in self._entries())
+
+	def clear(self):
+		with _cacheLock(self.cacheDir):
+			for path in self._entries():
+				os.remove(path)
+
+	def _entries(self):
+		return [
+			os.path.join(self.cacheDir, name)
+			for name in os.listdir(self.cacheDir)
+			if name.endswith(CACHE_EXTENSION) and not name.startswith(".")
+		]
+
+	def _evict(self, keep=None):
+		''' Remove least recently used entries until the budget is met. Caller holds the lock. '''
+		entries = []
+		for path in self._entries():
+			try:
+				stat = os.stat(path)
+			except OSError:
+				continue
+			entries.append((stat.st_mtime, stat.st_size, path))
+
+		total = sum(size for _, size, _ in entries)
+		for _, size, path in sorted(entries):
+			if total <= self.maxBytes:
+				break
+			if path == keep:
+				continue
+			try:
+				os.remove(path)
+				total -= size
+				logger.info("Cache evicted: %s", os.path.basename(path))
+			except OSError as e:
+				logger.error("Failed to evict cache entry: %s", e)
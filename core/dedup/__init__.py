@@ -0,0 +1 @@
+from ._geometry_fingerprint import fingerprint_arrays, geometry_fingerprint
\ No newline at end of file
@@ -0,0 +1,52 @@
+# core/dedup/_geometry_fingerprint.py
+
+import time
+import hashlib
+
+import numpy as np
+
+from uv_tool.utils._logger import logger
+
+POSITION_ATTRIB = "fingerprintP"  # Point positions on every vertex, written by the fingerprintAttribs node
+POINT_ATTRIB = "fingerprintPoint"  # Point number of every vertex
+COUNT_ATTRIB = "fingerprintCount"  # Vertex count of every vertex's primitive
+DEFAULT_QUANTUM = 1e-4  # Positions closer than this (in scene units) hash the same
+FINGERPRINT_VERSION = 1  # Bump when the hashed layout changes so old cache entries stop matching
+
+
+def fingerprint_arrays(positions, points, counts, quantum=DEFAULT_QUANTUM):
+	''' Hash per-vertex (V, 3) positions, point numbers and primitive sizes, in vertex order.
+
+	Positions are snapped to a grid of quantum so float noise from different
+	exporters does not change the hash. Point numbers are relabelled in order
+	of first use, so the same mesh with its points stored in another order
+	hashes the same while welded and unwelded copies do not. Vertex and
+	primitive order are kept: equal fingerprints have matching vertices, so
+	UVs can be copied across by index.
+	'''
+	positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+	points = np.asarray(points, dtype=np.int64).ravel()
+	counts = np.asarray(counts, dtype=np.int32).ravel()
+
+	quantized = np.rint(positions / quantum).astype(np.int64)
+	_, first, labels = np.unique(points, return_index=True, return_inverse=True)
+	canonical = np.argsort(np.argsort(first))[labels].astype(np.int32)  # Rank of each point's first use
+
+	digest = hashlib.sha256()
+	digest.update(np.array([FINGERPRINT_VERSION, len(quantized), len(first)], dtype=np.int64).tobytes())
+	digest.update(np.array([quantum], dtype=np.float64).tobytes())
+	digest.update(np.ascontiguousarray(quantized).tobytes())
+	digest.update(np.ascontiguousarray(canonical).tobytes())
+	digest.update(np.ascontiguousarray(counts).tobytes())
+	return digest.hexdigest()
+
+
+def geometry_fingerprint(geometry, quantum=DEFAULT_QUANTUM):
+	''' Read the fingerprint attributes of cooked geometry in bulk and return its fingerprint. '''
+	start_time = time.time()
+	positions = np.frombuffer(geometry.vertexFloatAttribValuesAsString(POSITION_ATTRIB), dtype=np.float32)
+	points = np.frombuffer(geometry.vertexIntAttribValuesAsString(POINT_ATTRIB), dtype=np.int32)
+	counts = np.frombuffer(geometry.vertexIntAttribValuesAsString(COUNT_ATTRIB), dtype=np.int32)
+	fingerprint = fingerprint_arrays(positions, points, counts, quantum)
+	logger.info("Geometry fingerprint %s for %s vertices in %.3f seconds", fingerprint[:12], len(points), time.time() - start_time)
+	return fingerprint
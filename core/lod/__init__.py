@@ -0,0 +1 @@
+from ._lod_pipeline import generate_lods, build_lod, cook_shared_stages, shutdown_lod_pool, lod_name, DEFAULT_LOD_TARGETS, LOD_REMESH_PIPELINE
\ No newline at end of file
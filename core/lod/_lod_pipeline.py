@@ -0,0 +1,234 @@
+# core/lod/_lod_pipeline.py
+
+import os
+import sys
+import shutil
+import copy
+import time
+import tempfile
+import traceback
+import multiprocessing
+import multiprocessing.util
+from concurrent.futures import ProcessPoolExecutor
+
+from uv_tool.utils._logger import logger, log_context
+from uv_tool.core._options import PipelineOptions
+from uv_tool.core.nodes import REMESH_PIPELINE, compile_pipeline, get_pipeline_spec, get_budget_policy
+from uv_tool.core.preflight import scan_asset, plan_stages
+
+DEFAULT_LOD_TARGETS = (1.0, 0.5, 0.1, 0.02)  # Fractions of the cleaned polygon count
+SHARED_NODES = ("importFile", "attribDelete", "deleteUCX", "clean")  # Cooked once for every LOD
+CLEAN_EXTENSION = ".bgeo.sc"
+
+# Remesh network of a LOD branch: the shared stages already ran, so they are pass-through nulls
+LOD_REMESH_PIPELINE = copy.deepcopy(REMESH_PIPELINE)
+LOD_REMESH_PIPELINE["name"] = "lod"
+for _node in LOD_REMESH_PIPELINE["nodes"]:
+	if _node["name"] in SHARED_NODES[1:]:
+		_node.update(type="null", parms={})
+
+_lodPool = None  # Process pool kept alive between assets, since hython startup is slow
+_lodPoolSize = 0
+_workerTool = None  # Warm LOD network reused for every branch a worker cooks
+
+
+def lod_name(assetName, index):
+	return f"{assetName}_LOD{index}"
+
+
+def cook_shared_stages(importPath, folder, topNode=None):
+	''' Cook import, attribDelete, deleteUCX and clean once and save the result.
+	Returns the saved file and its polygon count. '''
+	import hou
+
+	assetName = os.path.basename(importPath).split(".")[0]
+	topNode = topNode or hou.node("/obj")
+	geoNode = topNode.createNode("geo", f"{assetName}_lod_shared")
+	try:
+		spec = get_pipeline_spec(None, REMESH_PIPELINE).subset(SHARED_NODES)
+		build = compile_pipeline(geoNode, spec, {"importFile": importPath, "assetName": assetName})
+		scan = scan_asset(importPath)
+		if scan is not None:
+			plan = plan_stages(scan)
+			build["attribDelete"].bypass(plan["attribDelete"])  # No UVs to delete
+			build["deleteUCX"].bypass(plan["deleteUCX"])  # No collision meshes
+
+		geometry = build["clean"].geometry()
+		cleanPath = os.path.join(folder, f"{assetName}_clean{CLEAN_EXTENSION}")
+		geometry.saveToFile(cleanPath)
+		polygons = geometry.intrinsicValue("primitivecount")
+	finally:
+		geoNode.destroy()
+	return cleanPath, polygons
+
+
+def _cook_lod(tool, cleanPath, exportPath, name, finalCount, options, topNode=None):
+	''' Run one LOD branch on tool's network, building it first when tool is None. '''
+	from uv_tool.core._controller import UVToolClass
+
+	options = (options or PipelineOptions()).replace(
+		# Any count is allowed, but never more polygons than the cleaned input has
+		budgetPolicy=get_budget_policy("fixed", count=finalCount, minPolygons=1, maxPolygons=sys.maxsize),
+		preflight=False,
+		pipelineSpecs={"remesh": LOD_REMESH_PIPELINE}
+	)
+	if tool is None:
+		tool = UVToolClass(cleanPath, exportPath, True, options=options, topNode=topNode, assetName=name)
+	else:
+		tool.setOptions(options)
+		tool.loadAsset(cleanPath, exportPath, True, assetName=name)
+	return tool
+
+
+def _lod_result(tool, name, finalCount, start_time):
+	return {
+		"asset": name,
+		"status": "ok",
+		"worker": os.getpid(),
+		"targetPolygons": finalCount,
+		"elapsed": time.time() - start_time,
+		"stages": dict(tool.stageTimes),
+		"exports": tool.exportResults,
+		"outputs": {fmt: export["path"] for fmt, export in tool.exportResults.items()},
+		"uvMetrics": tool.uvMetrics,
+		"error": None,
+	}
+
+
+def _failed_result(name, finalCount, error, start_time):
+	return {
+		"asset": name,
+		"status": "failed",
+		"worker": os.getpid(),
+		"targetPolygons": finalCount,
+		"elapsed": time.time() - start_time,
+		"stages": {},
+		"error": f"{type(error).__name__}: {error}",
+		"traceback": traceback.format_exc(),
+	}
+
+
+def build_lod(cleanPath, exportPath, name, finalCount, options=None):
+	''' Worker task: cook one LOD branch on this process's warm network and return its result. '''
+	global _workerTool
+	from uv_tool.core.batch import _batch_runner
+
+	if _batch_runner._workerRoot is None:
+		_batch_runner._init_worker()
+	start_time = time.time()
+	try:
+		_workerTool = _cook_lod(_workerTool, cleanPath, exportPath, name, finalCount, options, _batch_runner._workerRoot)
+	except Exception as e:
+		if _workerTool is not None:
+			_workerTool.clearNodes()
+		_workerTool = None  # Never reuse a network left in a failed state
+		return _failed_result(name, finalCount, e, start_time)
+	_workerTool.releaseMemory()
+	return _lod_result(_workerTool, name, finalCount, start_time)
+
+
+def _cook_lods_once(cleanPath, exportPath, jobs, options, topNode=None):
+	''' Cook every LOD branch on one network and destroy it afterwards. '''
+	results = []
+	tool = None
+	try:
+		for name, count in jobs:
+			start_time = time.time()
+			try:
+				tool = _cook_lod(tool, cleanPath, exportPath, name, count, options, topNode)
+				results.append(_lod_result(tool, name, count, start_time))
+			except Exception as e:
+				results.append(_failed_result(name, count, e, start_time))
+				if tool is not None:
+					tool.destroyNetwork()
+				tool = None
+	finally:
+		if tool is not None:
+			tool.clearNodes()
+	return results
+
+
+def _get_pool(workers, executable=None):
+	''' Return the shared LOD pool, recreating it if the size changed. '''
+	global _lodPool, _lodPoolSize
+	if _lodPool is None or _lodPoolSize != workers:
+		shutdown_lod_pool()
+		context = multiprocessing.get_context("spawn")  # Never fork a live Houdini session
+		if executable:
+			context.set_executable(executable)
+		from uv_tool.core.batch._batch_runner import _init_pool_worker
+		_lodPool = ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_pool_worker)
+		_lodPoolSize = workers
+		if multiprocessing.parent_process() is not None:
+			# Inside a batch worker: stop the pool before the worker's exit waits on its processes,
+			# and ahead of the finalizers that close the pool's own queues
+			multiprocessing.util.Finalize(None, shutdown_lod_pool, exitpriority=100)
+	return _lodPool
+
+
+def shutdown_lod_pool():
+	''' Stop the LOD worker processes. '''
+	global _lodPool
+	if _lodPool is not None:
+		_lodPool.shutdown()
+		_lodPool = None
+
+
+def generate_lods(importPath, exportPath, targets=DEFAULT_LOD_TARGETS, workers=None, executable=None, options=None, topNode=None, reuseNetwork=False):
+	''' Export <asset>_LOD<n> for every target from one import and clean.
+
+	targets are fractions of the cleaned polygon count, LOD0 first. The
+	shared stages cook once in this process and are saved; each LOD branch
+	then loads that file and runs polyreduce and the UV network. With
+	workers > 1 the branches cook in parallel worker processes, otherwise
+	one after the other on a single network here, which with reuseNetwork
+	stays alive for the next asset (as batch workers do). options is the
+	PipelineOptions of every branch, whose budget, preflight and remesh
+	spec are replaced by the LOD's own.
+	'''
+	targets = list(targets)
+	if not targets or any(not 0.0 < target <= 1.0 for target in targets):
+		raise ValueError(f"LOD targets must be fractions in (0, 1]: {targets}")
+	assetName = os.path.basename(importPath).split(".")[0]
+	folder = tempfile.mkdtemp(prefix="uv_tool_lods_")
+	os.makedirs(exportPath, exist_ok=True)
+	workers = max(1, min(workers or 1, len(targets)))
+
+	with log_context(asset=assetName):
+		start_time = time.time()
+		try:
+			cleanPath, polygons = cook_shared_stages(importPath, folder, topNode)
+			sharedSeconds = time.time() - start_time
+			logger.info("Shared stages for %s cooked once in %.2f seconds (%s polygons)", assetName, sharedSeconds, polygons)
+
+			jobs = [(lod_name(assetName, index), max(1, int(round(polygons * target)))) for index, target in enumerate(targets)]
+			branch_time = time.time()
+			if workers > 1:
+				pool = _get_pool(workers, executable)
+				futures = [pool.submit(build_lod, cleanPath, exportPath, name, count, options) for name, count in jobs]
+				results = [future.result() for future in futures]
+			elif reuseNetwork:
+				results = [build_lod(cleanPath, exportPath, name, count, options) for name, count in jobs]
+			else:
+				results = _cook_lods_once(cleanPath, exportPath, jobs, options, topNode)
+		finally:
+			shutil.rmtree(folder, ignore_errors=True)  # The cleaned geometry is only shared within this call
+
+		for target, result in zip(targets, results):
+			result["target"] = target
+			if result["status"] == "ok":
+				logger.info("Exported %s (%s polygons) in %.2f seconds", result["asset"], result["targetPolygons"], result["elapsed"])
+			else:
+				logger.error("Failed %s: %s", result["asset"], result["error"])
+
+	return {
+		"asset": assetName,
+		"importPath": importPath,
+		"exportPath": exportPath,
+		"polygons": polygons,
+		"sharedSeconds": sharedSeconds,
+		"branchSeconds": time.time() - branch_time,
+		"wallTime": time.time() - start_time,
+		"workers": workers,
+		"lods": results,
+	}
@@ -0,0 +1 @@
+from ._uv_metrics import compute_uv_metrics, measure_geometry, triangle_arrays, uv_islands, uv_coverage
\ No newline at end of file
@@ -0,0 +1,199 @@
+# core/metrics/_uv_metrics.py
+
+import time
+
+import numpy as np
+
+from uv_tool.utils._logger import logger
+
+POSITION_ATTRIB = "metricP"  # Point positions promoted to vertices by the metricsPoints node
+DEFAULT_RESOLUTION = 512  # Coverage grid used for utilization and overlap
+MAX_SPAN = 2  # Triangles wider than this many pixels are subdivided before rasterizing
+CHUNK_SIZE = 65536  # Triangles rasterized per batch, bounds the temporary arrays
+EPSILON = 1e-12
+
+
+def triangle_arrays(geometry, positionAttrib=POSITION_ATTRIB, uvAttrib="uv"):
+	''' Read triangulated geometry into (T, 3, 3) positions and (T, 3, 2) UVs in two bulk calls.
+	Every primitive must be a triangle and both attributes must be vertex attributes. '''
+	positions = np.frombuffer(geometry.vertexFloatAttribValuesAsString(positionAttrib), dtype=np.float32)
+	uvs = np.frombuffer(geometry.vertexFloatAttribValuesAsString(uvAttrib), dtype=np.float32)
+	if not len(positions):
+		return np.zeros((0, 3, 3), dtype=np.float32), np.zeros((0, 3, 2), dtype=np.float32)
+	positions = positions.reshape(-1, 3, 3)
+	uvs = uvs.reshape(len(positions), 3, -1)[:, :, :2]  # uv is usually a float3
+	return positions, np.ascontiguousarray(uvs)
+
+
+def _bounds(triangles):
+	''' Per-triangle (T, D) minimum and maximum corner; elementwise, much faster than reducing the middle axis. '''
+	a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+	return np.minimum(np.minimum(a, b), c), np.maximum(np.maximum(a, b), c)
+
+
+def _corner_angles(triangles):
+	''' Interior angles at the three corners of (T, 3, D) triangles, as a (T, 3) array. '''
+	a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+	edges = (b - a, c - b, a - c)  # Each corner sits between the edge leaving it and the one arriving
+	lengths = [np.sqrt(np.einsum("td,td->t", edge, edge)) for edge in edges]
+	angles = []
+	for leaving, arriving in ((0, 2), (1, 0), (2, 1)):
+		cosine = -np.einsum("td,td->t", edges[leaving], edges[arriving]) / np.maximum(lengths[leaving] * lengths[arriving], EPSILON)
+		angles.append(np.arccos(np.clip(cosine, -1.0, 1.0)))
+	return np.stack(angles, axis=1)
+
+
+def _corner_keys(positions, uvs, precision):
+	''' One integer per corner, equal for corners with the same position and UV. '''
+	quantized = np.round(np.concatenate([positions, uvs], axis=2).reshape(-1, 5) * 10 ** precision).astype(np.int64)
+	keys = np.zeros(len(quantized), dtype=np.uint64)
+	for column in quantized.T.view(np.uint64):
+		keys = (keys ^ column) * np.uint64(0x100000001B3)  # FNV style mix, collisions are negligible
+	return keys
+
+
+def uv_islands(positions, uvs, precision=6):
+	''' Label each triangle with its UV island.
+
+	Triangles are connected when they share a corner with the same position
+	and UV, so UV seams split islands. Components are found by hooking roots
+	onto the smaller neighbouring root and pointer jumping to completion
+	(Shiloach-Vishkin), all in whole-array operations and O(log n) rounds.
+	'''
+	if not len(positions):
+		return np.zeros(0, dtype=np.int64)
+	_, corners = np.unique(_corner_keys(positions, uvs, precision), return_inverse=True)
+	corners = corners.reshape(-1, 3)
+
+	labels = np.arange(corners.max() + 1)
+	a = np.concatenate([corners[:, 0], corners[:, 1]])
+	b = np.concatenate([corners[:, 1], corners[:, 2]])
+	while True:
+		rootA, rootB = labels[a], labels[b]
+		low = np.minimum(rootA, rootB)
+		updated = labels.copy()
+		np.minimum.at(updated, rootA, low)  # Hook each root onto the smaller one
+		np.minimum.at(updated, rootB, low)
+		while True:
+			jumped = updated[updated]
+			if np.array_equal(jumped, updated):
+				break
+			updated = jumped
+		if np.array_equal(updated, labels):
+			break
+		labels = updated
+	return labels[corners[:, 0]]
+
+
+def _subdivide(triangles):
+	''' Split each triangle into four at its edge midpoints. '''
+	a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+	ab, bc, ca = (a + b) / 2, (b + c) / 2, (c + a) / 2
+	return np.concatenate([
+		np.stack([a, ab, ca], axis=1),
+		np.stack([ab, b, bc], axis=1),
+		np.stack([ca, bc, c], axis=1),
+		np.stack([ab, bc, ca], axis=1),
+	])
+
+
+def _rasterize(triangles, counts, resolution):
+	''' Add one to every pixel whose center lies inside each small (T, 3, 2) pixel space triangle.
+	Centers exactly on an edge go to one side only (the top-left rule), so
+	triangles sharing an edge never both count it. '''
+	offsets = np.arange(MAX_SPAN + 1)
+	for start in range(0, len(triangles), CHUNK_SIZE):
+		chunk = triangles[start:start + CHUNK_SIZE]
+		first = np.ceil(_bounds(chunk)[0] - 0.5).astype(np.int64)  # First pixel index whose center is inside the bounds
+		px = (first[:, 0, None, None] + offsets[None, :, None]).repeat(len(offsets), axis=2)
+		py = (first[:, 1, None, None] + offsets[None, None, :]).repeat(len(offsets), axis=1)
+		x, y = (px + 0.5).astype(chunk.dtype), (py + 0.5).astype(chunk.dtype)
+
+		inside = np.ones(px.shape, dtype=bool)
+		v0, v1, v2 = chunk[:, 0], chunk[:, 1], chunk[:, 2]
+		area = (v1[:, 0] - v0[:, 0]) * (v2[:, 1] - v0[:, 1]) - (v1[:, 1] - v0[:, 1]) * (v2[:, 0] - v0[:, 0])
+		sign = np.sign(area)[:, None, None]
+		for p, q in ((v0, v1), (v1, v2), (v2, v0)):
+			dx, dy = (q[:, 0] - p[:, 0])[:, None, None], (q[:, 1] - p[:, 1])[:, None, None]
+			edge = (dx * (y - p[:, 1, None, None]) - dy * (x - p[:, 0, None, None])) * sign
+			topLeft = (dy * sign < 0) | ((dy == 0) & (dx * sign < 0))  # Direction in counter-clockwise order
+			inside &= (edge > 0) | ((edge == 0) & topLeft)
+		inside &= (sign != 0) & (px >= 0) & (py >= 0) & (px < resolution) & (py < resolution)
+		counts += np.bincount((py * resolution + px)[inside], minlength=resolution * resolution).astype(counts.dtype)
+
+
+def uv_coverage(uvs, resolution=DEFAULT_RESOLUTION):
+	''' Return how many triangles cover each pixel center of a resolution^2 grid over UV 0-1. '''
+	counts = np.zeros(resolution * resolution, dtype=np.int32)
+	pending = uvs * resolution
+	while len(pending):
+		low, high = _bounds(pending)
+		keep = ((high >= 0) & (low <= resolution)).all(axis=1)  # Drop triangles outside the 0-1 tile
+		pending, low, high = pending[keep], low[keep], high[keep]
+		span = np.maximum(high[:, 0] - low[:, 0], high[:, 1] - low[:, 1])
+		_rasterize(pending[span <= MAX_SPAN], counts, resolution)
+		pending = _subdivide(pending[span > MAX_SPAN])
+	return counts.reshape(resolution, resolution)
+
+
+def _weighted_mean(values, weights):
+	total = weights.sum(dtype=np.float64)
+	return float((values * weights).sum(dtype=np.float64) / total) if total > 0 else 0.0
+
+
+def compute_uv_metrics(positions, uvs, resolution=DEFAULT_RESOLUTION, islands=None):
+	''' Compute UV quality metrics from (T, 3, 3) positions and (T, 3, 2) UVs.
+
+	utilization is the fraction of the 0-1 tile covered, overlapPercent the
+	share of covered pixels hit by more than one triangle (stacked islands
+	count as overlap). Distortions and texel density are weighted by 3D
+	area: areaDistortion is the mean |log| of each face's share of UV area
+	over its share of surface area, angleDistortion the mean corner angle
+	change in degrees, texelDensityVariance the variance of each face's
+	texel density relative to the mean.
+	'''
+	positions = np.asarray(positions, dtype=np.float32)  # Houdini's own precision, half the memory traffic
+	uvs = np.asarray(uvs, dtype=np.float32)
+	if islands is None:
+		islands = uv_islands(positions, uvs)
+
+	edges = positions[:, 1:] - positions[:, :1]
+	normals = np.cross(edges[:, 0], edges[:, 1])
+	area3d = 0.5 * np.sqrt(np.einsum("td,td->t", normals, normals))
+	uvEdges = uvs[:, 1:] - uvs[:, :1]
+	signedUV = 0.5 * (uvEdges[:, 0, 0] * uvEdges[:, 1, 1] - uvEdges[:, 0, 1] * uvEdges[:, 1, 0])
+	areaUV = np.abs(signedUV)
+
+	valid = (area3d > EPSILON) & (areaUV > EPSILON)
+	weights = area3d[valid]
+	shareRatio = (areaUV[valid] / areaUV[valid].sum()) / (area3d[valid] / area3d[valid].sum()) if valid.any() else np.ones(0)
+	angleChange = np.abs(_corner_angles(positions[valid]) - _corner_angles(uvs[valid])).mean(axis=1)
+	density = np.sqrt(areaUV[valid] / area3d[valid])
+	meanDensity = _weighted_mean(density, weights)
+	dominant = np.sign(signedUV[valid].sum())  # Winding of most faces, the others are flipped
+
+	coverage = uv_coverage(uvs, resolution)
+	covered = int((coverage > 0).sum())
+	return {
+		"faces": int(len(positions)),
+		"islands": int(len(np.unique(islands))),
+		"utilization": covered / float(resolution * resolution),
+		"overlapPercent": 100.0 * int((coverage > 1).sum()) / covered if covered else 0.0,
+		"areaDistortion": _weighted_mean(np.abs(np.log(shareRatio)), weights),
+		"angleDistortion": float(np.degrees(_weighted_mean(angleChange, weights))),
+		"texelDensity": meanDensity,
+		"texelDensityVariance": _weighted_mean((density / meanDensity - 1.0) ** 2, weights) if meanDensity else 0.0,
+		"flippedPercent": 100.0 * float((np.sign(signedUV[valid]) == -dominant).mean()) if valid.any() else 0.0,
+		"degenerateFaces": int((~valid).sum()),
+	}
+
+
+def measure_geometry(geometry, resolution=DEFAULT_RESOLUTION):
+	''' Read triangulated, promoted geometry in bulk and return its UV metrics. '''
+	start_time = time.time()
+	positions, uvs = triangle_arrays(geometry)
+	metrics = compute_uv_metrics(positions, uvs, resolution)
+	metrics["seconds"] = time.time() - start_time
+	logger.info("UV metrics: %s islands, %.1f%% used, %.1f%% overlap in %.3f seconds",
+		metrics["islands"], metrics["utilization"] * 100.0, metrics["overlapPercent"], metrics["seconds"])
+	return metrics
@@ -1,2 +1,5 @@
-from ._remesh_nodes import create_remesh_layout
-from ._uv_nodes import create_uv_layout
\ No newline at end of file
+from ._remesh_nodes import create_remesh_layout, configure_remesh_layout
+from ._uv_nodes import create_uv_layout
+from ._polyreduce_budget import BudgetPolicy, InputStats, BUDGET_POLICIES, get_budget_policy, apply_polyreduce_budget
+from ._pipeline_spec import NodeSpec, PipelineSpec, PipelineBuild, REMESH_PIPELINE, UV_PIPELINE, PREVIEW_PIPELINE, PREVIEW_POLYGONS, compile_pipeline, get_pipeline_spec, load_pipeline_spec
+from ._dead_stages import DeadStageAnalysis, find_dead_stages, apply_dead_stages, EXPORT_ATTRIBUTES, METRICS_ATTRIBUTES, SHELL_ATTRIBUTES, FINGERPRINT_ATTRIBUTES
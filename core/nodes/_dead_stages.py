@@ -0,0 +1,93 @@
+# core/nodes/_dead_stages.py
+
+from uv_tool.utils._logger import logger
+
+ANY = "*"  # Demand for every attribute and group
+EXPORT_ATTRIBUTES = ("vertex:uv", "point:N", "vertex:N")  # What the exported files are for
+METRICS_ATTRIBUTES = ("vertex:uv", "vertex:metricP")  # What measure_geometry reads
+SHELL_ATTRIBUTES = ("vertex:Cd",)  # What the viewport shows while UV shells are toggled on
+FINGERPRINT_ATTRIBUTES = ("vertex:fingerprintP", "vertex:fingerprintPoint", "vertex:fingerprintCount")
+
+# Hand-picked cook seconds per million input primitives, not measured or fitted; they
+# only size the estimate in the report. bench_dead_stages times the real difference.
+STAGE_COSTS = {
+	"measure": 1.5,
+	"groupcreate": 0.3,
+	"uvflatten": 6.0,
+	"uvunwrap": 2.0,
+	"uvlayout": 3.0,
+	"visualize_uvs": 0.4,
+	"attribpromote": 0.2,
+	"attribwrangle": 0.3,
+	"attribcopy": 0.3,
+}
+
+
+class DeadStageAnalysis:
+	''' Result of find_dead_stages: which reachable nodes are live and what each output must carry. '''
+	def __init__(self, spec, sinks, demand, reachable, dead):
+		self.spec = spec
+		self.sinks = dict(sinks)
+		self.demand = demand  # Node name -> set of "class:name" its output must provide
+		self.reachable = reachable  # Nodes some sink reads from, directly or through others
+		self.dead = dead  # Reachable attribute-only nodes whose output nothing reads
+
+	def estimatedSeconds(self, primitives):
+		''' Estimated cook time of the dead nodes on this many primitives, from the STAGE_COSTS rates. '''
+		return sum(STAGE_COSTS.get(self.spec.byName[name].type, 0.0) for name in self.dead) * primitives / 1e6
+
+	def to_dict(self):
+		return {
+			"dead": list(self.dead),
+			"demand": {name: sorted(values) for name, values in self.demand.items() if name in self.reachable},
+		}
+
+
+def find_dead_stages(spec, sinks):
+	''' Find the nodes of spec that add nothing any sink reads.
+
+	sinks maps node names to the "class:name" attributes and groups read from
+	their output, e.g. {"MESH_OUT": EXPORT_ATTRIBUTES}. Walking the spec from
+	the last node to the first, each node's demand is what its readers need;
+	a node with produces declared is dead when none of it is in that demand.
+	A live node passes on the demand minus what it produces plus what it
+	consumes, a dead one (bypassed, so a pass-through) passes it on as is.
+	Nodes without produces change geometry and are always live.
+	'''
+	demand = {node.name: set() for node in spec.nodes}
+	reachable = set()
+	for name, attributes in sinks.items():
+		if name in demand:
+			demand[name].update(attributes)
+			reachable.add(name)
+
+	dead = []
+	for node in reversed(spec.nodes):
+		if node.name not in reachable:
+			continue
+		needed = demand[node.name]
+		if node.produces is not None and ANY not in needed and not needed.intersection(node.produces):
+			dead.append(node.name)
+			upstream = set(needed)
+		else:
+			consumes = {ANY} if node.consumes is None else set(node.consumes)
+			upstream = needed - set(node.produces or ()) | consumes
+		for inputName in node.inputs:
+			if inputName in demand:
+				demand[inputName].update(upstream)
+				reachable.add(inputName)
+
+	dead.reverse()  # Back to cook order
+	return DeadStageAnalysis(spec, sinks, demand, reachable, dead)
+
+
+def apply_dead_stages(build, analysis):
+	''' Bypass the dead nodes and re-enable reachable attribute-only nodes that are live again.
+	Nodes the spec itself bypasses are left alone. Returns the names of the bypassed nodes. '''
+	for node in analysis.spec.nodes:
+		if node.produces is None or node.bypass or node.name not in analysis.reachable:
+			continue
+		build[node.name].bypass(node.name in analysis.dead)
+	if analysis.dead:
+		logger.info("Bypassing dead stages in %s: %s", analysis.spec.name, ", ".join(analysis.dead))
+	return list(analysis.dead)
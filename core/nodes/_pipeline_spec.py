@@ -0,0 +1,280 @@
+# core/nodes/_pipeline_spec.py
+
+import os
+import re
+import json
+from collections import Counter
+
+from uv_tool.utils._logger import logger
+from uv_tool.core.nodes._polyreduce_budget import DEFAULT_FINAL_COUNT
+from uv_tool.core.preflight._obj_scanner import UCX_PREFIX
+
+PLACEHOLDER = re.compile(r"\{(\w+)\}")  # {name} in a parm value or label
+
+# Node names the controller, stage graph and caches look up; a variant spec must keep them
+REMESH_REQUIRED = ("importFile", "attribDelete", "deleteUCX", "clean", "polyReduce", "switch", "fileCache", "MESH_OUT")
+UV_REQUIRED = ("importRemesh", "measure", "group", "uvFlatten", "uvUnwrap", "uvLayout", "uvVisualizer", "fileCache", "MESH_OUT", "outputROP")
+
+REMESH_PIPELINE = {
+	"name": "remesh",
+	"nodes": [
+		{"name": "importFile", "type": "file", "parms": {"file": "{importFile}"}},
+		{"name": "attribDelete", "type": "attribdelete", "inputs": ["importFile"], "parms": {"vtxdel": "uv uv2"}}, # Delete UVs
+		{"name": "deleteUCX", "type": "blast", "inputs": ["attribDelete"], "parms": {"group": f"@name={UCX_PREFIX}*"}}, # Delete UCX collision, the objects the pre-flight scan counts apart
+		{"name": "clean", "type": "clean", "inputs": ["deleteUCX"]},
+		{"name": "polyReduce", "type": "polyreduce", "inputs": ["clean"], "parms": {
+			"target": 2, # Output Polygon Count
+			"finalcount": DEFAULT_FINAL_COUNT, # 1000 unless a budget policy sets it
+		}},
+		{"name": "switch", "type": "switch", "inputs": ["deleteUCX", "polyReduce"], "parms": {"input": 0}},
+		{"name": "fileCache", "label": "{assetName}", "type": "filecache", "inputs": ["switch"], "parms": {
+			"basename": "{assetName}_clean",
+			"basedir": "$TEMP/uv_tool_cache",
+			"trange": 0, # Single frame
+			"enableversion": 0,
+		}},
+		{"name": "MESH_OUT", "type": "null", "inputs": ["fileCache"], "display": True},
+		# Side branch read by the geometry fingerprint: positions, point numbers and face sizes per vertex
+		{"name": "fingerprintAttribs", "type": "attribwrangle", "inputs": ["MESH_OUT"], "produces": ["vertex:fingerprintP", "vertex:fingerprintPoint", "vertex:fingerprintCount"], "consumes": [], "parms": {
+			"class": 3, # Vertices
+			"snippet": "v@fingerprintP = @P; i@fingerprintPoint = vertexpoint(0, @vtxnum); i@fingerprintCount = primvertexcount(0, vertexprim(0, @vtxnum));",
+		}},
+	],
+}
+
+UV_PIPELINE = {
+	"name": "uv",
+	"nodes": [
+		{"name": "importRemesh", "type": "object_merge", "consumes": [], "parms": {"objpath1": "{importFile}"}},
+		{"name": "measure", "type": "measure", "inputs": ["importRemesh"], "produces": ["point:curvature"], "consumes": [], "parms": {
+			"measure": 4, # Curvature
+			"attribname": "curvature",
+			"grouptype": 0, # Points
+		}},
+		{"name": "group", "type": "groupcreate", "inputs": ["measure"], "produces": ["edgegroup:sharp_edges"], "consumes": [], "parms": {
+			"groupname": "sharp_edges",
+			"grouptype": 2, # Edges
+			"groupedges": 1,
+			"dominedgeangle": 1,
+			"domaxedgeangle": 1,
+			"minedgeangle": 80,
+			"maxedgeangle": 110,
+			"unshared": 1,
+			"groupbase": 0,
+		}},
+		{"name": "uvFlatten", "type": "uvflatten", "inputs": ["group"], "produces": ["vertex:uv"], "consumes": ["edgegroup:sharp_edges"], "parms": {
+			"seamgroup": "sharp_edges",
+			"uvattrib": "uv",
+			"keepexistingseams": 1,
+		}},
+		{"name": "uvUnwrap", "type": "uvunwrap", "inputs": ["uvFlatten"], "produces": ["vertex:uv"], "consumes": ["vertex:uv"], "parms": {"uvattrib": "uv", "spacing": 1}},
+		{"name": "uvLayout", "type": "uvlayout", "inputs": ["uvUnwrap"], "produces": ["vertex:uv"], "consumes": ["vertex:uv"], "parms": {
+			"uvattrib": "uv",
+			"packbetween": 1,
+			"padding": 5,
+			"paddingboundary": 1,
+			"axisalignislands": 0,
+			"stackislands": 1,
+			"invertedoverlays": 1,
+		}},
+		{"name": "uvVisualizer", "type": "visualize_uvs", "inputs": ["uvLayout"], "produces": ["vertex:Cd"], "consumes": ["vertex:uv"]},
+		{"name": "fileCache", "label": "{assetName}", "type": "filecache", "inputs": ["uvVisualizer"], "consumes": [], "parms": {
+			"basename": "{assetName}_clean",
+			"basedir": "$TEMP/uv_tool_cache",
+			"trange": 0,
+			"enableversion": 0,
+		}},
+		{"name": "MESH_OUT", "type": "null", "inputs": ["fileCache"], "consumes": [], "display": True},
+		{"name": "outputROP", "type": "rop_fbx", "inputs": ["MESH_OUT"], "parms": {"sopoutput": "{exportFile}"}},
+		# Side branch the viewport shows while UV shells are toggled on; it reads the cached result, so it cooks once
+		{"name": "shellIslands", "type": "visualize_uvs", "inputs": ["MESH_OUT"], "produces": ["vertex:Cd"], "consumes": ["vertex:uv"], "parms": {
+			"visualize_islands": 1,
+		}},
+		# Side branch read by the UV metrics: triangles with positions on every vertex
+		{"name": "metricsTriangulate", "type": "divide", "inputs": ["MESH_OUT"], "consumes": [], "parms": {"convex": 1, "numsides": 3}},
+		{"name": "metricsPoints", "type": "attribpromote", "inputs": ["metricsTriangulate"], "produces": ["vertex:metricP"], "consumes": [], "parms": {
+			"inname": "P",
+			"inclass": 2, # Point
+			"outclass": 3, # Vertex
+			"useoutname": 1,
+			"outname": "metricP",
+			"deleteoriginal": 0,
+		}},
+		# Wired in front of uvVisualizer only when an identical mesh was unwrapped before; idle until then
+		{"name": "dedupSource", "type": "file", "bypass": True, "consumes": []},
+		{"name": "dedupUVs", "type": "attribcopy", "inputs": ["group", "dedupSource"], "produces": ["vertex:uv"], "consumes": [], "parms": {
+			"attribname": "uv",
+			"attrib": 3, # Vertex
+		}},
+	],
+}
+
+
+class NodeSpec:
+	''' One node of a pipeline spec: its type, inputs by spec name and parm values.
+
+	In string parm values and the label (the Houdini node name, default:
+	the spec name), a {name} placeholder is replaced when name is a key of
+	the build context, e.g. "{assetName}"; every other brace is kept, so
+	VEX snippets, expressions and JSON pass through as written.
+	produces lists the "class:name" attributes and groups a node only adds
+	or edits, which makes it a candidate for dead-stage elimination; None
+	means it changes the geometry itself. consumes lists what it reads from
+	its inputs; None means it may read anything.
+	'''
+	def __init__(self, name, type, inputs=(), parms=None, label=None, display=False, bypass=False, produces=None, consumes=None):
+		self.name = name
+		self.type = type
+		self.inputs = list(inputs)
+		self.parms = dict(parms or {})
+		self.label = label or name
+		self.display = display
+		self.bypass = bypass
+		self.produces = None if produces is None else list(produces)
+		self.consumes = None if consumes is None else list(consumes)
+
+	@classmethod
+	def from_dict(cls, data):
+		return cls(**data)
+
+	def to_dict(self):
+		return {
+			"name": self.name,
+			"type": self.type,
+			"inputs": list(self.inputs),
+			"parms": dict(self.parms),
+			"label": self.label,
+			"display": self.display,
+			"bypass": self.bypass,
+			"produces": self.produces,
+			"consumes": self.consumes,
+		}
+
+PREVIEW_POLYGONS = 2000  # Polygon count of the low-resolution preview
+
+# Quick remesh and UV pass shown while the full pipeline cooks: no clean, seams or packing
+PREVIEW_PIPELINE = {
+	"name": "preview",
+	"nodes": [
+		{"name": "importFile", "type": "file", "parms": {"file": "{importFile}"}},
+		{"name": "polyReduce", "type": "polyreduce", "inputs": ["importFile"], "parms": {
+			"target": 2, # Output Polygon Count
+			"finalcount": PREVIEW_POLYGONS,
+		}},
+		{"name": "uvFlatten", "type": "uvflatten", "inputs": ["polyReduce"], "parms": {"uvattrib": "uv"}},
+		{"name": "uvVisualizer", "type": "visualize_uvs", "inputs": ["uvFlatten"]},
+		{"name": "PREVIEW_OUT", "type": "null", "inputs": ["uvVisualizer"], "display": True},
+	],
+}
+
+
+class PipelineSpec:
+	''' An ordered list of NodeSpecs, every node after the nodes it reads from. '''
+	def __init__(self, name, nodes):
+		self.name = name
+		self.nodes = list(nodes)
+		self.byName = {node.name: node for node in self.nodes}
+
+	@classmethod
+	def from_dict(cls, data):
+		return cls(data["name"], [NodeSpec.from_dict(node) for node in data["nodes"]])
+
+	def to_dict(self):
+		return {"name": self.name, "nodes": [node.to_dict() for node in self.nodes]}
+
+	def validate(self, required=()):
+		''' Raise ValueError for missing required nodes or inputs that are not defined earlier. '''
+		seen = set()
+		for node in self.nodes:
+			unknown = [name for name in node.inputs if name is not None and name not in seen]
+			if unknown:
+				raise ValueError(f"{self.name} spec: {node.name} reads from {', '.join(unknown)} before it is defined")
+			seen.add(node.name)
+		missing = [name for name in required if name not in seen]
+		if missing:
+			raise ValueError(f"{self.name} spec is missing required nodes: {', '.join(missing)}")
+		return self
+
+	def subset(self, names):
+		''' Return a spec of only the named nodes; inputs outside it must be passed to compile_pipeline. '''
+		return PipelineSpec(self.name, [node for node in self.nodes if node.name in names])
+
+
+def load_pipeline_spec(path):
+	''' Read a PipelineSpec from a JSON or YAML file. '''
+	with open(path, "r") as f:
+		if path.endswith((".yaml", ".yml")):
+			import yaml  # Only needed for YAML specs
+			data = yaml.safe_load(f)
+		else:
+			data = json.load(f)
+	return PipelineSpec.from_dict(data)
+
+
+def get_pipeline_spec(spec, default=None):
+	''' Return a PipelineSpec from an instance, a dict, a file path, or None for the default. '''
+	if isinstance(spec, PipelineSpec):
+		return spec
+	if spec is None:
+		spec = default
+	if isinstance(spec, dict):
+		return PipelineSpec.from_dict(spec)
+	if isinstance(spec, str) and os.path.exists(spec):
+		return load_pipeline_spec(spec)
+	raise ValueError(f"Not a pipeline spec: {spec}")
+
+
+def _format(value, context):
+	if not isinstance(value, str) or "{" not in value:
+		return value
+	return PLACEHOLDER.sub(lambda match: str(context[match.group(1)]) if match.group(1) in context else match.group(0), value)
+
+
+class PipelineBuild:
+	''' The nodes created by compile_pipeline and the Houdini API calls it made. '''
+	def __init__(self, spec):
+		self.spec = spec
+		self.nodes = {}  # Spec name -> node
+		self.calls = Counter()
+
+	@property
+	def totalCalls(self):
+		return sum(self.calls.values())
+
+	def __getitem__(self, name):
+		return self.nodes[name]
+
+
+def compile_pipeline(geoNode, spec, context=None, external=None):
+	''' Create the nodes of spec inside geoNode and return a PipelineBuild.
+
+	Each node costs one createNode, one setInput per input and a single
+	setParms for all of its parms. external maps input names that are not in
+	the spec to existing nodes.
+	'''
+	context = dict(context or {})
+	build = PipelineBuild(spec)
+	resolved = dict(external or {})
+
+	for nodeSpec in spec.nodes:
+		node = geoNode.createNode(nodeSpec.type, _format(nodeSpec.label, context))
+		build.calls["createNode"] += 1
+		for index, inputName in enumerate(nodeSpec.inputs):
+			if inputName is not None:
+				node.setInput(index, resolved[inputName])
+				build.calls["setInput"] += 1
+		if nodeSpec.parms:
+			node.setParms({name: _format(value, context) for name, value in nodeSpec.parms.items()})
+			build.calls["setParms"] += 1
+		if nodeSpec.display:
+			node.setDisplayFlag(True)
+			build.calls["setDisplayFlag"] += 1
+		if nodeSpec.bypass:
+			node.bypass(True)
+			build.calls["bypass"] += 1
+		resolved[nodeSpec.name] = node
+		build.nodes[nodeSpec.name] = node
+
+	logger.info("Built %s pipeline: %s nodes in %s API calls (%s)", spec.name, len(build.nodes), build.totalCalls,
+		", ".join(f"{name} {count}" for name, count in sorted(build.calls.items())))
+	return build
@@ -0,0 +1,149 @@
+# core/nodes/_polyreduce_budget.py
+
+import math
+
+from uv_tool.utils._logger import logger
+
+DEFAULT_FINAL_COUNT = 1000  # The original fixed polyreduce target
+
+
+class InputStats:
+	''' Measured size of the geometry going into polyreduce. '''
+	def __init__(self, polygons, points=0, bboxSize=(0.0, 0.0, 0.0), surfaceArea=None):
+		self.polygons = polygons
+		self.points = points
+		self.bboxSize = tuple(bboxSize)
+		self.surfaceArea = surfaceArea
+
+	@property
+	def diagonal(self):
+		return math.sqrt(sum(size * size for size in self.bboxSize))
+
+	@classmethod
+	def from_geometry(cls, geometry, measureArea=False):
+		''' Read counts and bounds from cooked geometry; the area walk is optional as it is per primitive. '''
+		surfaceArea = None
+		if measureArea:
+			surfaceArea = sum(prim.intrinsicValue("measuredarea") for prim in geometry.prims())
+		return cls(
+			geometry.intrinsicValue("primitivecount"),
+			geometry.intrinsicValue("pointcount"),
+			tuple(geometry.boundingBox().sizevec()),
+			surfaceArea,
+		)
+
+	def to_dict(self):
+		return {
+			"polygons": self.polygons,
+			"points": self.points,
+			"bboxSize": list(self.bboxSize),
+			"surfaceArea": self.surfaceArea,
+		}
+
+
+class BudgetPolicy:
+	''' Base for polyreduce budget strategies.
+
+	Subclasses implement target(stats). budget() then clamps it between
+	minPolygons and maxPolygons and never asks for more polygons than the
+	input already has.
+	'''
+	name = "base"
+	needsArea = False  # Whether stats must include the surface area
+
+	def __init__(self, minPolygons=200, maxPolygons=100000):
+		self.minPolygons = minPolygons
+		self.maxPolygons = maxPolygons
+
+	def target(self, stats):
+		raise NotImplementedError
+
+	def budget(self, stats):
+		count = int(round(self.target(stats)))
+		count = max(self.minPolygons, min(self.maxPolygons, count))
+		return min(count, stats.polygons)
+
+
+class FixedBudget(BudgetPolicy):
+	''' The same count for every asset (the original behaviour). '''
+	name = "fixed"
+
+	def __init__(self, count=DEFAULT_FINAL_COUNT, **caps):
+		super().__init__(**caps)
+		self.count = count
+
+	def target(self, stats):
+		return self.count
+
+
+class RatioBudget(BudgetPolicy):
+	''' Keep a fixed fraction of the input polygons. '''
+	name = "ratio"
+
+	def __init__(self, ratio=0.25, **caps):
+		super().__init__(**caps)
+		self.ratio = ratio
+
+	def target(self, stats):
+		return stats.polygons * self.ratio
+
+
+class SqrtBudget(BudgetPolicy):
+	''' Grow with the square root of the input count, so dense scans shrink the most. '''
+	name = "sqrt"
+
+	def __init__(self, scale=30.0, **caps):
+		super().__init__(**caps)
+		self.scale = scale
+
+	def target(self, stats):
+		return self.scale * math.sqrt(stats.polygons)
+
+
+class DensityBudget(BudgetPolicy):
+	''' Spend polygons by surface area relative to the asset's size.
+
+	resolution is how many polygons should span the bounding box diagonal,
+	so a flat panel gets far fewer polygons than a detailed statue of the
+	same size.
+	'''
+	name = "density"
+	needsArea = True
+
+	def __init__(self, resolution=64, **caps):
+		super().__init__(**caps)
+		self.resolution = resolution
+
+	def target(self, stats):
+		if not stats.surfaceArea or not stats.diagonal:
+			return stats.polygons
+		edge = stats.diagonal / self.resolution  # Target polygon edge length
+		return stats.surfaceArea / (edge * edge)
+
+
+BUDGET_POLICIES = {policy.name: policy for policy in (FixedBudget, RatioBudget, SqrtBudget, DensityBudget)}
+
+
+def get_budget_policy(policy=None, **options):
+	''' Return a BudgetPolicy from an instance, a registered name, or None for the default. '''
+	if isinstance(policy, BudgetPolicy):
+		return policy
+	if policy is None:
+		return FixedBudget(**options)
+	if policy not in BUDGET_POLICIES:
+		raise ValueError(f"Unknown polyreduce budget policy: {policy}")
+	return BUDGET_POLICIES[policy](**options)
+
+
+def apply_polyreduce_budget(polyReduce, inputNode, policy, stats=None):
+	''' Set finalcount from the policy and bypass if nothing would be removed.
+	Without pre-measured stats the input node is cooked and measured. '''
+	if stats is None:
+		stats = InputStats.from_geometry(inputNode.geometry(), policy.needsArea)
+	count = policy.budget(stats)
+
+	polyReduce.parm("finalcount").set(count)
+	polyReduce.bypass(count >= stats.polygons)  # Never cook a reduction that keeps every polygon
+
+	logger.info("Polyreduce budget (%s): %s of %s polygons", policy.name, count, stats.polygons)
+	return stats, count
@@ -4,92 +4,47 @@
 # import hou
 
 from uv_tool.utils._logger import logger
-from uv_tool.core.caching._export_ops import createFileCache, createOutputNode
-
-def create_remesh_layout(remeshNode, importFile, assetName, remeshCheck):
-	''' Create the remesh layout for the given node and import file. '''
-	logger.info(f"Creating remesh layout for: {assetName}")
-
-	importNode = createImportNode(remeshNode, importFile) # Create the import node
-	attribDelete = createAttribDeleteNode(remeshNode, importNode) # Create the attribute delete node
-	deleteUCX = createDeleteUCXNode(remeshNode, attribDelete) # Create the delete UCX node
-	cleanNode = createCleanNode(remeshNode, deleteUCX) # Create the clean node
-	polyReduce = createPolyReduceNode(remeshNode, cleanNode) # Create the poly reduce node
-	switchNode = createSwitchNode(remeshNode, deleteUCX, polyReduce, remeshCheck) # Create the switch node
-	fileCache = createFileCache(remeshNode, switchNode, assetName) # Create the file cache node
-	nullNode = createOutputNode(remeshNode, fileCache) # Create the null node
-
-	logger.info(f"Remesh layout created for: {assetName}")
-	return nullNode, fileCache # Return the null node
-
-def createImportNode(geoNode, importFile):
-	''' Create the import node for the given node and import file. '''
-
-	logger.info(f"Creating import node")
-
-	importNode = geoNode.createNode("file", "importFile") # Create a file node
-	importNode.parm("file").set(importFile) # Set the file path to the import file
-
-	return importNode
-
-def createAttribDeleteNode(geoNode, inputNode):
-	''' Create the attribute delete node for the given node and import node. '''
-
-	logger.info("Creating attribute delete node")
-
-	attribDelete = geoNode.createNode("attribdelete", "attribDelete") # Create an attribute delete node
-	attribDelete.setInput(0, inputNode) # Set the input to the import node
-
-	attribDelete.parm("vtxdel").set("uv uv2") # Delete UVs
-
-	return attribDelete
-
-def createDeleteUCXNode(geoNode, inputNode):
-	''' Create the delete UCX node for the given node and attrib node. '''
-
-	logger.info("Creating delete UCX node")
-
-	deleteUCX = geoNode.createNode("blast", "deleteUCX") # Create a delete node
-	deleteUCX.setInput(0, inputNode) # Set the input to the attrib delete node
-
-	deleteUCX.parm("group").set("@name=UCX") # Delete UCX collision
-
-	return deleteUCX
-
-def createCleanNode(geoNode, inputNode):
-	''' Create the clean node for the given node and delete node. '''
-
-	logger.info("Creating clean node")
-
-	cleanNode = geoNode.createNode("clean", "clean") # Create a clean node
-	cleanNode.setInput(0, inputNode) # Set the input to the delete UCX node
-
-	return cleanNode
-
-def createPolyReduceNode(geoNode, inputNode):
-	''' Create the poly reduce node for the given node and clean node. '''
-
-	logger.info("Creating poly reduce node")
-
-	polyReduce = geoNode.createNode("polyreduce", "polyReduce") # Create a poly reduce node
-	polyReduce.setInput(0, inputNode) # Set the input to the clean node
-
-	polyReduce.parm("target").set(2) # Set target to Output Polygon Count
-	polyReduce.parm("finalcount").set(1000) # Set final count to 1000
-
-	return polyReduce
-
-def createSwitchNode(geoNode, optionOne, optionTwo, remeshCheck):
-	''' Create the switch node for the given nodes'''
-
-	logger.info("Creating switch node")
-	
-	switchNode = geoNode.createNode("switch", "switch") # Create a switch node
-	switchNode.setInput(0, optionOne) # Set the input to the poly reduce node
-	switchNode.setInput(1, optionTwo) # Set the input to the delete UCX node
-	switchNode.parm("input").set(0) # Set the input to option one
-
-	if remeshCheck:
-		switchNode.parm("input").set(1) # Set the input to option two (poly reduce)
-
-	return switchNode
\ No newline at end of file
+from uv_tool.core.caching._export_ops import createTempDir
+from uv_tool.core.nodes._polyreduce_budget import DEFAULT_FINAL_COUNT, apply_polyreduce_budget
+from uv_tool.core.nodes._pipeline_spec import REMESH_PIPELINE, REMESH_REQUIRED, compile_pipeline, get_pipeline_spec
+from uv_tool.core.preflight import plan_stages
+
+def create_remesh_layout(remeshNode, importFile, assetName, remeshCheck, budgetPolicy=None, scan=None, spec=None):
+	''' Create the remesh layout for the given node and import file.
+	The network is compiled from spec (default: REMESH_PIPELINE).
+	With a budgetPolicy the polyreduce target is derived from the cleaned input,
+	and a pre-flight scan lets stages with nothing to do be bypassed. '''
+	logger.info("Creating remesh layout for: %s", assetName)
+
+	createTempDir() # Make sure the file cache folder exists
+	spec = get_pipeline_spec(spec, REMESH_PIPELINE).validate(REMESH_REQUIRED)
+	build = compile_pipeline(remeshNode, spec, {"importFile": importFile, "assetName": assetName})
+
+	configure_remesh_layout(remeshNode, remeshCheck, budgetPolicy, scan) # Apply the per-asset settings
+
+	logger.info("Remesh layout created for: %s", assetName)
+	return build["MESH_OUT"], build["fileCache"], build # Return the null node
+
+def configure_remesh_layout(remeshNode, remeshCheck, budgetPolicy=None, scan=None):
+	''' Apply the per-asset settings to an existing remesh layout.
+	Sets the switch and polyreduce budget, then bypasses the stages the scan
+	shows have nothing to do. Returns the stage plan ({} without a scan). '''
+	remeshNode.node("switch").parm("input").set(1 if remeshCheck else 0) # Remesh on/off
+
+	polyReduce = remeshNode.node("polyReduce")
+	polyReduce.bypass(False) # Reset anything left from a previous asset
+	polyReduce.parm("finalcount").set(DEFAULT_FINAL_COUNT) # A reused network must not keep the last asset's budget
+	finalCount = DEFAULT_FINAL_COUNT
+	if remeshCheck and budgetPolicy:
+		stats = None # Cook and measure clean, unless the scan has everything the policy needs
+		if scan and (scan.measured or not budgetPolicy.needsArea):
+			stats = scan.input_stats() # Measured from the file, so clean needs no early cook
+		_, finalCount = apply_polyreduce_budget(polyReduce, remeshNode.node("clean"), budgetPolicy, stats)
+
+	plan = plan_stages(scan, remeshCheck, finalCount) if scan else {}
+	remeshNode.node("attribDelete").bypass(plan.get("attribDelete", False)) # No UVs to delete
+	remeshNode.node("deleteUCX").bypass(plan.get("deleteUCX", False)) # No collision meshes
+	if plan.get("polyReduce"):
+		polyReduce.bypass(True) # Already within budget
+
+	return plan
@@ -0,0 +1 @@
+from ._piece_unwrap import parallel_unwrap, split_pieces, unwrap_piece, merge_pieces, shutdown_piece_pool
\ No newline at end of file
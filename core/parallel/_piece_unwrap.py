@@ -0,0 +1,166 @@
+# core/parallel/_piece_unwrap.py
+
+import os
+import time
+import shutil
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from uv_tool.utils._logger import logger
+
+PIECE_EXTENSION = ".bgeo.sc"
+
+_piecePool = None  # Process pool kept alive between assets, since hython startup is slow
+_piecePoolSize = 0
+_workerNetwork = None  # Per-worker file -> group -> flatten -> unwrap chain
+UNWRAP_NODES = ("group", "uvFlatten", "uvUnwrap")  # Nodes whose settings are copied to the workers
+
+
+def _init_piece_worker():
+	''' Build the unwrap chain once per worker process. '''
+	global _workerNetwork
+	import hou
+	from uv_tool.core.nodes import UV_PIPELINE, compile_pipeline, get_pipeline_spec
+
+	geoNode = hou.node("/obj").createNode("geo", f"uv_piece_{os.getpid()}")
+	fileNode = geoNode.createNode("file", "pieceFile")
+	spec = get_pipeline_spec(UV_PIPELINE).subset(UNWRAP_NODES)  # Same seams as the serial chain
+	build = compile_pipeline(geoNode, spec, external={"measure": fileNode})
+	_workerNetwork = dict(build.nodes, pieceFile=fileNode)
+
+
+def unwrap_piece(piecePath, outputPath, parms=None):
+	''' Flatten and unwrap one saved piece in a worker and save the result.
+	parms maps the UNWRAP_NODES names to the settings of the main network. '''
+	start_time = time.time()
+	for nodeName, values in (parms or {}).items():
+		_workerNetwork[nodeName].setParms(values)
+	_workerNetwork["pieceFile"].parm("file").set(piecePath)
+	uvUnwrapNode = _workerNetwork["uvUnwrap"]
+	uvUnwrapNode.cook(force=True)
+	uvUnwrapNode.geometry().saveToFile(outputPath)
+	return outputPath, time.time() - start_time
+
+
+def _get_pool(workers, executable=None):
+	''' Return the shared piece pool, recreating it if the size changed. '''
+	global _piecePool, _piecePoolSize
+	if _piecePool is None or _piecePoolSize != workers:
+		shutdown_piece_pool()
+		context = multiprocessing.get_context("spawn")  # Never fork a live Houdini session
+		if executable:
+			context.set_executable(executable)
+		_piecePool = ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_piece_worker)
+		_piecePoolSize = workers
+	return _piecePool
+
+
+def shutdown_piece_pool():
+	''' Stop the piece worker processes. '''
+	global _piecePool
+	if _piecePool is not None:
+		_piecePool.shutdown()
+		_piecePool = None
+
+
+def _save_pieces(geometry, valuesOf, keys, paths):
+	''' Save the primitives of each key to paths[key], halving the keys at every level.
+	A level copies the geometry once and deletes the other half, so the mesh is walked
+	O(log pieces) times instead of once per piece. '''
+	if len(keys) == 1:
+		geometry.saveToFile(paths[keys[0]])
+		return
+	middle = len(keys) // 2
+	for half in (keys[:middle], keys[middle:]):
+		keep = set(half)
+		part = geometry.freeze()  # An independent copy to delete from
+		part.deletePrims([prim for prim, value in zip(part.prims(), valuesOf(part)) if value not in keep])
+		_save_pieces(part, valuesOf, half, paths)
+
+
+def split_pieces(sourceNode, folder, splitBy="connectivity"):
+	''' Save each independent piece of the source node's geometry to its own file.
+
+	Pieces are connected components, or primitives sharing a name attribute
+	value when splitBy is "name". The source cooks once; the pieces are cut
+	from copies of that geometry rather than by a node per piece.
+	'''
+	keyNode = sourceNode
+	if splitBy == "connectivity":
+		keyNode = sourceNode.parent().createNode("connectivity", "pieceConnectivity")
+		keyNode.setInput(0, sourceNode)
+		keyNode.parm("connecttype").set(1)  # Primitives
+		keyNode.parm("attribname").set("class")
+
+	try:
+		geometry = keyNode.geometry().freeze()
+	finally:
+		if keyNode is not sourceNode:
+			keyNode.destroy()
+
+	if splitBy == "connectivity":
+		valuesOf = lambda geo: geo.primIntAttribValues("class")
+	else:
+		valuesOf = lambda geo: geo.primStringAttribValues("name")
+	keys = sorted(set(valuesOf(geometry)))
+	paths = {key: os.path.join(folder, f"piece_{index:05d}{PIECE_EXTENSION}") for index, key in enumerate(keys)}
+	if keys:
+		_save_pieces(geometry, valuesOf, keys, paths)
+
+	logger.info("Split %s into %s pieces by %s", sourceNode.path(), len(keys), splitBy)
+	return [paths[key] for key in keys]
+
+
+def merge_pieces(paths, outputPath=None):
+	''' Merge the unwrapped piece files into one geometry, also saved to outputPath if given. '''
+	import hou
+
+	merged = hou.Geometry()
+	for path in paths:
+		piece = hou.Geometry()
+		piece.loadFromFile(path)
+		merged.merge(piece)
+	if outputPath:
+		merged.saveToFile(outputPath)
+	return merged
+
+
+def parallel_unwrap(sourceNode, layoutNode, workers=None, splitBy="connectivity", executable=None, folder=None):
+	''' Unwrap the pieces of sourceNode's geometry in parallel and feed the result to layoutNode.
+
+	sourceNode is the node that feeds the seam group (measure in
+	create_uv_layout). A "parallelUnwrap" stash node holding the merged
+	pieces becomes layoutNode's input, so packing still runs once over the
+	whole asset. The piece files are only kept when folder is given.
+	Returns the stash node and per-piece timings.
+	'''
+	ownFolder = folder is None
+	folder = folder or tempfile.mkdtemp(prefix="uv_tool_pieces_")
+	try:
+		piecePaths = split_pieces(sourceNode, folder, splitBy)
+		workers = max(1, min(workers or os.cpu_count() or 1, len(piecePaths) or 1))
+
+		geoNode = layoutNode.parent()
+		parms = {
+			nodeName: {parm.name(): parm.eval() for parm in geoNode.node(nodeName).parms()}
+			for nodeName in UNWRAP_NODES
+		}  # Worker chains follow any update() made to the main network
+
+		start_time = time.time()
+		results = []
+		if piecePaths:
+			pool = _get_pool(workers, executable)
+			outputs = [path.replace(PIECE_EXTENSION, "_uv" + PIECE_EXTENSION) for path in piecePaths]
+			results = list(pool.map(unwrap_piece, piecePaths, outputs, [parms] * len(piecePaths)))
+		logger.info("Unwrapped %s pieces on %s workers in %.2f seconds", len(results), workers, time.time() - start_time)
+
+		merged = merge_pieces([path for path, _ in results])
+	finally:
+		if ownFolder:
+			shutil.rmtree(folder, ignore_errors=True)  # The merged pieces live on in the stash node
+
+	stashNode = geoNode.node("parallelUnwrap") or geoNode.createNode("stash", "parallelUnwrap")
+	stashNode.parm("stash").set(merged)
+	layoutNode.setInput(0, stashNode)
+	return stashNode, [seconds for _, seconds in results]
@@ -0,0 +1 @@
+from ._obj_scanner import ObjScan, scan_obj, scan_asset, plan_stages, estimate_cost
\ No newline at end of file
@@ -0,0 +1,196 @@
+# core/preflight/_obj_scanner.py
+
+import os
+import math
+from array import array
+
+from uv_tool.utils._logger import logger
+
+MAX_NAMES = 10000  # Stop collecting object/group names past this many to bound memory
+UCX_PREFIX = "UCX"  # Unreal collision meshes, removed by the deleteUCX blast; case sensitive like its @name pattern
+
+# Rough cost model used until a fitted one is available: seconds = base + perFace * faces
+DEFAULT_COST_MODEL = {
+	"base": 2.0,
+	"perFace": 2e-5,
+	"bytesPerFace": 60.0,  # Used to guess the face count of files that cannot be scanned
+}
+
+
+class ObjScan:
+	''' Counts and names found by a streaming pass over an OBJ file. '''
+	def __init__(self, path):
+		self.path = path
+		self.vertices = 0
+		self.uvs = 0
+		self.normals = 0
+		self.faces = 0
+		self.triangles = 0  # Faces fanned into triangles, a better measure of cook cost
+		self.ucxFaces = 0  # Faces of UCX collision objects and groups, removed before polyreduce
+		self.objects = set()
+		self.groups = set()
+		self.bboxMin = None
+		self.bboxMax = None
+		self.surfaceArea = None  # Area of the non-UCX faces, only when the bounds were measured
+
+	@property
+	def hasUVs(self):
+		return self.uvs > 0
+
+	@property
+	def hasUCX(self):
+		return any(name.startswith(UCX_PREFIX) for name in self.objects | self.groups)
+
+	@property
+	def bboxSize(self):
+		if self.bboxMin is None:
+			return (0.0, 0.0, 0.0)
+		return tuple(high - low for low, high in zip(self.bboxMin, self.bboxMax))
+
+	@property
+	def measured(self):
+		''' Whether bounds and area were read, as area based budgets need. '''
+		return self.surfaceArea is not None
+
+	@property
+	def polygons(self):
+		''' Faces that reach polyreduce, after deleteUCX. '''
+		return self.faces - self.ucxFaces
+
+	def input_stats(self):
+		''' Return the scan as polyreduce budget InputStats. '''
+		from uv_tool.core.nodes._polyreduce_budget import InputStats
+		return InputStats(self.polygons, self.vertices, self.bboxSize, self.surfaceArea)
+
+	def to_dict(self):
+		return {
+			"path": self.path,
+			"vertices": self.vertices,
+			"uvs": self.uvs,
+			"normals": self.normals,
+			"faces": self.faces,
+			"triangles": self.triangles,
+			"ucxFaces": self.ucxFaces,
+			"objects": sorted(self.objects),
+			"groups": sorted(self.groups),
+			"hasUVs": self.hasUVs,
+			"hasUCX": self.hasUCX,
+			"bboxSize": list(self.bboxSize),
+			"surfaceArea": self.surfaceArea,
+		}
+
+
+def _addNames(names, line):
+	if len(names) < MAX_NAMES:
+		names.update(line.split()[1:])
+
+
+def _isUCX(line):
+	return any(name.startswith(UCX_PREFIX) for name in line.decode("utf-8", "replace").split()[1:])
+
+
+def _faceArea(positions, references, vertexCount):
+	''' Area of a planar face from the summed cross products of its fan (Newell's method). '''
+	corners = []
+	for reference in references:
+		index = int(reference.split(b"/")[0])
+		index = vertexCount + index if index < 0 else index - 1  # OBJ indices are 1 based, negative ones count back
+		corners.append(positions[3 * index:3 * index + 3])
+	x0, y0, z0 = corners[0]
+	nx = ny = nz = 0.0
+	for (x1, y1, z1), (x2, y2, z2) in zip(corners[1:], corners[2:]):
+		ax, ay, az = x1 - x0, y1 - y0, z1 - z0
+		bx, by, bz = x2 - x0, y2 - y0, z2 - z0
+		nx += ay * bz - az * by
+		ny += az * bx - ax * bz
+		nz += ax * by - ay * bx
+	return 0.5 * math.sqrt(nx * nx + ny * ny + nz * nz)
+
+
+def scan_obj(path, measureBounds=False):
+	''' Stream an OBJ file once and return an ObjScan.
+
+	Only one line is held in memory at a time. Faces under a UCX object or
+	group are counted apart, as deleteUCX removes them. Measuring the
+	bounding box and surface area parses every position and keeps them in a
+	flat array, so it is opt-in; both leave out the UCX meshes.
+	'''
+	scan = ObjScan(path)
+	bboxMin = [float("inf")] * 3
+	bboxMax = [float("-inf")] * 3
+	positions = array("d")
+	surfaceArea = 0.0
+	objectUCX = groupUCX = False
+
+	with open(path, "rb") as f:
+		for line in f:
+			head = line[:2]
+			if head == b"v ":
+				scan.vertices += 1
+				if measureBounds:
+					values = [float(value) for value in line.split()[1:4]]
+					positions.extend(values)
+					if not (objectUCX or groupUCX):
+						for axis, value in enumerate(values):
+							if value < bboxMin[axis]:
+								bboxMin[axis] = value
+							if value > bboxMax[axis]:
+								bboxMax[axis] = value
+			elif head == b"f ":
+				scan.faces += 1
+				references = line.split()[1:]
+				scan.triangles += max(1, len(references) - 2)
+				if objectUCX or groupUCX:
+					scan.ucxFaces += 1
+				elif measureBounds:
+					surfaceArea += _faceArea(positions, references, scan.vertices)
+			elif head == b"vt":
+				scan.uvs += 1
+			elif head == b"vn":
+				scan.normals += 1
+			elif head == b"o ":
+				_addNames(scan.objects, line.decode("utf-8", "replace"))
+				objectUCX, groupUCX = _isUCX(line), False
+			elif head == b"g ":
+				_addNames(scan.groups, line.decode("utf-8", "replace"))
+				groupUCX = _isUCX(line)
+
+	if measureBounds:
+		scan.surfaceArea = surfaceArea
+		if bboxMin[0] <= bboxMax[0]:
+			scan.bboxMin, scan.bboxMax = tuple(bboxMin), tuple(bboxMax)
+
+	logger.info("Pre-flight %s: %s faces, %s uvs, UCX %s", os.path.basename(path), scan.faces, scan.uvs, scan.hasUCX)
+	return scan
+
+
+def scan_asset(path, measureBounds=False):
+	''' Scan the asset if it is an OBJ; other formats return None and run every stage. '''
+	if not path.lower().endswith(".obj"):
+		return None
+	return scan_obj(path, measureBounds)
+
+
+def plan_stages(scan, remeshCheck=False, finalCount=None):
+	''' Decide which remesh stages can be bypassed for a scanned input.
+
+	Returns a dict of node name to True when the node can be bypassed:
+	deleteUCX when there are no UCX objects or groups, attribDelete when the
+	file has no UVs to strip, and polyReduce when remeshing an input that is
+	already within finalCount.
+	'''
+	return {
+		"deleteUCX": not scan.hasUCX,
+		"attribDelete": not scan.hasUVs,
+		"polyReduce": bool(remeshCheck and finalCount is not None and scan.polygons <= finalCount),
+	}
+
+
+def estimate_cost(path, scan=None, model=None):
+	''' Estimate the pipeline seconds for an asset from its scan, or its file size. '''
+	model = model or DEFAULT_COST_MODEL
+	if scan is not None:
+		faces = scan.triangles or scan.faces
+	else:
+		faces = os.path.getsize(path) / model["bytesPerFace"]
+	return model["base"] + model["perFace"] * faces
@@ -0,0 +1 @@
+from ._node_profiler import profile_nodes, write_profile_report, aggregate_profiles
\ No newline at end of file
@@ -0,0 +1,136 @@
+# core/profiling/_node_profiler.py
+
+import os
+import json
+import time
+
+from uv_tool.utils._logger import logger
+
+
+def _geometry_stats(node):
+	''' Return point count, primitive count and memory size of a node's cooked geometry. '''
+	geometry = node.geometry() if node is not None else None
+	if geometry is None:
+		return 0, 0, 0
+	return (
+		geometry.intrinsicValue("pointcount"),
+		geometry.intrinsicValue("primitivecount"),
+		geometry.intrinsicValue("memoryusage"),
+	)
+
+
+def _cook_order(networks):
+	''' Return (stage, node) pairs sorted so every node follows its inputs. '''
+	ordered = []
+	visited = set()
+
+	def visit(stage, node):
+		if node.path() in visited:
+			return
+		visited.add(node.path())
+		for inputNode in node.inputs():
+			if inputNode is not None:
+				visit(stage, inputNode)
+		ordered.append((stage, node))
+
+	for stage, network in networks.items():
+		for node in network.children():
+			visit(stage, node)
+	return ordered
+
+
+def profile_nodes(networks, assetName):
+	''' Cook every node in the networks one at a time and record its cost.
+
+	networks maps a stage name to its geo node, e.g. {"remesh": ..., "uv": ...}.
+	Nodes are cooked upstream first, so each timing covers only that node's
+	own work. Nodes that do not produce geometry (like the export ROP) are
+	skipped.
+	'''
+	import hou
+
+	logger.info("Profiling nodes for: %s", assetName)
+	nodes = []
+	for stage, node in _cook_order(networks):
+		if node.type().name().startswith("rop_"):
+			continue
+
+		inputs = [n for n in node.inputs() if n is not None]
+		inPoints, inPrims, _ = _geometry_stats(inputs[0] if inputs else None)
+
+		start_time = time.perf_counter()
+		node.cook(force=True)
+		cookTime = time.perf_counter() - start_time
+
+		outPoints, outPrims, memory = _geometry_stats(node)
+		nodeType = node.type().name()
+		nodes.append({
+			# File caches are named after the asset, so key those by type instead
+			"key": f"{stage}/{nodeType if nodeType == 'filecache' else node.name()}",
+			"stage": stage,
+			"name": node.name(),
+			"path": node.path(),
+			"type": nodeType,
+			"cookTime": cookTime,
+			"inputPoints": inPoints,
+			"inputPrims": inPrims,
+			"outputPoints": outPoints,
+			"outputPrims": outPrims,
+			"memoryBytes": memory,
+		})
+
+	report = {
+		"asset": assetName,
+		"houdiniVersion": hou.applicationVersionString(),
+		"totalCookTime": sum(n["cookTime"] for n in nodes),
+		"nodes": nodes,
+	}
+	slowest = max(nodes, key=lambda n: n["cookTime"]) if nodes else None
+	if slowest:
+		logger.info("Slowest node for %s: %s (%.3f seconds)", assetName, slowest['key'], slowest['cookTime'])
+	return report
+
+
+def write_profile_report(report, folder, fileName=None):
+	''' Write a profile report as JSON and return its path. '''
+	os.makedirs(folder, exist_ok=True)
+	path = os.path.join(folder, fileName or f"{report['asset']}_profile.json")
+	with open(path, "w") as f:
+		json.dump(report, f, indent=2)
+	logger.info("Profile report written to: %s", path)
+	return path
+
+
+def aggregate_profiles(reports):
+	''' Combine per-asset reports into per-node statistics for a batch. '''
+	byNode = {}
+	for report in reports:
+		for node in report["nodes"]:
+			entry = byNode.setdefault(node["key"], {
+				"type": node["type"],
+				"count": 0,
+				"totalCookTime": 0.0,
+				"maxCookTime": 0.0,
+				"slowestAsset": None,
+				"maxMemoryBytes": 0,
+			})
+			entry["count"] += 1
+			entry["totalCookTime"] += node["cookTime"]
+			entry["maxMemoryBytes"] = max(entry["maxMemoryBytes"], node["memoryBytes"])
+			if node["cookTime"] >= entry["maxCookTime"]:
+				entry["maxCookTime"] = node["cookTime"]
+				entry["slowestAsset"] = report["asset"]
+
+	batchTime = sum(entry["totalCookTime"] for entry in byNode.values())
+	for entry in byNode.values():
+		entry["meanCookTime"] = entry["totalCookTime"] / entry["count"]
+		entry["share"] = entry["totalCookTime"] / batchTime if batchTime else 0.0
+
+	assets = sorted(reports, key=lambda r: r["totalCookTime"], reverse=True)
+	return {
+		"assets": len(reports),
+		"houdiniVersions": sorted(set(r["houdiniVersion"] for r in reports)),
+		"totalCookTime": batchTime,
+		"nodes": dict(sorted(byNode.items(), key=lambda item: item[1]["totalCookTime"], reverse=True)),
+		"slowestAssets": [{"asset": r["asset"], "totalCookTime": r["totalCookTime"]} for r in assets[:10]],
+	}
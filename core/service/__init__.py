@@ -0,0 +1,2 @@
+from ._job_store import JobStore
+from ._watch_daemon import FolderWatcher, WatchDaemon
\ No newline at end of file
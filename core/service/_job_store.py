@@ -0,0 +1,160 @@
+# core/service/_job_store.py
+
+import os
+import json
+import time
+import sqlite3
+
+from uv_tool.utils._logger import logger
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+	id INTEGER PRIMARY KEY AUTOINCREMENT,
+	importPath TEXT NOT NULL,
+	sourceSize INTEGER NOT NULL,
+	sourceMtime REAL NOT NULL,
+	exportPath TEXT NOT NULL,
+	status TEXT NOT NULL,
+	attempts INTEGER NOT NULL DEFAULT 0,
+	enqueuedAt REAL NOT NULL,
+	startedAt REAL,
+	finishedAt REAL,
+	worker INTEGER,
+	error TEXT,
+	result TEXT,
+	UNIQUE (importPath, sourceSize, sourceMtime)
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, id);
+CREATE INDEX IF NOT EXISTS jobs_finished ON jobs (finishedAt);
+"""
+
+
+def _percentile(values, fraction):
+	if not values:
+		return None
+	values = sorted(values)
+	return values[min(len(values) - 1, int(round(fraction * (len(values) - 1))))]
+
+
+class JobStore:
+	''' Persistent job table in a local SQLite file.
+
+	A job is one version of an input file: the same path with a new size or
+	mtime is a new job, an unchanged file is never queued twice. The file is
+	in WAL mode so status queries from other processes never block the
+	daemon, and every state change is committed at once, so a crash loses
+	nothing but the work of the jobs that were running.
+	'''
+	def __init__(self, path):
+		self.path = path
+		folder = os.path.dirname(os.path.abspath(path))
+		os.makedirs(folder, exist_ok=True)
+		self.connection = sqlite3.connect(path, timeout=30.0, isolation_level=None)  # Autocommit, explicit transactions only
+		self.connection.row_factory = sqlite3.Row
+		self.connection.execute("PRAGMA journal_mode=WAL")
+		self.connection.executescript(SCHEMA)
+
+	def close(self):
+		self.connection.close()
+
+	def enqueue(self, importPath, exportPath, sourceSize, sourceMtime):
+		''' Add a pending job for this version of the file; return its id, or None if it is known already. '''
+		cursor = self.connection.execute(
+			"INSERT OR IGNORE INTO jobs (importPath, sourceSize, sourceMtime, exportPath, status, enqueuedAt) VALUES (?, ?, ?, ?, ?, ?)",
+			(importPath, sourceSize, sourceMtime, exportPath, PENDING, time.time())
+		)
+		if not cursor.rowcount:
+			return None
+		logger.info("Queued job %s: %s", cursor.lastrowid, importPath)
+		return cursor.lastrowid
+
+	def known(self, importPath, sourceSize, sourceMtime):
+		''' Return True if this version of the file already has a job. '''
+		row = self.connection.execute(
+			"SELECT 1 FROM jobs WHERE importPath = ? AND sourceSize = ? AND sourceMtime = ?",
+			(importPath, sourceSize, sourceMtime)
+		).fetchone()
+		return row is not None
+
+	def claim(self, limit):
+		''' Mark up to limit of the oldest pending jobs as running and return them. '''
+		if limit <= 0:
+			return []
+		with self.connection:
+			self.connection.execute("BEGIN IMMEDIATE")
+			rows = self.connection.execute(
+				"SELECT * FROM jobs WHERE status = ? ORDER BY id LIMIT ?", (PENDING, limit)
+			).fetchall()
+			now = time.time()
+			self.connection.executemany(
+				"UPDATE jobs SET status = ?, startedAt = ?, attempts = attempts + 1 WHERE id = ?",
+				[(RUNNING, now, row["id"]) for row in rows]
+			)
+		return [dict(row) for row in rows]
+
+	def finish(self, jobId, result):
+		''' Record a job's pipeline result; a failed result marks the job failed. '''
+		status = DONE if result.get("status") == "ok" else FAILED
+		self.connection.execute(
+			"UPDATE jobs SET status = ?, finishedAt = ?, worker = ?, error = ?, result = ? WHERE id = ?",
+			(status, time.time(), result.get("worker"), result.get("error"), json.dumps(result, default=str), jobId)
+		)
+
+	def release(self, jobId, error, maxAttempts):
+		''' Return a job whose worker died to the queue, or fail it after maxAttempts. '''
+		row = self.connection.execute("SELECT attempts FROM jobs WHERE id = ?", (jobId,)).fetchone()
+		if row is not None and row["attempts"] >= maxAttempts:
+			self.connection.execute(
+				"UPDATE jobs SET status = ?, finishedAt = ?, error = ? WHERE id = ?", (FAILED, time.time(), error, jobId)
+			)
+			logger.error("Job %s failed after %s attempts: %s", jobId, row["attempts"], error)
+		else:
+			self.connection.execute("UPDATE jobs SET status = ?, startedAt = NULL, error = ? WHERE id = ?", (PENDING, error, jobId))
+
+	def recover(self):
+		''' Put jobs left running by a crashed or killed daemon back in the queue. '''
+		cursor = self.connection.execute("UPDATE jobs SET status = ?, startedAt = NULL WHERE status = ?", (PENDING, RUNNING))
+		if cursor.rowcount:
+			logger.warning("Resuming %s jobs interrupted by the last shutdown", cursor.rowcount)
+		return cursor.rowcount
+
+	def stats(self, window=3600.0):
+		''' Queue depth, throughput over the last window seconds and job latencies. '''
+		counts = {status: 0 for status in (PENDING, RUNNING, DONE, FAILED)}
+		for row in self.connection.execute("SELECT status, COUNT(*) AS count FROM jobs GROUP BY status"):
+			counts[row["status"]] = row["count"]
+
+		since = time.time() - window
+		rows = self.connection.execute(
+			"SELECT enqueuedAt, startedAt, finishedAt FROM jobs WHERE status = ? AND finishedAt >= ?", (DONE, since)
+		).fetchall()
+		latencies = [row["finishedAt"] - row["enqueuedAt"] for row in rows]  # Queue wait plus cook
+		cookTimes = [row["finishedAt"] - row["startedAt"] for row in rows if row["startedAt"]]
+		oldest = self.connection.execute("SELECT MIN(enqueuedAt) AS oldest FROM jobs WHERE status = ?", (PENDING,)).fetchone()
+
+		return {
+			"queueDepth": counts[PENDING],
+			"running": counts[RUNNING],
+			"done": counts[DONE],
+			"failed": counts[FAILED],
+			"window": window,
+			"completedInWindow": len(rows),
+			"throughputPerHour": len(rows) * 3600.0 / window if window else 0.0,
+			"latency": {"mean": sum(latencies) / len(latencies) if latencies else None, "p50": _percentile(latencies, 0.5), "p95": _percentile(latencies, 0.95)},
+			"cookTime": {"mean": sum(cookTimes) / len(cookTimes) if cookTimes else None, "p50": _percentile(cookTimes, 0.5), "p95": _percentile(cookTimes, 0.95)},
+			"oldestPendingAge": time.time() - oldest["oldest"] if oldest["oldest"] else None,
+		}
+
+	def jobs(self, status=None, limit=100):
+		''' Return the most recent jobs, optionally only those with the given status. '''
+		query = "SELECT id, importPath, status, attempts, enqueuedAt, startedAt, finishedAt, error FROM jobs"
+		params = ()
+		if status:
+			query += " WHERE status = ?"
+			params = (status,)
+		return [dict(row) for row in self.connection.execute(query + " ORDER BY id DESC LIMIT ?", params + (limit,))]
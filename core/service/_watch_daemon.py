@@ -0,0 +1,273 @@
+# core/service/_watch_daemon.py
+
+import os
+import sys
+import json
+import time
+import signal
+import multiprocessing
+from concurrent.futures import wait, FIRST_COMPLETED
+
+from uv_tool.utils._logger import logger
+from uv_tool.utils._metrics import metrics, observe_result, QUEUE_DEPTH
+from uv_tool.core.batch._batch_runner import ASSET_EXTENSIONS, _init_pool_worker, process_asset
+from uv_tool.core.batch._worker_pool import RecyclingPool, WorkerLost
+from uv_tool.core.caching import EXPORT_BACKENDS, DEFAULT_EXPORT_FORMATS
+from uv_tool.core._options import PipelineOptions
+from uv_tool.core.nodes._polyreduce_budget import BUDGET_POLICIES
+from uv_tool.core.service._job_store import JobStore
+
+DEFAULT_SETTLE_SECONDS = 5.0  # A file must keep its size and mtime this long before it is queued
+DEFAULT_POLL_SECONDS = 2.0
+DEFAULT_MAX_ATTEMPTS = 3  # Worker crashes tolerated per job before it is failed
+DEFAULT_RECYCLE_AFTER = 50  # Assets per worker process before it is replaced
+DB_NAME = ".uv_tool_jobs.sqlite"
+
+
+class FolderWatcher:
+	''' Polls a folder for asset files and reports those that stopped changing.
+
+	A vendor copy over a share writes the file in pieces, so a file is only
+	ready once its size and mtime stayed the same for settleSeconds and it
+	can be opened for reading. Polling is used instead of file system events
+	because those are unreliable on network shares. Folders in exclude,
+	such as an export root inside the input folder, are never scanned.
+	'''
+	def __init__(self, inputDir, settleSeconds=DEFAULT_SETTLE_SECONDS, recursive=True, exclude=()):
+		self.inputDir = os.path.abspath(inputDir)
+		self.settleSeconds = settleSeconds
+		self.recursive = recursive
+		self.exclude = {os.path.abspath(path) for path in exclude}
+		self.files = {}  # Path -> [size, mtime, time first seen with that size and mtime, reported]
+
+	def _files(self):
+		if self.recursive:
+			for root, dirs, files in os.walk(self.inputDir):
+				dirs[:] = [name for name in dirs if not name.startswith(".") and os.path.join(root, name) not in self.exclude]
+				for name in files:
+					yield os.path.join(root, name)
+		else:
+			for name in os.listdir(self.inputDir):
+				yield os.path.join(self.inputDir, name)
+
+	@property
+	def settling(self):
+		''' Number of files seen but not yet reported as settled. '''
+		return sum(1 for entry in self.files.values() if not entry[3])
+
+	def poll(self):
+		''' Return (path, size, mtime) for every file that has settled since the last poll. '''
+		now = time.time()
+		ready = []
+		seen = set()
+		for path in self._files():
+			if not path.lower().endswith(ASSET_EXTENSIONS) or os.path.basename(path).startswith("."):
+				continue
+			try:
+				stat = os.stat(path)
+			except OSError:
+				continue  # Removed or renamed while scanning
+			seen.add(path)
+			signature = (stat.st_size, stat.st_mtime)
+			entry = self.files.get(path)
+			if entry is None or tuple(entry[:2]) != signature:
+				self.files[path] = [stat.st_size, stat.st_mtime, now, False]
+				continue
+			if entry[3] or now - entry[2] < self.settleSeconds:
+				continue
+			if not stat.st_size:
+				entry[3] = True  # Settled but empty: skipped until it is written again
+				logger.warning("Skipping empty file %s", path)
+				continue
+			try:
+				with open(path, "rb"):
+					pass  # Still locked by the writer on Windows shares
+			except OSError:
+				continue
+			entry[3] = True
+			ready.append((path,) + signature)
+
+		for path in list(self.files):
+			if path not in seen:
+				del self.files[path]
+		return ready
+
+
+class WatchDaemon:
+	''' Watches an input folder and runs every new asset through the UV pipeline.
+
+	Settled files become jobs in a JobStore, workers take at most one job
+	each, and everything not yet running stays in the table, so a restart
+	resumes both the interrupted and the waiting jobs. Outputs mirror the
+	input folder layout under exportRoot.
+	'''
+	def __init__(self, inputDir, exportRoot, dbPath=None, workers=None, executable=None, remeshCheck=False,
+			options=None, settleSeconds=DEFAULT_SETTLE_SECONDS,
+			pollSeconds=DEFAULT_POLL_SECONDS, maxAttempts=DEFAULT_MAX_ATTEMPTS, maxAssetsPerWorker=DEFAULT_RECYCLE_AFTER, maxWorkerRss=None,
+			metricsPath=None, metricsPort=None):
+		self.inputDir = os.path.abspath(inputDir)
+		self.exportRoot = os.path.abspath(exportRoot)
+		if self.exportRoot == self.inputDir:
+			raise ValueError(f"The export root must not be the watched folder, or every export is picked up as a new asset: {self.exportRoot}")
+		self.store = JobStore(dbPath or os.path.join(self.exportRoot, DB_NAME))
+		self.watcher = FolderWatcher(self.inputDir, settleSeconds, exclude=[self.exportRoot])  # Exports are never inputs
+		self.workers = max(1, workers or os.cpu_count() or 1)
+		self.executable = executable
+		self.remeshCheck = remeshCheck
+		self.options = options or PipelineOptions.batch()  # How every asset is processed
+		self.pollSeconds = pollSeconds
+		self.maxAttempts = maxAttempts
+		self.maxAssetsPerWorker = maxAssetsPerWorker  # Workers are replaced after this many assets
+		self.maxWorkerRss = maxWorkerRss  # or once their RSS passes this many bytes
+		self.metricsPath = metricsPath  # OpenMetrics textfile rewritten every poll
+		self.metricsPort = metricsPort  # Local HTTP port the metrics are served on
+
+		self.pool = None
+		self.running = {}  # Future -> job id
+		self.stopping = False
+
+	def exportPathFor(self, importPath):
+		''' Mirror the input subfolder of importPath under the export root. '''
+		relative = os.path.relpath(os.path.dirname(importPath), self.inputDir)
+		return os.path.normpath(os.path.join(self.exportRoot, relative))
+
+	def _startPool(self):
+		context = multiprocessing.get_context("spawn")  # Never fork a live Houdini session
+		if self.executable:
+			context.set_executable(self.executable)
+		self.pool = RecyclingPool(self.workers, context, _init_pool_worker, self.maxAssetsPerWorker, self.maxWorkerRss)
+
+	def scan(self):
+		''' Queue every settled file that has no job for its current version. '''
+		for path, size, mtime in self.watcher.poll():
+			if not self.store.known(path, size, mtime):
+				self.store.enqueue(path, self.exportPathFor(path), size, mtime)
+
+	def dispatch(self):
+		''' Hand pending jobs to idle workers, never more than one per worker. '''
+		if self.stopping:
+			return
+		for job in self.store.claim(self.workers - len(self.running)):
+			os.makedirs(job["exportPath"], exist_ok=True)
+			future = self.pool.submit(process_asset, job["importPath"], job["exportPath"], self.remeshCheck, True, self.options)
+			self.running[future] = job["id"]
+			logger.info("Started job %s: %s", job["id"], job["importPath"])
+
+	def collect(self, timeout):
+		''' Wait up to timeout for running jobs and record those that finished. '''
+		if not self.running:
+			time.sleep(timeout)
+			return
+		done, _ = wait(list(self.running), timeout=timeout, return_when=FIRST_COMPLETED)
+		for future in done:
+			jobId = self.running.pop(future)
+			try:
+				result = future.result()
+			except WorkerLost as e:
+				# The pool has already replaced the worker, only this job needs another go
+				self.store.release(jobId, f"{type(e).__name__}: {e}", self.maxAttempts)
+				continue
+			except Exception as e:
+				result = {"status": "failed", "error": f"{type(e).__name__}: {e}", "worker": None}
+			self.store.finish(jobId, result)
+			observe_result(result)
+			if result["status"] == "ok":
+				logger.info("Finished job %s in %.2f seconds", jobId, result["elapsed"])
+			else:
+				logger.error("Job %s failed: %s", jobId, result["error"])
+
+	def publishMetrics(self):
+		''' Update the queue depth and write the metrics textfile, if there is one. '''
+		QUEUE_DEPTH.set(self.store.stats(0)["queueDepth"])
+		if self.metricsPath:
+			metrics.write_textfile(self.metricsPath)
+
+	def stop(self, *args):
+		''' Stop taking new jobs; the running ones are finished before run() returns. '''
+		if not self.stopping:
+			logger.info("Stopping after %s running jobs", len(self.running))
+		self.stopping = True
+
+	def run(self, once=False):
+		''' Watch and process until stopped; with once, exit when the folder is drained. '''
+		os.makedirs(self.exportRoot, exist_ok=True)
+		self.store.recover()
+		self._startPool()
+		server = metrics.serve(self.metricsPort) if self.metricsPort else None
+		logger.info("Watching %s on %s workers, exporting to %s", self.inputDir, self.workers, self.exportRoot)
+		try:
+			while not self.stopping or self.running:
+				if not self.stopping:
+					self.scan()
+					self.dispatch()
+				self.collect(self.pollSeconds)
+				self.publishMetrics()
+				if once and not self.running and not self.watcher.settling and not self.store.stats(0)["queueDepth"]:
+					break
+		finally:
+			self.pool.shutdown(wait=True)
+			self.publishMetrics()
+			self.store.close()
+			if server:
+				server.shutdown()
+		return self
+
+
+def main(argv=None):
+	''' Command-line entry: watch <input> -o <exportRoot> [-j N], or status -o <exportRoot>. '''
+	import argparse
+
+	parser = argparse.ArgumentParser(description="Watch a folder and remesh and UV every asset dropped into it")
+	commands = parser.add_subparsers(dest="command", required=True)
+
+	watch = commands.add_parser("watch", help="Run the daemon")
+	watch.add_argument("input", help="Folder to watch")
+	watch.add_argument("-o", "--output", required=True, help="Export root")
+	watch.add_argument("--db", default=None, help=f"Job table, default: <export root>/{DB_NAME}")
+	watch.add_argument("-j", "--workers", type=int, default=None, help="Number of worker processes")
+	watch.add_argument("--executable", default=None, help="Interpreter for the workers, e.g. hython")
+	watch.add_argument("--remesh", action="store_true", help="Enable polyreduce remeshing")
+	watch.add_argument("--formats", nargs="+", default=list(DEFAULT_EXPORT_FORMATS), choices=sorted(EXPORT_BACKENDS), help="Export formats to write")
+	watch.add_argument("--budget", default=None, choices=sorted(BUDGET_POLICIES), help="Polyreduce budget policy when remeshing")
+	watch.add_argument("--settle", type=float, default=DEFAULT_SETTLE_SECONDS, help="Seconds a file must stay unchanged before it is queued")
+	watch.add_argument("--poll", type=float, default=DEFAULT_POLL_SECONDS, help="Seconds between folder scans")
+	watch.add_argument("--once", action="store_true", help="Exit once every file in the folder is processed")
+	watch.add_argument("--recycle-after", type=int, default=DEFAULT_RECYCLE_AFTER, help="Replace a worker after this many assets")
+	watch.add_argument("--max-rss", type=float, default=None, help="Replace a worker once its memory passes this many MB")
+	watch.add_argument("--metrics-file", default=None, help="Rewrite OpenMetrics text here every poll, e.g. for the node_exporter textfile collector")
+	watch.add_argument("--metrics-port", type=int, default=None, help="Serve the metrics on this local HTTP port")
+
+	status = commands.add_parser("status", help="Print queue depth, throughput and latency as JSON")
+	status.add_argument("-o", "--output", default=None, help="Export root of the daemon")
+	status.add_argument("--db", default=None, help="Job table, instead of the one under the export root")
+	status.add_argument("--window", type=float, default=3600.0, help="Seconds of history for throughput and latency")
+	status.add_argument("--jobs", default=None, nargs="?", const="", help="Also list recent jobs, optionally of one status")
+	args = parser.parse_args(argv)
+
+	if args.command == "status":
+		if not args.db and not args.output:
+			parser.error("status needs -o or --db")
+		store = JobStore(args.db or os.path.join(os.path.abspath(args.output), DB_NAME))
+		try:
+			report = store.stats(args.window)
+			if args.jobs is not None:
+				report["jobs"] = store.jobs(args.jobs or None)
+		finally:
+			store.close()
+		print(json.dumps(report, indent=2))
+		return 0
+
+	daemon = WatchDaemon(
+		args.input, args.output, args.db, args.workers, args.executable, args.remesh,
+		PipelineOptions.batch(budgetPolicy=args.budget, exportFormats=args.formats), args.settle, args.poll, maxAssetsPerWorker=args.recycle_after,
+		maxWorkerRss=int(args.max_rss * 1024 * 1024) if args.max_rss else None,
+		metricsPath=args.metrics_file, metricsPort=args.metrics_port
+	)
+	signal.signal(signal.SIGINT, daemon.stop)
+	signal.signal(signal.SIGTERM, daemon.stop)
+	daemon.run(args.once)
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
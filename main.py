@@ -8,9 +8,9 @@ TOOL_DIR = os.path.dirname(__file__)
 if TOOL_DIR not in sys.path:
 	sys.path.append(TOOL_DIR)
 
-from uv_tool.ui._qt_ui_controller import myQtUIClass
-
 def main():
+	from uv_tool.ui._qt_ui_controller import myQtUIClass  # Qt is only imported once the UI is shown
+
 	ui = myQtUIClass()  # Create an instance of the UI class
 	ui.show()
 	return ui
@@ -0,0 +1,319 @@
+# stubs/hou.py
+
+''' Minimal stand-in for the Houdini `hou` module.
+
+Put this folder on sys.path (or PYTHONPATH) to import and drive the uv_tool
+pipeline on a machine without Houdini. Nodes, parms and flags are tracked in
+memory; cooking and rendering are no-ops. Every node creation, parm set,
+cook and other costly call is counted, see callCounts().
+'''
+
+import os
+import json
+from collections import Counter
+
+IS_STUB = True  # Lets tools tell the stand-in apart from a real Houdini session
+
+_nodes = {}  # Every live node keyed by its full path
+_calls = Counter()  # Number of calls per recorded operation
+
+
+class OperationFailed(Exception):
+	''' Raised when a stand-in node operation cannot be performed. '''
+
+
+class ObjectWasDeleted(Exception):
+	''' Raised in Houdini when a destroyed node is used. '''
+
+
+class Parm:
+	''' A single node parameter holding a plain Python value. '''
+	def __init__(self, node, name):
+		self._node = node
+		self._name = name
+		self._value = 0
+
+	def name(self):
+		return self._name
+
+	def node(self):
+		return self._node
+
+	def set(self, value):
+		_calls["parmSet"] += 1
+		self._value = value
+
+	def eval(self):
+		return self._value
+
+	def evalAsString(self):
+		return str(self._value)
+
+	def pressButton(self):
+		_calls["pressButton"] += 1
+
+
+class NodeType:
+	def __init__(self, name):
+		self._name = name
+
+	def name(self):
+		return self._name
+
+
+class BoundingBox:
+	def __init__(self, size=(0.0, 0.0, 0.0)):
+		self._size = size
+
+	def sizevec(self):
+		return self._size
+
+
+class attribType:
+	Point = "point"
+	Prim = "prim"
+	Vertex = "vertex"
+	Global = "global"
+
+
+class Polygon:
+	''' A primitive holding only its attribute values. '''
+	def __init__(self, geometry, attribs):
+		self._geometry = geometry
+		self._attribs = attribs
+
+	def attribValue(self, name):
+		return self._attribs.get(name, self._geometry._primDefaults.get(name))
+
+	def setAttribValue(self, name, value):
+		self._attribs[name] = value
+
+	def vertices(self):
+		return ()
+
+
+class Geometry:
+	''' Cooked geometry without points; a node's geometry is empty and forms a single piece.
+	Primitives and their attributes can be added, deleted, merged and saved; loadFromFile
+	reads back what saveToFile wrote. '''
+	def __init__(self, node=None):
+		self._node = node
+		self._prims = []
+		self._primDefaults = {}
+
+	def points(self):
+		return ()
+
+	def prims(self):
+		return tuple(self._prims)
+
+	def intrinsicValue(self, name):
+		return len(self._prims) if name == "primitivecount" else 0
+
+	def boundingBox(self):
+		return BoundingBox()
+
+	def freeze(self):
+		copy = Geometry()
+		copy.merge(self)
+		return copy
+
+	def addAttrib(self, type, name, default):
+		if type == attribType.Prim:
+			self._primDefaults[name] = default
+
+	def createPolygon(self):
+		prim = Polygon(self, {})
+		self._prims.append(prim)
+		return prim
+
+	def deletePrims(self, prims, keep_points=False):
+		_calls["deletePrims"] += 1
+		doomed = set(map(id, prims))
+		self._prims = [prim for prim in self._prims if id(prim) not in doomed]
+
+	def findVertexAttrib(self, name):
+		return None
+
+	def findPointAttrib(self, name):
+		return None
+
+	def vertexFloatAttribValuesAsString(self, name):
+		return b""
+
+	def vertexIntAttribValuesAsString(self, name):
+		return b""
+
+	def primIntAttribValues(self, name):
+		return tuple(prim.attribValue(name) for prim in self._prims) if self._prims else (0,)
+
+	def primStringAttribValues(self, name):
+		return tuple(prim.attribValue(name) for prim in self._prims) if self._prims else ("piece",)
+
+	def merge(self, geometry):
+		for name, default in geometry._primDefaults.items():
+			self._primDefaults.setdefault(name, default)
+		self._prims.extend(Polygon(self, dict(prim._attribs)) for prim in geometry._prims)
+
+	def loadFromFile(self, path):
+		if not os.path.exists(path):
+			raise OperationFailed(f"No such file: {path}")
+		with open(path) as f:
+			lines = f.read().splitlines()[1:]
+		self._prims = [Polygon(self, json.loads(line)) for line in lines]
+
+	def saveToFile(self, path):
+		_calls["saveToFile"] += 1
+		source = self._node.path() if self._node else "memory"
+		with open(path, "w") as f:
+			f.write(f"stub geometry from {source}\n")
+			for prim in self._prims:
+				f.write(json.dumps({name: prim.attribValue(name) for name in set(self._primDefaults) | set(prim._attribs)}) + "\n")
+
+
+class Node:
+	''' An in-memory node with children, inputs, parms and flags. '''
+	def __init__(self, parent, nodeType, name):
+		self._parent = parent
+		self._type = NodeType(nodeType)
+		self._name = name
+		self._children = []
+		self._inputs = []
+		self._parms = {}
+		self._display = False
+		self._bypass = False
+
+	def name(self):
+		return self._name
+
+	def path(self):
+		if self._parent is None:
+			return "/" + self._name if self._name else "/"
+		parentPath = self._parent.path().rstrip("/")
+		return f"{parentPath}/{self._name}"
+
+	def parent(self):
+		return self._parent
+
+	def type(self):
+		return self._type
+
+	def children(self):
+		return tuple(self._children)
+
+	def node(self, path):
+		return node(path if path.startswith("/") else f"{self.path()}/{path}")
+
+	def createNode(self, nodeType, name=None):
+		''' Create a child node, suffixing the name to keep it unique. '''
+		_calls["createNode"] += 1
+		base = name or f"{nodeType}1"
+		childName = base
+		used = set(child.name() for child in self._children)
+		index = 1
+		while childName in used:
+			index += 1
+			childName = f"{base.rstrip('0123456789')}{index}"
+
+		child = Node(self, nodeType, childName)
+		self._children.append(child)
+		_nodes[child.path()] = child
+		return child
+
+	def destroy(self):
+		_calls["destroy"] += 1
+		for child in list(self._children):
+			child.destroy()
+		_nodes.pop(self.path(), None)
+		if self._parent is not None and self in self._parent._children:
+			self._parent._children.remove(self)
+
+	def setInput(self, index, inputNode):
+		_calls["setInput"] += 1
+		while len(self._inputs) <= index:
+			self._inputs.append(None)
+		self._inputs[index] = inputNode
+
+	def inputs(self):
+		return tuple(self._inputs)
+
+	def parms(self):
+		return tuple(self._parms.values())
+
+	def parm(self, name):
+		if name not in self._parms:
+			self._parms[name] = Parm(self, name)
+		return self._parms[name]
+
+	def setParms(self, parmDict):
+		_calls["setParms"] += 1  # One round trip however many parms it sets
+		for name, value in parmDict.items():
+			self.parm(name)._value = value
+
+	def setDisplayFlag(self, on):
+		self._display = bool(on)
+
+	def isDisplayFlagSet(self):
+		return self._display
+
+	def bypass(self, on):
+		self._bypass = bool(on)
+
+	def isBypassed(self):
+		return self._bypass
+
+	def cook(self, force=False):
+		_calls["cook"] += 1
+
+	def geometry(self):
+		_calls["cook"] += 1  # Reading geometry cooks the node in Houdini
+		return Geometry(self)
+
+	def render(self, *args, **kwargs):
+		pass
+
+
+def _reset():
+	''' Rebuild the root network with the standard top-level contexts. '''
+	_nodes.clear()
+	root = Node(None, "root", "")
+	_nodes["/"] = root
+	for context in ("obj", "out", "stage"):
+		child = Node(root, "manager", context)
+		root._children.append(child)
+		_nodes[child.path()] = child
+
+
+def callCounts():
+	''' Return how often each recorded operation was called since the last reset. '''
+	return dict(_calls)
+
+
+def resetCallCounts():
+	_calls.clear()
+
+
+def node(path):
+	''' Return the node at the given path, or None. '''
+	return _nodes.get(path.rstrip("/") or "/")
+
+
+def isUIAvailable():
+	return False
+
+
+def applicationVersionString():
+	return "0.0.0-stub"
+
+
+def hscript(command):
+	''' Run an HScript command; the stand-in only records it. '''
+	_calls["hscript"] += 1
+	return "", ""
+
+
+def getenv(name, default=None):
+	return os.environ.get(name, default)
+
+
+_reset()
@@ -0,0 +1,48 @@
+# tests/test_batch_runner.py
+
+from uv_tool.core import _controller
+from uv_tool.core.batch import _batch_runner
+
+
+class FailingTool:
+	''' Builds part of a network under topNode and then fails, as a constructor cooking a broken asset does. '''
+	def __init__(self, importPath, exportPath, *args, topNode=None, **kwargs):
+		topNode.createNode("geo", "half_built")
+		raise RuntimeError("cook failed")
+
+
+def test_failed_construction_leaves_worker_network_empty(topNode, monkeypatch):
+	monkeypatch.setattr(_controller, "UVToolClass", FailingTool)
+	monkeypatch.setattr(_batch_runner, "_workerRoot", topNode)
+	result = _batch_runner.process_asset("broken.obj", "out")
+	assert result["status"] == "failed" and "cook failed" in result["error"]
+	assert not topNode.children()
+
+
+def test_reused_network_takes_each_assets_options(sphere, tmp_path, topNode, monkeypatch):
+	from uv_tool.core import PipelineOptions
+
+	monkeypatch.setattr(_batch_runner, "_workerRoot", topNode)
+	monkeypatch.setattr(_batch_runner, "_workerPipeline", None)
+	options = PipelineOptions(useCache=False, measureUVs=False)
+	first = _batch_runner.process_asset(sphere("first", 200), str(tmp_path / "out"), options=options.replace(exportFormats=("fbx",)))
+	second = _batch_runner.process_asset(sphere("second", 200), str(tmp_path / "out"), options=options.replace(exportFormats=("obj",)))
+	assert first["status"] == second["status"] == "ok"
+	assert set(first["exports"]) == {"fbx"} and set(second["exports"]) == {"obj"}
+	assert _batch_runner._workerPipeline.cache is None
+
+
+def test_only_pool_workers_ignore_ctrl_c(monkeypatch):
+	import signal
+
+	monkeypatch.setattr(_batch_runner, "_workerRoot", None)
+	before = signal.getsignal(signal.SIGINT)
+	try:
+		_batch_runner._init_worker()  # As run_manifest and in-process LODs do in the parent
+		assert signal.getsignal(signal.SIGINT) is before
+		_batch_runner._workerRoot.destroy()
+		_batch_runner._init_pool_worker()
+		assert signal.getsignal(signal.SIGINT) is signal.SIG_IGN
+		_batch_runner._workerRoot.destroy()
+	finally:
+		signal.signal(signal.SIGINT, before)
@@ -0,0 +1,55 @@
+# tests/test_benchmarks.py
+
+import copy
+import importlib
+
+import pytest
+
+from uv_tool.benchmarks import bench_suite
+from uv_tool.benchmarks._bench_cli import STUB_NOTICE
+
+BENCHMARKS = ("bench_dead_stages", "bench_export_backends", "bench_piece_unwrap", "bench_polyreduce_budget", "bench_startup", "bench_suite", "bench_warm_network")
+
+
+@pytest.mark.parametrize("name", BENCHMARKS)
+def test_help_exits_before_any_setup(name, capsys):
+	module = importlib.import_module(f"uv_tool.benchmarks.{name}")
+	with pytest.raises(SystemExit) as raised:
+		module.main(["--help"])
+	assert raised.value.code == 0
+	assert "usage:" in capsys.readouterr().out
+
+
+@pytest.fixture(scope="module")
+def suiteResults(tmp_path_factory):
+	''' One repeat of the smallest cases, which the stand-in module runs in well under a second. '''
+	return bench_suite.run_suite(str(tmp_path_factory.mktemp("suite")), maxFaces=1000, repeat=1)
+
+
+def test_suite_times_and_counts_every_phase(suiteResults):
+	assert [case["case"] for case in suiteResults["cases"]] == ["single_1000", "single_ucx_1000", "multi_1000", "multi_ucx_1000"]
+	for case in suiteResults["cases"]:
+		assert set(case["timings"]) == {"preflight", "create_remesh_layout", "create_uv_layout", "setupNodes", "cacheAndExport"}
+		assert case["calls"]["setupNodes"]  # The stand-in module counts its calls
+
+
+def test_compare_reports_slower_phases_and_more_calls(suiteResults):
+	assert bench_suite.compare(suiteResults, suiteResults) == []
+
+	baseline = copy.deepcopy(suiteResults)
+	case = baseline["cases"][0]
+	case["timings"]["cacheAndExport"] = suiteResults["cases"][0]["timings"]["cacheAndExport"] / 10.0 - 1.0  # Far faster before
+	operation = next(iter(case["calls"]["setupNodes"]))
+	case["calls"]["setupNodes"][operation] -= 1
+	regressions = bench_suite.compare(suiteResults, baseline, minSeconds=0.0)
+	assert len(regressions) == 2
+	assert regressions[0].startswith("single_1000 cacheAndExport:")
+	assert f"{operation} calls" in regressions[1]
+
+
+def test_stand_in_module_is_announced(capsys):
+	import argparse
+	from uv_tool.benchmarks._bench_cli import parse_args
+
+	parse_args(argparse.ArgumentParser(), [])
+	assert STUB_NOTICE in capsys.readouterr().err
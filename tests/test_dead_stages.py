@@ -0,0 +1,47 @@
+# tests/test_dead_stages.py
+
+from uv_tool.core.nodes import PipelineSpec, find_dead_stages
+from uv_tool.core.nodes._dead_stages import ANY
+
+SPEC = PipelineSpec.from_dict({"name": "small", "nodes": [
+	{"name": "importFile", "type": "file"},
+	{"name": "measure", "type": "measure", "inputs": ["importFile"], "produces": ["point:curvature"], "consumes": []},
+	{"name": "group", "type": "groupcreate", "inputs": ["measure"], "produces": ["edgegroup:sharp"], "consumes": ["point:curvature"]},
+	{"name": "uvFlatten", "type": "uvflatten", "inputs": ["group"], "produces": ["vertex:uv"], "consumes": ["edgegroup:sharp"]},
+	{"name": "visualizer", "type": "visualize_uvs", "inputs": ["uvFlatten"], "produces": ["vertex:Cd"], "consumes": ["vertex:uv"]},
+	{"name": "OUT", "type": "null", "inputs": ["visualizer"], "consumes": []},
+	{"name": "unread", "type": "measure", "inputs": ["OUT"], "produces": ["prim:area"], "consumes": []},
+]})
+
+
+def test_nodes_nothing_reads_are_dead():
+	analysis = find_dead_stages(SPEC, {"OUT": ("vertex:uv",)})
+	assert analysis.dead == ["visualizer"]  # Its Cd is not read; the chain to the uvs is, through the groups
+	assert "unread" not in analysis.reachable
+	assert analysis.demand["uvFlatten"] == {"vertex:uv"}
+
+
+def test_demand_for_everything_keeps_every_node():
+	assert find_dead_stages(SPEC, {"OUT": (ANY,)}).dead == []
+
+
+def test_estimate_scales_with_primitives():
+	analysis = find_dead_stages(SPEC, {"OUT": ("point:N",)})
+	assert analysis.dead == ["measure", "group", "uvFlatten", "visualizer"]
+	assert analysis.estimatedSeconds(2000000) == 2 * analysis.estimatedSeconds(1000000) > 0
+
+
+def test_elimination_is_opt_in_and_undone_on_a_reused_network(topNode, sphere, tmp_path):
+	from uv_tool.core import UVToolClass, PipelineOptions
+
+	tool = UVToolClass(sphere("ball", 500), str(tmp_path / "out"), topNode=topNode, useCache=False, measureUVs=False)
+	visualizer = tool.builds["uv"]["uvVisualizer"]
+	assert tool.deadStageReport is None and not visualizer.isBypassed()  # Cd still reaches the export by default
+
+	tool.setOptions(PipelineOptions(useCache=False, measureUVs=False, eliminateDeadStages=True))
+	tool.bypassDeadStages()
+	assert visualizer.isBypassed()
+
+	tool.setOptions(PipelineOptions(useCache=False, measureUVs=False))
+	tool.bypassDeadStages()
+	assert not visualizer.isBypassed()
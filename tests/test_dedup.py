@@ -0,0 +1,66 @@
+# tests/test_dedup.py
+
+import shutil
+
+import pytest
+
+from uv_tool.core import UVToolClass
+from uv_tool.core.caching import ResultCache
+from uv_tool.core.dedup import fingerprint_arrays
+
+
+def obj_arrays(path):
+	''' Per-vertex positions, point numbers and face sizes of an OBJ, as fingerprintAttribs writes them. '''
+	positions, vertexPositions, points, counts = [], [], [], []
+	with open(path) as f:
+		for line in f:
+			if line.startswith("v "):
+				positions.append([float(value) for value in line.split()[1:4]])
+			elif line.startswith("f "):
+				references = [int(reference.split("/")[0]) - 1 for reference in line.split()[1:]]
+				for point in references:
+					vertexPositions.append(positions[point])
+					points.append(point)
+					counts.append(len(references))
+	return vertexPositions, points, counts
+
+
+@pytest.fixture
+def run(topNode, tmp_path, monkeypatch):
+	''' Process an asset against one ResultCache, fingerprinting the OBJ it imports. '''
+	import uv_tool.core.dedup
+
+	cache = ResultCache(str(tmp_path / "cache"))
+	current = {}
+	# The stand-in hou cooks empty geometry, so hash the mesh the fingerprint branch would see
+	monkeypatch.setattr(uv_tool.core.dedup, "geometry_fingerprint", lambda geometry: fingerprint_arrays(*obj_arrays(current["path"])))
+
+	def process(path):
+		current["path"] = path
+		tool = UVToolClass(path, str(tmp_path / "out"), topNode=topNode, cache=cache, useCache=True, dedup=True)
+		tool.destroyNetwork()
+		return tool
+	return process
+
+
+def test_identical_mesh_reuses_uvs(run, sphere, tmp_path):
+	original = sphere("crate", 800)
+	copy = str(tmp_path / "crate_copy.obj")
+	shutil.copyfile(original, copy)
+	with open(copy, "a") as f:
+		f.write("# exported again\n")  # Other file contents, same geometry
+
+	first = run(original)
+	assert first.dedupInfo["hit"] is False and not first.dedupHit
+
+	second = run(copy)
+	assert not second.uvCacheHit  # Not a plain cache hit on the file contents
+	assert second.dedupHit and second.dedupInfo["hit"]
+	assert second.dedupInfo["fingerprint"] == first.dedupInfo["fingerprint"]
+
+
+def test_different_mesh_unwraps_again(run, sphere):
+	first = run(sphere("small", 800))
+	second = run(sphere("large", 800, radius=2.0))
+	assert not second.dedupHit and second.dedupInfo["hit"] is False
+	assert second.dedupInfo["fingerprint"] != first.dedupInfo["fingerprint"]
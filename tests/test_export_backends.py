@@ -0,0 +1,57 @@
+# tests/test_export_backends.py
+
+import os
+import json
+import struct
+from array import array
+
+import pytest
+
+from uv_tool.core.caching import _export_backends as backends
+
+# Two triangles: positions and float3 UVs on every vertex, as the triangle branch provides them
+POSITIONS = (0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 0, 0, 1, 1, 0, 0, 1, 0)
+UVS = (0.0, 0.0, 0, 1.0, 0.0, 0, 0.0, 1.0, 0, 1.0, 0.0, 0, 1.0, 1.0, 0, 0.0, 1.0, 0)
+
+
+class TriangleGeometry:
+	''' Frozen geometry of the triangle branch, answering the bulk calls only. '''
+	def findVertexAttrib(self, name):
+		return name if name in (backends.TRIANGLE_POSITION_ATTRIB, "uv") else None
+
+	def vertexFloatAttribValuesAsString(self, name):
+		values = POSITIONS if name == backends.TRIANGLE_POSITION_ATTRIB else UVS
+		return array("f", values).tobytes()
+
+	def prims(self):
+		raise AssertionError("The bulk path must not walk the primitives")
+
+
+def test_triangle_arrays_flip_uvs_and_winding():
+	positions, uvs, indices = backends._triangle_arrays(TriangleGeometry())
+	assert list(positions) == list(POSITIONS)
+	assert list(uvs) == [0.0, 1.0, 1.0, 1.0, 0.0, 0.0, 1.0, 1.0, 1.0, 0.0, 0.0, 0.0]
+	assert list(indices) == [0, 2, 1, 3, 5, 4]
+
+
+def test_gltf_from_triangles(tmp_path):
+	path = str(tmp_path / "mesh.glb")
+	backends._write_gltf(None, TriangleGeometry(), path)
+	with open(path, "rb") as f:
+		magic, version, length = struct.unpack("<III", f.read(12))
+		jsonLength, _ = struct.unpack("<II", f.read(8))
+		document = json.loads(f.read(jsonLength))
+	assert (magic, version, length) == (0x46546C67, 2, os.path.getsize(path))
+	assert [accessor["count"] for accessor in document["accessors"]] == [6, 6, 6]
+	assert document["accessors"][0]["max"] == [1.0, 1.0, 0.0]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="File modes are POSIX")
+def test_temp_files_follow_the_umask(tmp_path):
+	previous = os.umask(0o027)
+	try:
+		tempPath = backends._create_temp(str(tmp_path / "asset.bgeo.sc"))
+	finally:
+		os.umask(previous)
+	assert os.path.basename(tempPath).startswith(".asset.bgeo.sc_") and tempPath.endswith(".bgeo.sc")
+	assert os.stat(tempPath).st_mode & 0o777 == 0o640
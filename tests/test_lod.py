@@ -0,0 +1,54 @@
+# tests/test_lod.py
+
+import os
+
+import pytest
+
+from uv_tool.core.lod import generate_lods, LOD_REMESH_PIPELINE
+from uv_tool.core.lod import _lod_pipeline
+
+POLYGONS = 10000
+
+
+@pytest.fixture
+def finalCounts(monkeypatch):
+	''' Report POLYGONS for the cleaned input, as the stand-in hou cooks empty geometry,
+	and record the polyreduce budget each LOD branch cooked with. '''
+	cookShared = _lod_pipeline.cook_shared_stages
+	cookLod = _lod_pipeline._cook_lod
+	counts = []
+
+	def cook_lod(*args, **kwargs):
+		tool = cookLod(*args, **kwargs)
+		counts.append(tool.budgetPolicy.count)
+		return tool
+
+	monkeypatch.setattr(_lod_pipeline, "cook_shared_stages", lambda *args: (cookShared(*args)[0], POLYGONS))
+	monkeypatch.setattr(_lod_pipeline, "_cook_lod", cook_lod)
+	return counts
+
+
+def test_every_target_is_a_branch_of_one_clean(topNode, sphere, tmp_path, finalCounts):
+	exportPath = str(tmp_path / "out")
+	report = generate_lods(sphere("crate", 500), exportPath, (1.0, 0.5, 0.1, 0.02), topNode=topNode)
+
+	assert report["polygons"] == POLYGONS
+	assert [lod["asset"] for lod in report["lods"]] == ["crate_LOD0", "crate_LOD1", "crate_LOD2", "crate_LOD3"]
+	assert [lod["status"] for lod in report["lods"]] == ["ok"] * 4
+	assert [lod["targetPolygons"] for lod in report["lods"]] == [10000, 5000, 1000, 200]
+	assert finalCounts == [10000, 5000, 1000, 200]
+	assert os.path.basename(report["lods"][3]["outputs"]["fbx"]) == "crate_LOD3_NewUV.fbx"
+	assert all(not node.children() for node in topNode.children())  # Shared and branch networks are cleaned up
+
+
+def test_branches_skip_the_shared_stages():
+	nodes = {node["name"]: node for node in LOD_REMESH_PIPELINE["nodes"]}
+	assert nodes["importFile"]["type"] == "file"
+	assert [nodes[name]["type"] for name in ("attribDelete", "deleteUCX", "clean")] == ["null"] * 3
+	assert nodes["polyReduce"]["type"] == "polyreduce"
+
+
+@pytest.mark.parametrize("targets", [(), (1.0, 0.0), (1.5,)])
+def test_targets_must_be_fractions(targets, tmp_path):
+	with pytest.raises(ValueError):
+		generate_lods(str(tmp_path / "crate.obj"), str(tmp_path / "out"), targets)
@@ -0,0 +1,38 @@
+# tests/test_logger.py
+
+import os
+import sys
+import subprocess
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SCRIPT = f"""
+import sys, threading
+sys.path.insert(0, {TESTS_DIR!r})
+import conftest
+import uv_tool.core
+print(threading.active_count(), "http.server" in sys.modules)
+from uv_tool.utils._logger import logger
+logger.info("first record")
+print(threading.active_count())
+"""
+
+
+def test_import_is_quiet_until_the_first_record():
+	run = subprocess.run([sys.executable, "-c", SCRIPT], capture_output=True, text=True, timeout=60, env=dict(os.environ, UV_TOOL_LOG_FILE="0"))
+	assert run.returncode == 0, run.stderr
+	assert run.stdout.split() == ["1", "False", "2"]  # No writer thread and no HTTP server module until a record is logged
+	assert "first record" in run.stderr
+
+
+def test_first_record_is_written_once(tmp_path):
+	script = f"import sys; sys.path.insert(0, {TESTS_DIR!r}); import conftest; from uv_tool.utils._logger import logger; logger.info('first record'); logger.info('second record')"
+	env = dict(os.environ, UV_TOOL_LOG_FILE="1", UV_TOOL_LOG_ASYNC="0", UV_TOOL_LOG_DIR=str(tmp_path))
+	run = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=60, env=env)
+	assert run.returncode == 0, run.stderr
+	assert run.stderr.count("first record") == 1
+	assert run.stderr.count("second record") == 1
+	logFiles = [os.path.join(folder, name) for folder, _, names in os.walk(tmp_path) for name in names]
+	assert len(logFiles) == 1
+	with open(logFiles[0]) as f:
+		assert f.read().count("first record") == 1
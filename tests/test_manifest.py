@@ -0,0 +1,46 @@
+# tests/test_manifest.py
+
+import json
+
+import pytest
+
+from uv_tool.core.batch import load_manifest
+from uv_tool.core.nodes import InputStats
+
+
+def write_manifest(tmp_path, data):
+	path = tmp_path / "manifest.json"
+	path.write_text(json.dumps(data))
+	return str(path)
+
+
+@pytest.mark.parametrize("target", [50, 250000])
+def test_polyreduce_target_is_not_clamped(tmp_path, target):
+	path = write_manifest(tmp_path, {"defaults": {"output": "out", "remesh": True}, "assets": [{"input": "a.obj", "polyreduceTarget": target}]})
+	asset, = load_manifest(path)
+	assert asset.budgetPolicy().budget(InputStats(1000000)) == target
+
+
+def test_unknown_option_is_rejected(tmp_path):
+	path = write_manifest(tmp_path, [{"input": "a.obj", "output": "out", "polyreduce": 50}])
+	with pytest.raises(ValueError, match="unknown options polyreduce"):
+		load_manifest(path)
+
+
+def test_lod_workers_reach_generate_lods(tmp_path, monkeypatch):
+	import uv_tool.core.lod as lod
+	from uv_tool.core.batch import run_manifest
+
+	calls = []
+
+	def generate_lods(importPath, exportPath, targets, workers=None, **kwargs):
+		calls.append(workers)
+		return {"sharedSeconds": 0.0, "branchSeconds": 0.0, "polygons": 0, "lods": []}
+	monkeypatch.setattr(lod, "generate_lods", generate_lods)
+
+	(tmp_path / "a.obj").write_text("v 0 0 0\n")
+	path = write_manifest(tmp_path, [{"input": "a.obj", "output": "out", "lods": [1, 0.5], "lodWorkers": 2}])
+	asset, = load_manifest(path)
+	report = run_manifest([asset])
+	assert calls == [2]
+	assert report["results"][0]["options"]["lodWorkers"] == 2
@@ -0,0 +1,50 @@
+# tests/test_metrics.py
+
+import logging
+
+import pytest
+
+from uv_tool.core import UVToolClass
+from uv_tool.utils import MetricsRegistry, observe_result
+from uv_tool.utils._logger import logger
+from uv_tool.utils._metrics import STAGE_SECONDS, WORKER_RSS, TOTAL_STAGE
+
+
+def stage_count(stage):
+	counts, _ = STAGE_SECONDS.values.get((stage,), ([0], 0.0))
+	return counts[-1]
+
+
+@pytest.fixture
+def quiet_logger():
+	level = logger.level
+	logger.setLevel(logging.WARNING)
+	yield logger
+	logger.setLevel(level)
+
+
+def test_stage_times_are_observed_whatever_the_log_level(tmp_path, topNode, sphere, quiet_logger):
+	before = {stage: stage_count(stage) for stage in ("uv", "export", TOTAL_STAGE)}
+	tool = UVToolClass(sphere("ball", 500), str(tmp_path / "out"), topNode=topNode, useCache=False)
+	tool.destroyNetwork()
+	assert {stage: stage_count(stage) - count for stage, count in before.items()} == {"uv": 1, "export": 1, TOTAL_STAGE: 1}
+
+
+def test_worker_memory_is_labelled_by_slot():
+	for pid in (101, 102, 103):  # Three recycled workers in the same slot
+		observe_result({"status": "ok", "elapsed": 1.0, "worker": pid, "slot": 0, "memory": {"rssAfter": pid}}, stages=False)
+	assert WORKER_RSS.values[("0",)] == 103
+	assert not any(key in WORKER_RSS.values for key in (("101",), ("102",), ("103",)))
+
+
+def test_registry_renders_openmetrics():
+	registry = MetricsRegistry()
+	registry.counter("jobs", "Jobs run.").inc(2)
+	registry.histogram("seconds", "Seconds taken.", ("stage",), buckets=(1.0,)).observe(0.5, stage="uv")
+	assert registry.render().splitlines() == [
+		"# TYPE jobs counter", "# HELP jobs Jobs run.", "jobs_total 2",
+		"# TYPE seconds histogram", "# HELP seconds Seconds taken.",
+		'seconds_bucket{stage="uv",le="1.0"} 1', 'seconds_bucket{stage="uv",le="+Inf"} 1',
+		'seconds_count{stage="uv"} 1', 'seconds_sum{stage="uv"} 0.5',
+		"# EOF",
+	]
@@ -0,0 +1,26 @@
+# tests/test_pipeline_spec.py
+
+from uv_tool.core.nodes import PipelineSpec, compile_pipeline
+
+SNIPPET = """if (@P.y < 0) {
+	int pts[] = {0, 1, 2};
+	s@source = "{assetName}";
+}"""
+
+
+def test_only_context_keys_are_substituted(topNode):
+	spec = PipelineSpec.from_dict({"name": "braces", "nodes": [
+		{"name": "importFile", "type": "file", "parms": {"file": "{importFile}"}},
+		{"name": "tag", "label": "{assetName}_tag", "type": "attribwrangle", "inputs": ["importFile"], "parms": {
+			"snippet": SNIPPET,
+			"expression": "ch('../{unknown}') + {1}",
+			"metadata": '{"lod": {"levels": [1, 2]}}',
+		}},
+	]})
+	build = compile_pipeline(topNode.createNode("geo"), spec, {"importFile": "/in/crate.obj", "assetName": "crate"})
+
+	assert build["importFile"].parm("file").eval() == "/in/crate.obj"
+	assert build["tag"].name() == "crate_tag"
+	assert build["tag"].parm("snippet").eval() == SNIPPET.replace("{assetName}", "crate")
+	assert build["tag"].parm("expression").eval() == "ch('../{unknown}') + {1}"
+	assert build["tag"].parm("metadata").eval() == '{"lod": {"levels": [1, 2]}}'
@@ -0,0 +1,38 @@
+# tests/test_pipeline_steps.py
+
+import pytest
+
+from uv_tool.core import UVToolClass, PipelineCancelled
+
+
+def test_steps_run_one_stage_each(topNode, sphere, tmp_path):
+	started = []
+	tool = UVToolClass(sphere("crate", 500), str(tmp_path / "out"), topNode=topNode, cook=False,
+		stageCallback=lambda asset, stage, index, total: started.append(stage))
+	assert tool.remeshGeoNode is None and not topNode.children()  # Nothing built until the first step
+
+	for stage, step in tool.buildSteps():
+		step()
+		assert started[-1] == stage
+	assert started == ["setup", "remesh", "uv", "export"]
+	assert tool.stageTimes["export"] is not None
+
+	started.clear()
+	tool.uvGeoNode.node("uvLayout").parm("padding").set(4)
+	assert [stage for stage, _ in tool.updateSteps()] == ["setup", "remesh", "uv", "export"]
+	assert tool.update()
+	assert started == ["setup", "remesh", "uv", "export"] and tool.stageTimes["remesh"] is None
+
+
+def test_cancel_between_steps_destroys_the_network(topNode, sphere, tmp_path):
+	cancel = []
+	tool = UVToolClass(sphere("crate", 500), str(tmp_path / "out"), topNode=topNode, cook=False, cancelCheck=lambda: bool(cancel))
+	steps = iter(tool.buildSteps())
+	next(steps)[1]()
+	next(steps)[1]()
+	assert len(topNode.children()) == 2
+
+	cancel.append(True)  # As a UI would between two main-thread calls
+	with pytest.raises(PipelineCancelled):
+		next(steps)[1]()
+	assert not topNode.children()
@@ -0,0 +1,39 @@
+# tests/test_preview.py
+
+import hou
+
+from uv_tool.core import UVToolClass
+from uv_tool.core._preview import PreviewNetwork
+
+
+def test_preview_cooks_a_small_network_and_goes_away(topNode, sphere):
+	preview = PreviewNetwork(sphere("crate", 5000), topNode, polygons=500)
+	assert preview.geoNode.name() == "crate_preview"
+	assert preview.build["polyReduce"].parm("finalcount").eval() == 500
+	assert preview.seconds is None  # Nothing cooks until asked
+
+	assert preview.cook() >= 0.0
+	assert preview.build["PREVIEW_OUT"].isDisplayFlagSet()
+
+	preview.destroy()
+	assert not topNode.children()
+
+
+def test_destroy_after_the_parent_network_is_gone(sphere):
+	parent = hou.node("/obj").createNode("subnet", "uv_tool_preview_parent")
+	preview = PreviewNetwork(sphere("crate", 500), parent)
+	parent.destroy()
+	preview.destroy()
+
+
+def test_precooked_shells_toggle_without_touching_the_network(topNode, sphere, tmp_path):
+	tool = UVToolClass(sphere("crate", 500), str(tmp_path / "out"), topNode=topNode, precookShells=True)
+	assert tool.shellCookTime is not None
+
+	hou.resetCallCounts()
+	tool.toggleUVShell(True)
+	assert tool.shellIslands.isDisplayFlagSet()
+	tool.toggleUVShell(False)
+	assert tool.uvNull.isDisplayFlagSet()
+	counts = hou.callCounts()
+	assert not counts.get("parmSet") and not counts.get("setParms") and not counts.get("cook")
@@ -0,0 +1,37 @@
+# tests/test_profiling.py
+
+import json
+
+import pytest
+
+from uv_tool.core import UVToolClass
+from uv_tool.core.profiling import aggregate_profiles
+
+
+def test_profile_cooks_every_node_after_its_inputs(topNode, sphere, tmp_path):
+	tool = UVToolClass(sphere("crate", 500), str(tmp_path / "out"), topNode=topNode, profile=True, profileDir=str(tmp_path / "profiles"))
+	with open(tool.profilePath) as f:
+		report = json.load(f)
+	assert report == tool.profileReport
+	assert report["asset"] == "crate"
+
+	order = [node["path"] for node in report["nodes"]]
+	for node in (tool.remeshGeoNode.node("clean"), tool.uvGeoNode.node("uvLayout")):
+		assert order.index(node.path()) > order.index(node.inputs()[0].path())
+	keys = {node["key"] for node in report["nodes"]}
+	assert {"remesh/filecache", "uv/filecache", "remesh/polyReduce"} <= keys  # Caches keyed by type, not the asset
+	assert not any(node["type"].startswith("rop_") for node in report["nodes"])
+
+
+def report(asset, **cookTimes):
+	nodes = [{"key": key, "type": "null", "cookTime": seconds, "memoryBytes": 10} for key, seconds in cookTimes.items()]
+	return {"asset": asset, "houdiniVersion": "20.5", "totalCookTime": sum(cookTimes.values()), "nodes": nodes}
+
+
+def test_aggregate_ranks_nodes_and_assets():
+	batch = aggregate_profiles([report("small", flatten=1.0, layout=1.0), report("large", flatten=5.0, layout=1.0)])
+	assert list(batch["nodes"]) == ["flatten", "layout"]
+	flatten = batch["nodes"]["flatten"]
+	assert (flatten["count"], flatten["meanCookTime"], flatten["slowestAsset"]) == (2, 3.0, "large")
+	assert flatten["share"] == pytest.approx(0.75)
+	assert [asset["asset"] for asset in batch["slowestAssets"]] == ["large", "small"]
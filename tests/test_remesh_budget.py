@@ -0,0 +1,78 @@
+# tests/test_remesh_budget.py
+
+import math
+
+import pytest
+
+from uv_tool.core._controller import UVToolClass
+from uv_tool.core.nodes import get_budget_policy
+from uv_tool.core.nodes._polyreduce_budget import DEFAULT_FINAL_COUNT
+from uv_tool.core.preflight import scan_obj
+
+
+def finalCount(tool):
+	return tool.remeshGeoNode.node("polyReduce").parm("finalcount").eval()
+
+
+def test_reused_network_resets_budget_between_assets(topNode, sphere, tmp_path):
+	first = sphere("first", 5000)
+	second = sphere("second", 5000)
+	tool = UVToolClass(first, str(tmp_path / "out"), True, topNode=topNode, useCache=False, measureUVs=False, preflight=True,
+		budgetPolicy=get_budget_policy("fixed", count=300))
+	assert finalCount(tool) == 300
+
+	tool.budgetPolicy = None
+	tool.loadAsset(second, remeshCheck=True)
+	assert finalCount(tool) == DEFAULT_FINAL_COUNT
+	assert not tool.remeshGeoNode.node("polyReduce").isBypassed()
+
+
+def test_density_budget_uses_measured_area(topNode, sphere, tmp_path):
+	path = sphere("dense", 20000)
+	tool = UVToolClass(path, str(tmp_path / "out"), True, topNode=topNode, useCache=False, measureUVs=False, preflight=True,
+		budgetPolicy=get_budget_policy("density", resolution=64))
+	assert tool.scan.measured
+	assert tool.scan.surfaceArea == pytest.approx(4.0 * math.pi, rel=0.01)
+	assert 3000 < finalCount(tool) < 6000  # Not the unreduced input
+
+
+def test_scan_leaves_out_ucx_faces(tmp_path):
+	from uv_tool.benchmarks._synthetic_meshes import write_sphere, write_box
+
+	path = str(tmp_path / "withCollision.obj")
+	with open(path, "w") as f:
+		f.write("o hull\n")
+		vertices, faces = write_sphere(f, 0, 40, 20)
+		f.write("o UCX_hull_00\n")
+		write_box(f, vertices, (0.0, 0.0, 0.0), 10.0)
+
+	scan = scan_obj(path, measureBounds=True)
+	assert scan.faces == faces + 6
+	assert scan.input_stats().polygons == faces
+	assert scan.bboxSize == pytest.approx((2.0, 2.0, 2.0), abs=0.01)  # The 10 unit collision box is ignored
+	assert scan.surfaceArea == pytest.approx(4.0 * math.pi, rel=0.02)
+
+
+def test_scan_and_blast_agree_on_ucx_names(tmp_path):
+	import fnmatch
+	from uv_tool.benchmarks._synthetic_meshes import write_sphere, write_box
+	from uv_tool.core.nodes import REMESH_PIPELINE
+
+	path = str(tmp_path / "prefixed.obj")
+	with open(path, "w") as f:
+		f.write("o hull\n")
+		vertices, faces = write_sphere(f, 0, 20, 10)
+		f.write("o UCX_foo\n")
+		write_box(f, vertices, (0.0, 0.0, 0.0), 1.0)
+		f.write("o ucx_lower\n")  # Not collision: the blast pattern is case sensitive
+		write_box(f, vertices + 8, (0.0, 0.0, 0.0), 1.0)
+
+	scan = scan_obj(path)
+	assert scan.hasUCX
+	assert scan.ucxFaces == 6
+	assert scan.polygons == faces + 6
+
+	blast = next(node for node in REMESH_PIPELINE["nodes"] if node["name"] == "deleteUCX")
+	pattern = blast["parms"]["group"].split("=", 1)[1]
+	assert fnmatch.fnmatchcase("UCX_foo", pattern)
+	assert not fnmatch.fnmatchcase("ucx_lower", pattern)
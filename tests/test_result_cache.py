@@ -0,0 +1,62 @@
+# tests/test_result_cache.py
+
+import os
+import time
+import multiprocessing
+
+from uv_tool.core.caching import ResultCache
+from uv_tool.core.caching._result_cache import _cacheLock
+
+ENTRY_BYTES = 100
+
+
+class Geometry:
+	''' Cooked geometry that saves a fixed number of bytes. '''
+	def __init__(self, size=ENTRY_BYTES):
+		self.size = size
+
+	def saveToFile(self, path):
+		with open(path, "wb") as f:
+			f.write(b"g" * self.size)
+
+
+def _store(cacheDir, key):
+	ResultCache(cacheDir).store(key, Geometry())
+
+
+def test_lookup_misses_then_hits(tmp_path):
+	cache = ResultCache(str(tmp_path))
+	assert cache.lookup("a") is None
+	path = cache.store("a", Geometry())
+	assert cache.lookup("a") == path
+	assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_eviction_drops_the_least_recently_used(tmp_path):
+	cache = ResultCache(str(tmp_path), maxBytes=2 * ENTRY_BYTES + ENTRY_BYTES // 2)
+	first = cache.store("first", Geometry())
+	second = cache.store("second", Geometry())
+	now = time.time()
+	os.utime(first, (now - 20, now - 20))
+	os.utime(second, (now - 10, now - 10))
+
+	cache.lookup("first")  # A hit makes it the most recently used
+	cache.store("third", Geometry())
+	assert cache.lookup("second") is None
+	assert cache.lookup("first") and cache.lookup("third")
+	assert cache.size() == 2 * ENTRY_BYTES
+
+
+def test_writer_waits_for_the_lock(tmp_path):
+	cacheDir = str(tmp_path)
+	cache = ResultCache(cacheDir)
+	writer = multiprocessing.get_context("fork").Process(target=_store, args=(cacheDir, "shared"))
+	with _cacheLock(cacheDir):
+		writer.start()
+		time.sleep(0.5)
+		assert writer.is_alive()
+		assert not os.path.exists(cache.entryPath("shared"))  # Saved to a temp file, not yet renamed into place
+	writer.join(30)
+	assert writer.exitcode == 0
+	assert os.path.getsize(cache.entryPath("shared")) == ENTRY_BYTES
+	assert sorted(os.listdir(cacheDir)) == [".lock", "shared.bgeo.sc"]  # No temp file left behind
@@ -0,0 +1,29 @@
+# tests/test_scheduler.py
+
+import pytest
+
+from uv_tool.core.batch import _scheduler
+from uv_tool.core.batch._scheduler import SAMPLE_CHUNK_BYTES, SAMPLE_CHUNKS, estimate_faces, plan_batch
+from uv_tool.core.preflight import scan_asset
+
+
+def test_small_obj_is_counted(sphere):
+	path = sphere("small", 500)
+	scan = scan_asset(path)
+	assert estimate_faces(path, len(open(path, "rb").read())) == scan.triangles
+
+
+def test_large_obj_is_sampled(sphere, monkeypatch):
+	path = sphere("large", 200000)
+	sizeBytes = len(open(path, "rb").read())
+	assert sizeBytes > SAMPLE_CHUNKS * SAMPLE_CHUNK_BYTES
+	triangles = scan_asset(path).triangles
+	monkeypatch.setattr(_scheduler, "scan_asset", None)  # A full scan would fail
+	assert estimate_faces(path, sizeBytes) == pytest.approx(triangles, rel=0.1)
+
+
+def test_fifo_does_not_read_assets(sphere, monkeypatch):
+	path = sphere("fifo", 500)
+	monkeypatch.setattr(_scheduler, "estimate_faces", None)
+	jobs, order, model = plan_batch([path], "fifo")
+	assert not jobs[0].scanned and order == jobs
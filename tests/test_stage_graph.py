@@ -0,0 +1,30 @@
+# tests/test_stage_graph.py
+
+from uv_tool.core import UVToolClass
+
+
+def build(topNode, sphere, tmp_path):
+	return UVToolClass(sphere("ball", 500), str(tmp_path / "out"), topNode=topNode)
+
+
+def test_uv_parm_change_does_not_recook_remesh(topNode, sphere, tmp_path):
+	tool = build(topNode, sphere, tmp_path)
+	assert tool.update(parms={"uvLayout": {"padding": 4}})
+	assert tool.stageGraph.dirtyStages() == []
+	assert tool.stageTimes["remesh"] is None
+	assert tool.stageTimes["uv"] is not None
+
+
+def test_remesh_parm_change_recooks_both_networks(topNode, sphere, tmp_path):
+	tool = build(topNode, sphere, tmp_path)
+	tool.remeshGeoNode.node("clean").parm("fixoverlap").set(1)
+	assert "layout" in tool.stageGraph.dirtyStages()  # Downstream of the change
+	assert tool.stageGraph.cleanNetworks() == set()
+	assert tool.update()
+	assert tool.stageTimes["remesh"] is not None and tool.stageTimes["uv"] is not None
+
+
+def test_unchanged_network_is_not_recooked(topNode, sphere, tmp_path):
+	tool = build(topNode, sphere, tmp_path)
+	assert tool.stageGraph.cleanNetworks() == {"remesh", "uv"}
+	assert not tool.update(parms={"uvLayout": {}})
@@ -0,0 +1,57 @@
+# tests/test_uv_metrics.py
+
+import numpy as np
+import pytest
+
+from uv_tool.core.metrics import compute_uv_metrics
+
+# A unit square in the XY plane as two triangles
+SQUARE = np.array([
+	[[0, 0, 0], [1, 0, 0], [1, 1, 0]],
+	[[0, 0, 0], [1, 1, 0], [0, 1, 0]],
+], dtype=np.float32)
+
+
+@pytest.fixture
+def square():
+	''' The square with UVs equal to its XY, filling the 0-1 tile without distortion. '''
+	return SQUARE, SQUARE[:, :, :2].copy()
+
+
+def test_undistorted_square_fills_the_tile(square):
+	metrics = compute_uv_metrics(*square, resolution=64)
+	assert metrics["faces"] == 2 and metrics["islands"] == 1
+	assert metrics["utilization"] == pytest.approx(1.0)
+	assert metrics["overlapPercent"] == 0.0
+	assert metrics["areaDistortion"] == pytest.approx(0.0, abs=1e-6)
+	assert metrics["angleDistortion"] == pytest.approx(0.0, abs=1e-3)
+	assert metrics["texelDensityVariance"] == pytest.approx(0.0, abs=1e-9)
+	assert metrics["flippedPercent"] == 0.0 and metrics["degenerateFaces"] == 0
+
+
+def test_stacked_islands_overlap(square):
+	positions, uvs = square
+	metrics = compute_uv_metrics(np.concatenate([positions, positions + [0, 0, 2]]), np.concatenate([uvs, uvs]), resolution=64)
+	assert metrics["islands"] == 2
+	assert metrics["overlapPercent"] == pytest.approx(100.0)
+
+
+def test_half_scale_uvs_use_a_quarter_of_the_tile(square):
+	positions, uvs = square
+	metrics = compute_uv_metrics(positions, uvs * 0.5, resolution=64)
+	assert metrics["utilization"] == pytest.approx(0.25)
+	assert metrics["texelDensity"] == pytest.approx(0.5)
+	assert metrics["areaDistortion"] == pytest.approx(0.0, abs=1e-6)  # Uniform scale keeps every face's share
+
+
+def test_mirrored_face_is_flipped_and_degenerate_face_counted(square):
+	positions, uvs = square
+	mirrored = uvs[:1, ::-1]  # The first face again with its winding reversed in UV space
+	degenerate = np.zeros((1, 3, 3), dtype=np.float32)
+	metrics = compute_uv_metrics(
+		np.concatenate([positions, positions[:1] + [0, 0, 2], degenerate]),
+		np.concatenate([uvs, mirrored, degenerate[:, :, :2]]),
+		resolution=64
+	)
+	assert metrics["flippedPercent"] == pytest.approx(100.0 / 3.0)
+	assert metrics["degenerateFaces"] == 1
@@ -0,0 +1,27 @@
+# tests/test_watch_daemon.py
+
+import pytest
+
+from uv_tool.core.service import FolderWatcher, WatchDaemon
+
+
+def touch(path, text="v 0 0 0\n"):
+	path.parent.mkdir(parents=True, exist_ok=True)
+	path.write_text(text)
+	return str(path)
+
+
+def test_watcher_skips_exports_and_settles_empty_files(tmp_path):
+	asset = touch(tmp_path / "in" / "a.obj")
+	touch(tmp_path / "in" / "out" / "a_NewUV.obj")
+	touch(tmp_path / "in" / "empty.obj", "")
+
+	watcher = FolderWatcher(str(tmp_path / "in"), settleSeconds=0.0, exclude=[str(tmp_path / "in" / "out")])
+	assert watcher.poll() == []  # First sight of every file
+	assert [path for path, _, _ in watcher.poll()] == [asset]
+	assert watcher.settling == 0  # The empty file no longer keeps a run(once=True) alive
+
+
+def test_daemon_refuses_to_export_into_the_watched_folder(tmp_path):
+	with pytest.raises(ValueError, match="must not be the watched folder"):
+		WatchDaemon(str(tmp_path), str(tmp_path))
@@ -0,0 +1,68 @@
+# tests/test_worker_pool.py
+
+import os
+import multiprocessing
+
+import pytest
+
+from uv_tool.core.batch import RecyclingPool, WorkerLost, worker_slot
+
+TIMEOUT = 30  # A lost task must fail its future, never leave it waiting
+
+
+def _pid(value):
+	return value, os.getpid()
+
+
+def _slot(value):
+	return worker_slot()
+
+
+def _die(code):
+	os._exit(code)
+
+
+def _child_exit_code(code):
+	child = multiprocessing.get_context("fork").Process(target=os._exit, args=(code,))
+	child.start()
+	child.join()
+	return child.exitcode
+
+
+@pytest.fixture
+def context():
+	return multiprocessing.get_context("fork")  # The tasks live in this test module, no Houdini in the workers
+
+
+def test_dead_worker_fails_only_its_task(context):
+	with RecyclingPool(2, context) as pool:
+		lost = pool.submit(_die, 3)
+		others = [pool.submit(_pid, value) for value in range(6)]
+		with pytest.raises(WorkerLost, match="exited with code 3"):
+			lost.result(timeout=TIMEOUT)
+		assert [future.result(timeout=TIMEOUT)[0] for future in others] == list(range(6))
+
+
+def test_workers_are_recycled_after_max_assets(context):
+	with RecyclingPool(1, context, maxAssets=2) as pool:
+		pids = [pool.submit(_pid, value).result(timeout=TIMEOUT)[1] for value in range(6)]
+	assert len(set(pids)) == 3
+	assert pool.recycled == 3
+
+
+def test_replacement_workers_keep_their_slot(context):
+	with RecyclingPool(2, context, maxAssets=1) as pool:
+		slots = [pool.submit(_slot, value).result(timeout=TIMEOUT) for value in range(8)]
+	assert set(slots) == {0, 1}
+
+
+def test_shutdown_runs_queued_tasks(context):
+	pool = RecyclingPool(1, context, maxAssets=1)
+	futures = [pool.submit(_pid, value) for value in range(4)]
+	pool.shutdown(wait=True)
+	assert [future.result(timeout=0)[0] for future in futures] == list(range(4))
+
+
+def test_workers_may_start_processes(context):
+	with RecyclingPool(1, context) as pool:
+		assert pool.submit(_child_exit_code, 5).result(timeout=TIMEOUT) == 5  # As LOD branches do inside a batch worker
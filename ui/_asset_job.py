@@ -0,0 +1,138 @@
+#ui/_asset_job.py
+
+import time
+
+from PySide2.QtCore import QThread, Signal
+
+from uv_tool.core import UVToolClass, PipelineCancelled, PipelineOptions, PreviewNetwork
+from uv_tool.utils._logger import logger
+
+try:
+	import hdefereval  # Only in a graphical Houdini session
+except ImportError:
+	hdefereval = None
+
+
+def inMainThread(function, *args):
+	''' Run function on Houdini's main thread and return its result, re-raising its error here.
+	hou must only be called from the main thread; without a UI (hython, tests) this is the caller. '''
+	if hdefereval is None:
+		return function(*args)
+
+	def call():
+		try:
+			return function(*args), None
+		except BaseException as e:
+			return None, e  # Handed back explicitly, so the job thread sees the real error
+	result, error = hdefereval.executeInMainThreadWithResult(call)
+	if error is not None:
+		raise error
+	return result
+
+class AssetJob(QThread):
+	''' Runs one UVToolClass pipeline for the UI without holding up its event loop.
+
+	Every hou call is sent to the main thread in chunks: the preview, then
+	each pipeline stage (setup, remesh, uv and export) as a call of its own,
+	then the cleanup. The UI handles events in between: it shows the preview
+	and the stage progress, and cancel() or requestInterruption() stops the
+	pipeline before its next stage. While a stage cooks, the main thread is
+	as busy as for any Houdini cook.
+	'''
+	stageStarted = Signal(str, str, int, int)    # Asset name, stage name, stage index, stage count
+	previewReady = Signal(float)                  # Seconds from the start until the preview was shown
+	succeeded = Signal(object)                    # The finished UVToolClass
+	failed = Signal(str, str)                     # Asset name, error message
+	cancelled = Signal(str)                       # Asset name
+
+	def __init__(self, importPath, exportPath, remeshCheck, openFileCheck, exportFormats=("fbx",), parent=None, assetFixer=None, preview=True, showUVShells=False):
+		super(AssetJob, self).__init__(parent)
+		self.importPath = importPath
+		self.exportPath = exportPath
+		self.remeshCheck = remeshCheck
+		self.openFileCheck = openFileCheck
+		self.exportFormats = exportFormats            # Export backends to write
+		self.assetFixer = assetFixer                  # Existing pipeline for this asset, updated in place
+		self.preview = preview                        # Show a low-resolution pass before the full result
+		self.showUVShells = showUVShells              # Show the shells on the preview too
+		self.firstFeedbackTime = None                 # Seconds until the user saw a result, preview or final
+		self.totalTime = None                         # Seconds until the full result was ready
+		self.cancelRequested = False
+
+	def cancel(self):
+		''' Ask the pipeline to stop before its next stage '''
+		self.cancelRequested = True
+
+	def stopRequested(self):
+		''' Whether cancel() or requestInterruption() asked the pipeline to stop '''
+		return self.cancelRequested or self.isInterruptionRequested()
+
+	def buildPreview(self):
+		''' Build, cook and show the low-resolution preview; called on the main thread '''
+		preview = PreviewNetwork(self.importPath, showUVShells=self.showUVShells)
+		try:
+			preview.cook()
+		except Exception:
+			preview.destroy()
+			raise
+		return preview
+
+	def showPreview(self, startTime):
+		''' Show the preview before the full result; a failed preview only costs its time '''
+		try:
+			preview = inMainThread(self.buildPreview)
+		except Exception:
+			logger.warning("Preview failed for %s, waiting for the full result", self.importPath, exc_info=True)
+			return None
+		self.firstFeedbackTime = time.time() - startTime
+		self.previewReady.emit(self.firstFeedbackTime)
+		return preview
+
+	def pipelineSteps(self):
+		''' Return the pipeline and the steps that build or update it, each to run on the main thread '''
+		if self.assetFixer:
+			assetFixer = self.assetFixer                  # Only recook the stages the new settings dirty
+			assetFixer.stageCallback = self.stageStarted.emit
+			assetFixer.cancelCheck = self.stopRequested
+			assetFixer.openFileCheck = self.openFileCheck
+			return assetFixer, assetFixer.updateSteps(remeshCheck=self.remeshCheck, exportFormats=self.exportFormats)
+		assetFixer = UVToolClass(
+			self.importPath,
+			self.exportPath,
+			self.remeshCheck,
+			self.openFileCheck,
+			PipelineOptions(
+				exportFormats=self.exportFormats,
+				precookShells=True                          # So the shell toggle is only a display switch
+			),
+			stageCallback=self.stageStarted.emit,
+			cancelCheck=self.stopRequested,
+			cook=False                                      # Built by the steps, one main-thread call each
+		)
+		return assetFixer, assetFixer.buildSteps()
+
+	def run(self):
+		''' Cook the preview, then each pipeline stage, on the main thread, reporting the outcome through signals '''
+		startTime = time.time()
+		preview = None
+		try:
+			if self.preview and not self.assetFixer:
+				preview = self.showPreview(startTime)
+			assetFixer, steps = self.pipelineSteps()      # No hou calls until a step runs
+			for _, step in steps:
+				if inMainThread(step) is False:
+					break                                     # Nothing changed, so nothing to recook
+		except PipelineCancelled as e:
+			self.cancelled.emit(str(e))
+		except Exception as e:
+			logger.exception("Failed to process %s", self.importPath)
+			self.failed.emit(self.importPath, str(e))
+		else:
+			self.totalTime = time.time() - startTime
+			if self.firstFeedbackTime is None:
+				self.firstFeedbackTime = self.totalTime      # No preview: the full result was the first feedback
+			logger.info("Time to first feedback %.2f seconds, full result %.2f seconds", self.firstFeedbackTime, self.totalTime)
+			self.succeeded.emit(assetFixer)
+		finally:
+			if preview:
+				inMainThread(preview.destroy)                # The full result replaces it
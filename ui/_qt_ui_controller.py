@@ -2,11 +2,12 @@
 
 import os
 import hou
+from collections import deque
 from PySide2.QtCore import QFile, QIODevice, QStandardPaths, Qt
 from PySide2.QtWidgets import QWidget, QFileDialog, QMessageBox
 from PySide2.QtUiTools import QUiLoader
 
-from uv_tool.core import UVToolClass
+from uv_tool.ui._asset_job import AssetJob
 from uv_tool.utils._logger import logger
 
 class myQtUIClass(QWidget):
@@ -17,6 +18,10 @@ class myQtUIClass(QWidget):
 		self.setWindowFlags(Qt.Window)
 		self.importPath = None
 		self.exportPath = None
+		self.assetFixer = None                  # Latest finished UVToolClass
+		self.activeJob = None                   # AssetJob currently cooking, if any
+		self.jobQueue = deque()                 # Assets waiting for the active job to finish
+		self.closeRequested = False             # Close once the active job has stopped
 		self.initUI()
 		
 	def initUI(self):
@@ -47,6 +52,7 @@ class myQtUIClass(QWidget):
 		self.ui.exportBrowse.clicked.connect(self.fileBrowseDialogOutput)
 		self.ui.exportCheck.stateChanged.connect(self.checkExport)
 		self.ui.fixAssetPush.clicked.connect(self.fixAsset)
+		self.ui.cancelButton.clicked.connect(self.cancelJob)
 		self.ui.clearButton.clicked.connect(self.clearEverything)
 		self.ui.uvShellCheck.stateChanged.connect(self.toggleUVShell)
 
@@ -101,29 +107,122 @@ class myQtUIClass(QWidget):
 			baseFolder = os.path.basename(self.importDir) # Get the base folder name
 			self.exportLabel.setText(f"/{baseFolder}") # Set the label to the base folder name
 			self.exportPath = self.importDir # Set the export path to the import path
-			logger.info(f"Export path set to: {self.exportPath}")
+			logger.info("Export path set to: %s", self.exportPath)
 		else:
 			self.ui.exportBrowse.setEnabled(True)
 			self.ui.exportLabel.setEnabled(True)
 
 	def fixAsset(self):
-		''' Call the remeshandUVClass to create the nodes and export the geometry '''
+		''' Queue the selected asset to be processed on a background thread '''
 		#print("Fix Asset Pressed")
 		if self.importPath is None:
 			QMessageBox.critical(None, "Error", "Both an import and export path must be selected.") # If the import path is empty, show an error message
 
+		elif not self.exportFormats():
+			QMessageBox.critical(None, "Error", "Select at least one export format.")
+
 		else:
-			self.assetFixer = UVToolClass(self.importPath, self.exportPath, self.ui.remeshCheck.isChecked(), self.ui.openFileCheck.isChecked()) 
-			self.ui.clearButton.setEnabled(True)
-			self.ui.uvShellCheck.setEnabled(True)
-			self.ui.timeLabel.setText(f"Successfully processed in {self.assetFixer.elapsed_time:.2f} seconds") # Set the time label to the elapsed time
+			self.jobQueue.append((self.importPath, self.exportPath, self.ui.remeshCheck.isChecked(), self.ui.openFileCheck.isChecked(), self.exportFormats()))
+			logger.info("Queued asset: %s", self.importPath)
+			if self.activeJob is None:
+				self.startNextJob()
+			else:
+				self.ui.progressLabel.setText(f"{len(self.jobQueue)} queued")
+
+	def exportFormats(self):
+		''' Return the export backends ticked in the UI '''
+		checks = (("fbx", self.ui.fbxCheck), ("bgeo", self.ui.bgeoCheck), ("obj", self.ui.objCheck), ("gltf", self.ui.gltfCheck))
+		return tuple(name for name, check in checks if check.isChecked())
+
+	def startNextJob(self):
+		''' Start the next queued asset, if any '''
+		if not self.jobQueue:
+			self.activeJob = None
+			self.ui.cancelButton.setEnabled(False)
+			self.ui.progressLabel.setText("")
+			return
+
+		importPath, exportPath, remeshCheck, openFileCheck, exportFormats = self.jobQueue.popleft()
+		reuse = None
+		if self.assetFixer and self.assetFixer.importPath == importPath and self.assetFixer.exportPath == exportPath:
+			reuse = self.assetFixer                                     # Same asset again: recook only what changed
+		self.activeJob = AssetJob(importPath, exportPath, remeshCheck, openFileCheck, exportFormats, parent=self, assetFixer=reuse,
+			showUVShells=self.ui.uvShellCheck.isChecked())
+		self.activeJob.stageStarted.connect(self.showProgress)
+		self.activeJob.previewReady.connect(self.previewShown)
+		self.activeJob.succeeded.connect(self.assetFinished)
+		self.activeJob.failed.connect(self.assetFailed)
+		self.activeJob.cancelled.connect(self.assetCancelled)
+		self.activeJob.finished.connect(self.jobFinished)    # QThread.finished, emitted after every outcome
+		self.ui.cancelButton.setEnabled(True)
+		self.activeJob.start()
+
+	def jobFinished(self):
+		''' Release the finished thread and move on to the queue '''
+		self.activeJob.deleteLater()
+		self.startNextJob()
+		if self.closeRequested:
+			self.close()                        # The close waited for this job
+
+	def showProgress(self, assetName, stage, index, total):
+		''' Show the running stage and how many assets are waiting '''
+		queued = f" - {len(self.jobQueue)} queued" if self.jobQueue else ""
+		self.ui.progressLabel.setText(f"{assetName}: {stage} ({index + 1}/{total}){queued}")
+
+	def previewShown(self, seconds):
+		''' Tell the user the viewport shows a low-resolution preview until the full result is ready '''
+		self.ui.timeLabel.setText(f"Preview shown after {seconds:.2f} seconds, full quality cooking...")
+
+	def assetFinished(self, assetFixer):
+		''' Show the results of a finished asset '''
+		self.assetFixer = assetFixer
+		self.ui.clearButton.setEnabled(True)
+		self.ui.uvShellCheck.setEnabled(True)
+		showShells = self.ui.uvShellCheck.isChecked()   # May have been toggled while the job ran
+		if showShells != self.assetFixer.showUVShells:
+			self.assetFixer.toggleUVShell(showShells)   # Already cooked, so this only switches the display
+		job = self.activeJob
+		self.ui.timeLabel.setText(
+			f"First feedback after {job.firstFeedbackTime:.2f} seconds, full result after {job.totalTime:.2f} seconds\n"
+			f"Successfully processed in {self.assetFixer.elapsed_time:.2f} seconds\n{self.assetFixer.stageSummary()}"
+		) # Set the time label to the feedback times, the elapsed time and stage breakdown
+
+	def assetFailed(self, importPath, error):
+		self.ui.timeLabel.setText(f"Failed to process {os.path.basename(importPath)}: {error}")
+
+	def assetCancelled(self, assetName):
+		self.ui.timeLabel.setText(f"Cancelled: {assetName}")
+
+	def cancelJob(self):
+		''' Stop the running asset before its next stage '''
+		if self.activeJob:
+			self.activeJob.cancel()
+			self.ui.cancelButton.setEnabled(False)
+			self.ui.progressLabel.setText("Cancelling...")
+
+	def closeEvent(self, event):
+		''' Drop the queue and let the running asset stop before closing '''
+		self.jobQueue.clear()
+		if self.activeJob:
+			# Its hou work runs on this thread, so waiting here would never return; close when it finishes
+			self.closeRequested = True
+			self.activeJob.cancel()
+			event.ignore()
+			return
+		super(myQtUIClass, self).closeEvent(event)
 
 	def clearEverything(self): 
-		''' Clear all the nodes '''
-		if self.assetFixer: 
+		''' Clear the nodes the tool created '''
+		if self.activeJob:
+			QMessageBox.warning(None, "Busy", "Wait for the running asset to finish or cancel it first.")
+		elif self.assetFixer: 
 			self.assetFixer.clearNodes()
+			self.assetFixer = None  # Its networks are gone, so later toggles and updates have nothing to act on
 
 
 	def toggleUVShell(self):
+		''' Show or hide the UV shells of the finished asset '''
+		if self.activeJob:
+			return                              # The job owns the network until it finishes; assetFinished applies the checkbox
 		if self.assetFixer:
 			self.assetFixer.toggleUVShell(self.ui.uvShellCheck.isChecked())
@@ -23,10 +23,10 @@ class Ui_Form(object):
     def setupUi(self, Form):
         if not Form.objectName():
             Form.setObjectName(u"Form")
-        Form.resize(475, 413)
+        Form.resize(475, 499)
         self.verticalLayoutWidget = QWidget(Form)
         self.verticalLayoutWidget.setObjectName(u"verticalLayoutWidget")
-        self.verticalLayoutWidget.setGeometry(QRect(20, 10, 441, 386))
+        self.verticalLayoutWidget.setGeometry(QRect(20, 10, 441, 472))
         self.verticalLayout = QVBoxLayout(self.verticalLayoutWidget)
         self.verticalLayout.setObjectName(u"verticalLayout")
         self.verticalLayout.setSizeConstraint(QLayout.SetMinimumSize)
@@ -121,6 +121,41 @@ class Ui_Form(object):
 
         self.verticalLayout.addWidget(self.openFileCheck)
 
+        self.horizontalLayout_4 = QHBoxLayout()
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.formatLabel = QLabel(self.verticalLayoutWidget)
+        self.formatLabel.setObjectName(u"formatLabel")
+
+        self.horizontalLayout_4.addWidget(self.formatLabel)
+
+        self.fbxCheck = QCheckBox(self.verticalLayoutWidget)
+        self.fbxCheck.setObjectName(u"fbxCheck")
+        self.fbxCheck.setChecked(True)
+
+        self.horizontalLayout_4.addWidget(self.fbxCheck)
+
+        self.bgeoCheck = QCheckBox(self.verticalLayoutWidget)
+        self.bgeoCheck.setObjectName(u"bgeoCheck")
+
+        self.horizontalLayout_4.addWidget(self.bgeoCheck)
+
+        self.objCheck = QCheckBox(self.verticalLayoutWidget)
+        self.objCheck.setObjectName(u"objCheck")
+
+        self.horizontalLayout_4.addWidget(self.objCheck)
+
+        self.gltfCheck = QCheckBox(self.verticalLayoutWidget)
+        self.gltfCheck.setObjectName(u"gltfCheck")
+
+        self.horizontalLayout_4.addWidget(self.gltfCheck)
+
+        self.horizontalSpacer_3 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_4.addItem(self.horizontalSpacer_3)
+
+
+        self.verticalLayout.addLayout(self.horizontalLayout_4)
+
         self.line_3 = QFrame(self.verticalLayoutWidget)
         self.line_3.setObjectName(u"line_3")
         self.line_3.setFrameShape(QFrame.Shape.HLine)
@@ -134,6 +169,17 @@ class Ui_Form(object):
 
         self.verticalLayout.addWidget(self.fixAssetPush)
 
+        self.cancelButton = QPushButton(self.verticalLayoutWidget)
+        self.cancelButton.setObjectName(u"cancelButton")
+        self.cancelButton.setEnabled(False)
+
+        self.verticalLayout.addWidget(self.cancelButton)
+
+        self.progressLabel = QLabel(self.verticalLayoutWidget)
+        self.progressLabel.setObjectName(u"progressLabel")
+
+        self.verticalLayout.addWidget(self.progressLabel)
+
         self.uvShellCheck = QCheckBox(self.verticalLayoutWidget)
         self.uvShellCheck.setObjectName(u"uvShellCheck")
         self.uvShellCheck.setEnabled(False)
@@ -180,7 +226,14 @@ class Ui_Form(object):
         self.exportLabel.setText(QCoreApplication.translate("Form", u"Empty", None))
         self.exportBrowse.setText(QCoreApplication.translate("Form", u"Browse", None))
         self.openFileCheck.setText(QCoreApplication.translate("Form", u"Open File Location when Complete", None))
+        self.formatLabel.setText(QCoreApplication.translate("Form", u"Formats:", None))
+        self.fbxCheck.setText(QCoreApplication.translate("Form", u"FBX", None))
+        self.bgeoCheck.setText(QCoreApplication.translate("Form", u"bgeo.sc", None))
+        self.objCheck.setText(QCoreApplication.translate("Form", u"OBJ", None))
+        self.gltfCheck.setText(QCoreApplication.translate("Form", u"glTF", None))
         self.fixAssetPush.setText(QCoreApplication.translate("Form", u"Fix Asset", None))
+        self.cancelButton.setText(QCoreApplication.translate("Form", u"Cancel", None))
+        self.progressLabel.setText("")
         self.uvShellCheck.setText(QCoreApplication.translate("Form", u"Show UV Shells", None))
         self.clearButton.setText(QCoreApplication.translate("Form", u"Clear ALL Nodes", None))
         self.timeLabel.setText("")
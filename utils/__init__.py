@@ -1 +1,3 @@
-from ._file_utils import open_export_folder, sanitize_name
\ No newline at end of file
+from ._file_utils import open_export_folder, sanitize_name
+from ._memory import process_rss, flush_sop_cache, format_bytes
+from ._metrics import metrics, MetricsRegistry, observe_result
\ No newline at end of file
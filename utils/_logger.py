@@ -1,28 +1,183 @@
 #utils/_logger.py
 
+import atexit
+import contextvars
+import json
 import logging
+import logging.handlers
 import os
+import queue
+from contextlib import contextmanager
 from datetime import datetime
 
-# Create a directory for logs if it doesn't exist
+
+# Logs go to <repo>/../logs unless UV_TOOL_LOG_DIR points elsewhere
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-LOG_DIR = os.path.join(BASE_DIR, "..", "..", "logs")
-today = datetime.now().strftime("%Y-%m-%d")
-DAILY_LOG_DIR = os.path.join(LOG_DIR, today)
-os.makedirs(DAILY_LOG_DIR, exist_ok=True)
-
-# Generate a timestamped log file name
-timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-log_file = os.path.join(LOG_DIR, f"log_{timestamp}.log")
-
-# Set up logging
-logging.basicConfig(
-	level=logging.INFO,
-	format="%(asctime)s - %(levelname)s - %(message)s",
-	handlers=[
-		logging.FileHandler(log_file, mode="a"),
-		logging.StreamHandler()
-	]
-)
-
-logger = logging.getLogger("uv_tool_log")
\ No newline at end of file
+LOG_DIR = os.environ.get("UV_TOOL_LOG_DIR") or os.path.join(BASE_DIR, "..", "..", "logs")
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+STRUCTURED_FIELDS = ("asset", "stage", "duration")  # Extra record fields written to JSON lines
+
+logger = logging.getLogger("uv_tool_log")
+
+_logContext = contextvars.ContextVar("uv_tool_log_context", default={})
+_listener = None  # Background thread that writes queued records
+_configured = False  # Set once configure_logger has run, explicitly or for the first record
+
+
+@contextmanager
+def log_context(**fields):
+	''' Attach fields such as asset and stage to every record logged inside the block. '''
+	token = _logContext.set({**_logContext.get(), **fields})
+	try:
+		yield
+	finally:
+		_logContext.reset(token)
+
+
+class ContextFilter(logging.Filter):
+	''' Copy the active log_context fields onto each record in the logging thread. '''
+	def filter(self, record):
+		for key, value in _logContext.get().items():
+			if not hasattr(record, key):
+				setattr(record, key, value)
+		return True
+
+
+class JsonLinesFormatter(logging.Formatter):
+	''' Format each record as one JSON object per line. '''
+	def format(self, record):
+		entry = {
+			"time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+			"level": record.levelname,
+			"message": record.getMessage(),
+		}
+		for field in STRUCTURED_FIELDS:
+			value = getattr(record, field, None)
+			if value is not None:
+				entry[field] = value
+		if record.exc_info:
+			entry["exception"] = self.formatException(record.exc_info)
+		elif record.exc_text:
+			entry["exception"] = record.exc_text
+		return json.dumps(entry, default=str)
+
+
+class _LazyFolderMixin:
+	''' Create the log folder when the file is first opened, not at import. '''
+	def _open(self):
+		os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+		return super()._open()
+
+
+class LazyRotatingFileHandler(_LazyFolderMixin, logging.handlers.RotatingFileHandler):
+	''' Size based rotation inside a dated folder. '''
+
+
+class LazyTimedRotatingFileHandler(_LazyFolderMixin, logging.handlers.TimedRotatingFileHandler):
+	''' Rotation at midnight. '''
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+	''' Queue handler that keeps the record's args so formatting happens on the writer thread. '''
+	def prepare(self, record):
+		if record.exc_info:
+			record.exc_text = logging.Formatter().formatException(record.exc_info)  # Tracebacks cannot cross threads lazily
+			record.exc_info = None
+		return record
+
+
+class _ConfigureOnFirstRecord(logging.Handler):
+	''' Stands in until the first record, then configures the logger and hands the record on.
+	Importing the tool so starts no thread and opens no file. '''
+	def emit(self, record):
+		if not _configured:
+			configure_logger(level=logger.level or None)  # Keep a level the caller set before logging
+		logger.handle(record)
+
+
+def _fileHandler(logDir, rotate, maxBytes, backupCount, structured):
+	''' Build the rotating file handler for the given rotation mode. '''
+	extension = "jsonl" if structured else "log"
+	if rotate == "time":
+		path = os.path.join(logDir, f"uv_tool.{extension}")
+		return LazyTimedRotatingFileHandler(path, when="midnight", backupCount=backupCount, delay=True)
+
+	now = datetime.now()
+	dailyDir = os.path.join(logDir, now.strftime("%Y-%m-%d"))
+	path = os.path.join(dailyDir, f"log_{now.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}.{extension}")
+	return LazyRotatingFileHandler(path, maxBytes=maxBytes, backupCount=backupCount, delay=True)
+
+
+def shutdown_logger():
+	''' Flush and stop the background writer, if one is running. '''
+	global _listener
+	if _listener is not None:
+		_listener.stop()  # Drains the queue before returning
+		_listener = None
+
+
+def configure_logger(level=None, logDir=None, toFile=None, toStream=True, structured=None, asyncWrite=None, rotate=None, maxBytes=None, backupCount=None):
+	''' (Re)configure the uv_tool logger.
+
+	Records are put on a queue and written by a background thread, so the
+	caller only pays for building the record; use %-style arguments so
+	messages below the level are never formatted. The file gets JSON lines
+	with asset, stage and duration fields and rotates by size inside a dated
+	folder, or at midnight with rotate="time".
+
+	Defaults come from UV_TOOL_LOG_LEVEL (INFO), UV_TOOL_LOG_DIR,
+	UV_TOOL_LOG_FILE (0 skips the file), UV_TOOL_LOG_FORMAT (json or text),
+	UV_TOOL_LOG_ASYNC (0 writes inline), UV_TOOL_LOG_ROTATE (size or time),
+	UV_TOOL_LOG_MAX_BYTES (10 MB) and UV_TOOL_LOG_BACKUPS (5). Nothing touches
+	the disk until the first record is written. Without a call, the first
+	record configures the logger with these defaults.
+	'''
+	global _listener, _configured
+	env = os.environ.get
+	level = level or env("UV_TOOL_LOG_LEVEL", "INFO")
+	logDir = logDir or LOG_DIR
+	toFile = env("UV_TOOL_LOG_FILE", "1") != "0" if toFile is None else toFile
+	structured = env("UV_TOOL_LOG_FORMAT", "json") == "json" if structured is None else structured
+	asyncWrite = env("UV_TOOL_LOG_ASYNC", "1") != "0" if asyncWrite is None else asyncWrite
+	rotate = rotate or env("UV_TOOL_LOG_ROTATE", "size")
+	maxBytes = maxBytes or int(env("UV_TOOL_LOG_MAX_BYTES", 10 * 1024 * 1024))
+	backupCount = backupCount if backupCount is not None else int(env("UV_TOOL_LOG_BACKUPS", 5))
+
+	_configured = True
+	shutdown_logger()
+	oldHandlers = logger.handlers
+	logger.handlers = []  # A new list: the first record is still being handed to the old one
+	logger.filters = []
+	for handler in oldHandlers:
+		handler.close()
+
+	handlers = []
+	if toFile:
+		fileHandler = _fileHandler(logDir, rotate, maxBytes, backupCount, structured)
+		fileHandler.setFormatter(JsonLinesFormatter() if structured else logging.Formatter(LOG_FORMAT))
+		handlers.append(fileHandler)
+	if toStream:
+		streamHandler = logging.StreamHandler()
+		streamHandler.setFormatter(logging.Formatter(LOG_FORMAT))
+		handlers.append(streamHandler)
+
+	if asyncWrite and handlers:
+		recordQueue = queue.SimpleQueue()
+		logger.addHandler(_QueueHandler(recordQueue))
+		_listener = logging.handlers.QueueListener(recordQueue, *handlers, respect_handler_level=True)
+		_listener.start()
+	else:
+		for handler in handlers:
+			logger.addHandler(handler)
+
+	logger.addFilter(ContextFilter())
+	logger.setLevel(level)
+	logger.propagate = False  # Keep the tool's records out of the host's root logger
+	return logger
+
+
+atexit.register(shutdown_logger)
+logger.addHandler(_ConfigureOnFirstRecord())
+logger.addFilter(ContextFilter())
+logger.setLevel(os.environ.get("UV_TOOL_LOG_LEVEL", "INFO"))
+logger.propagate = False
@@ -0,0 +1,71 @@
+# utils/_memory.py
+
+import os
+import sys
+
+from uv_tool.utils._logger import logger
+
+
+def process_rss():
+	''' Return the resident set size of this process in bytes, or None where it cannot be read. '''
+	try:
+		import psutil  # Optional, the most accurate on every platform
+		return psutil.Process().memory_info().rss
+	except ImportError:
+		pass
+
+	if sys.platform.startswith("linux"):
+		try:
+			with open("/proc/self/statm", "r") as f:
+				return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+		except (OSError, ValueError, IndexError):
+			return None
+
+	if sys.platform == "win32":
+		import ctypes
+		from ctypes import wintypes
+
+		class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+			_fields_ = [
+				("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+				("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+				("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+				("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+				("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t),
+			]
+
+		counters = PROCESS_MEMORY_COUNTERS()
+		counters.cb = ctypes.sizeof(counters)
+		process = ctypes.windll.kernel32.GetCurrentProcess()
+		if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+			return counters.WorkingSetSize
+		return None
+
+	try:
+		import resource  # macOS: only the peak is available, in bytes
+		return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	except (ImportError, OSError):
+		return None
+
+
+def flush_sop_cache():
+	''' Drop every cooked SOP result Houdini keeps in memory. Returns False if the flush failed. '''
+	import hou
+
+	try:
+		hou.hscript("sopcache -c")
+	except hou.OperationFailed as e:
+		logger.warning("Could not flush the SOP cache: %s", e)
+		return False
+	return True
+
+
+def format_bytes(count):
+	''' Return a byte count as a short human readable string. '''
+	if count is None:
+		return "n/a"
+	for unit in ("B", "KB", "MB", "GB"):
+		if abs(count) < 1024.0:
+			return f"{count:.1f} {unit}"
+		count /= 1024.0
+	return f"{count:.1f} TB"
@@ -0,0 +1,197 @@
+#utils/_metrics.py
+
+import os
+import math
+import tempfile
+import threading
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+STAGE_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)  # Seconds
+TOTAL_STAGE = "total"  # Stage label of the whole remesh, UV and export run
+
+
+def _labelText(names, values, extra=()):
+	pairs = list(zip(names, values)) + list(extra)
+	if not pairs:
+		return ""
+	escaped = (str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"') for _, value in pairs)
+	return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+
+def _number(value):
+	if value == math.inf:
+		return "+Inf"
+	return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+	''' A metric family: one value per combination of label values. '''
+	type = None
+
+	def __init__(self, name, help, labels=()):
+		self.name = name
+		self.help = help
+		self.labels = tuple(labels)
+		self.values = {}
+		self.lock = threading.Lock()
+		if not self.labels and self.type != "histogram":
+			self.values[()] = 0  # Report 0 rather than nothing until the first update
+
+	def _key(self, labels):
+		if set(labels) != set(self.labels):
+			raise ValueError(f"{self.name} takes labels {self.labels}, not {tuple(labels)}")
+		return tuple(str(labels[name]) for name in self.labels)
+
+	def render(self):
+		lines = [f"# TYPE {self.name} {self.type}", f"# HELP {self.name} {self.help}"]
+		with self.lock:
+			for key, value in sorted(self.values.items()):
+				lines.extend(self._samples(key, value))
+		return lines
+
+
+class Counter(_Metric):
+	''' A count that only goes up. '''
+	type = "counter"
+
+	def inc(self, amount=1, **labels):
+		key = self._key(labels)
+		with self.lock:
+			self.values[key] = self.values.get(key, 0) + amount
+
+	def _samples(self, key, value):
+		return [f"{self.name}_total{_labelText(self.labels, key)} {_number(value)}"]
+
+
+class Gauge(_Metric):
+	''' A value that is set to whatever it currently is. '''
+	type = "gauge"
+
+	def set(self, value, **labels):
+		key = self._key(labels)
+		with self.lock:
+			self.values[key] = value
+
+	def _samples(self, key, value):
+		return [f"{self.name}{_labelText(self.labels, key)} {_number(value)}"]
+
+
+class Histogram(_Metric):
+	''' Observations counted into cumulative buckets, with their count and sum. '''
+	type = "histogram"
+
+	def __init__(self, name, help, labels=(), buckets=STAGE_BUCKETS):
+		super().__init__(name, help, labels)
+		self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+	def observe(self, value, **labels):
+		key = self._key(labels)
+		with self.lock:
+			counts, total = self.values.get(key) or ([0] * len(self.buckets), 0.0)
+			for index, bound in enumerate(self.buckets):
+				if value <= bound:
+					counts[index] += 1
+			self.values[key] = (counts, total + value)
+
+	def _samples(self, key, value):
+		counts, total = value
+		samples = [f"{self.name}_bucket{_labelText(self.labels, key, [('le', _number(bound))])} {count}" for bound, count in zip(self.buckets, counts)]
+		samples.append(f"{self.name}_count{_labelText(self.labels, key)} {counts[-1]}")
+		samples.append(f"{self.name}_sum{_labelText(self.labels, key)} {_number(float(total))}")
+		return samples
+
+
+class MetricsRegistry:
+	''' The metric families of this process, rendered as OpenMetrics text. '''
+	def __init__(self):
+		self.metrics = {}
+		self.lock = threading.Lock()
+
+	def _register(self, cls, name, *args, **kwargs):
+		with self.lock:
+			if name not in self.metrics:
+				self.metrics[name] = cls(name, *args, **kwargs)
+			return self.metrics[name]
+
+	def counter(self, name, help, labels=()):
+		return self._register(Counter, name, help, labels)
+
+	def gauge(self, name, help, labels=()):
+		return self._register(Gauge, name, help, labels)
+
+	def histogram(self, name, help, labels=(), buckets=STAGE_BUCKETS):
+		return self._register(Histogram, name, help, labels, buckets)
+
+	def render(self):
+		lines = []
+		for metric in list(self.metrics.values()):
+			lines.extend(metric.render())
+		lines.append("# EOF")
+		return "\n".join(lines) + "\n"
+
+	def write_textfile(self, path):
+		''' Write the metrics to path atomically, so a collector never reads half a file. '''
+		folder = os.path.dirname(os.path.abspath(path))
+		os.makedirs(folder, exist_ok=True)
+		fd, tempPath = tempfile.mkstemp(dir=folder, prefix=".metrics_", suffix=".tmp")
+		try:
+			with os.fdopen(fd, "w") as f:
+				f.write(self.render())
+			os.replace(tempPath, path)
+		except BaseException:
+			os.remove(tempPath)
+			raise
+		return path
+
+	def serve(self, port, host="127.0.0.1"):
+		''' Serve the metrics over HTTP from a daemon thread; returns the server (call shutdown() to stop). '''
+		from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer  # Only daemons and batches that serve need it
+
+		registry = self
+
+		class _Handler(BaseHTTPRequestHandler):
+			def do_GET(self):
+				body = registry.render().encode("utf-8")
+				self.send_response(200)
+				self.send_header("Content-Type", CONTENT_TYPE)
+				self.send_header("Content-Length", str(len(body)))
+				self.end_headers()
+				self.wfile.write(body)
+
+			def log_message(self, format, *args):
+				pass  # Scrapes every few seconds would flood the tool log
+
+		server = ThreadingHTTPServer((host, port), _Handler)
+		threading.Thread(target=server.serve_forever, name="MetricsServer", daemon=True).start()
+		return server
+
+
+metrics = MetricsRegistry()
+
+ASSETS_PROCESSED = metrics.counter("uv_tool_assets_processed", "Assets remeshed, unwrapped and exported.")
+ASSETS_FAILED = metrics.counter("uv_tool_assets_failed", "Assets that failed in any stage.")
+STAGE_SECONDS = metrics.histogram("uv_tool_stage_seconds", "Cook time of each pipeline stage in seconds.", ("stage",))
+QUEUE_DEPTH = metrics.gauge("uv_tool_queue_depth", "Assets waiting to be processed.")
+WORKER_RSS = metrics.gauge("uv_tool_worker_rss_bytes", "Resident memory of the worker in each pool slot after its last asset.", ("worker",))
+CACHE_HITS = metrics.counter("uv_tool_cache_hits", "Result cache lookups that found a cooked entry.", ("cache",))
+CACHE_MISSES = metrics.counter("uv_tool_cache_misses", "Result cache lookups that had to cook.", ("cache",))
+
+
+def observe_result(result, stages=True):
+	''' Count one asset result from the batch runner, manifest or daemon.
+	Pass stages=False where the stages were cooked in this process, as the controller has observed them already. '''
+	if result["status"] == "ok":
+		ASSETS_PROCESSED.inc()
+	else:
+		ASSETS_FAILED.inc()
+	if stages:
+		for stage, seconds in (result.get("stages") or {}).items():
+			if seconds is not None:
+				STAGE_SECONDS.observe(seconds, stage=stage)
+		if result["status"] == "ok":
+			STAGE_SECONDS.observe(result["elapsed"], stage=TOTAL_STAGE)
+	rss = (result.get("memory") or {}).get("rssAfter")
+	if rss and result.get("slot") is not None:
+		WORKER_RSS.set(rss, worker=result["slot"])  # By slot, so replaced workers do not pile up series
+	for cache, hit in (result.get("cache") or {}).items():
+		(CACHE_HITS if hit else CACHE_MISSES).inc(cache=cache)